@@ -1,15 +1,246 @@
 #!/usr/bin/env python3
 
-import mysql.connector
-from mysql.connector import Error
+import time
+STARTUP_START = time.perf_counter()
+
+import os
 import sys
-from typing import Optional, Dict, List, Any
+import csv
+import gzip
+import json
+import ast
+import argparse
+import threading
+import heapq
+import itertools
+from decimal import Decimal
+from datetime import datetime, timedelta
+from contextlib import contextmanager
+import configparser
+from typing import Optional, Dict, List, Any, Iterable
 import re
+from array import array
+
+# mysql.connector is imported on first use (see load_mysql_connector) to keep startup fast
+mysql = None
+
+
+class Error(Exception):
+    """Stand-in for mysql.connector.Error until the connector is loaded"""
+
+
+def load_mysql_connector():
+    """Import mysql.connector and rebind the module-level Error to its exception class"""
+    global mysql, Error
+    if mysql is None:
+        import mysql.connector
+        Error = mysql.connector.Error
+    return mysql.connector
+
+
+class SessionStepFailed(Exception):
+    """An insert-session step failed with no skip decision yet; carries (step, error) out of the transaction"""
+
+
+def plan_samples(**samples):
+    """Attach representative values for the f-string/format fields in a method's SQL, which --plan-snapshot substitutes.
+    
+    A tuple gives one value per occurrence of the field in the method, in source order.
+    """
+    def attach(method):
+        method.plan_samples = samples
+        return method
+    return attach
+
+
+def json_default(value):
+    """JSON encoding for result values: Decimals become floats, TIME/DATETIME values their string form"""
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+class ServiceCursor:
+    """Dictionary-cursor stand-in that runs read-only queries through a --serve query service"""
+
+    def __init__(self, connection: 'ServiceConnection'):
+        self.connection = connection
+        self.rows: List[Dict] = []
+        self.position = 0
+        self.rowcount = -1
+        self.description = None
+
+    def execute(self, query: str, params=None):
+        # Session settings are replayed by the service on whichever pooled connection runs the next query
+        match = re.match(r'\s*SET\s+SESSION\s+(\w+)\s*=\s*(\d+)\s*$', query, re.IGNORECASE)
+        if match:
+            self.connection.session[match.group(1).lower()] = int(match.group(2))
+            return
+        response = self.connection.request('/query', {'sql': query, 'params': list(params or ()), 'session': self.connection.session})
+        self.rows = response['rows']
+        self.position = 0
+        self.rowcount = len(self.rows)
+        self.description = [(column,) for column in response['columns']]
+
+    def fetchall(self) -> List[Dict]:
+        rows = self.rows[self.position:]
+        self.position = len(self.rows)
+        return rows
+
+    def fetchmany(self, size: int = 1) -> List[Dict]:
+        rows = self.rows[self.position:self.position + size]
+        self.position += len(rows)
+        return rows
+
+    def fetchone(self) -> Optional[Dict]:
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+
+    def close(self):
+        pass
+
+
+class OperationCursor:
+    """Cursor wrapper used while a menu operation runs: tracks in-flight statements and counts statement timeouts"""
+
+    def __init__(self, cursor, cli: 'DatabaseCLI'):
+        self.cursor = cursor
+        self.cli = cli
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+    def __iter__(self):
+        return iter(self.cursor)
+
+    # query_in_flight stays set if Ctrl-C interrupts the call, so the operation knows to kill the statement
+    def execute(self, query, params=None, **kwargs):
+        self.cli.query_in_flight = True
+        try:
+            result = self.cursor.execute(query, params, **kwargs)
+        except Error as e:
+            self.cli.query_in_flight = False
+            if self.cli.classify_error(e) == 'timeout':
+                self.cli.note_query_timeout()
+            raise
+        self.cli.query_in_flight = False
+        return result
+
+    def executemany(self, query, seq_params, **kwargs):
+        self.cli.query_in_flight = True
+        try:
+            result = self.cursor.executemany(query, seq_params, **kwargs)
+        except Error:
+            self.cli.query_in_flight = False
+            raise
+        self.cli.query_in_flight = False
+        return result
+
+
+class ServiceConnection:
+    """Thin-client connection to a --serve query service; reads only, nothing to commit"""
+
+    def __init__(self, url: str):
+        self.url = url.rstrip('/')
+        self.session: Dict[str, int] = {}
+
+    def request(self, path: str, payload: Dict) -> Dict:
+        import urllib.request
+        import urllib.error
+        request = urllib.request.Request(self.url + path, data=json.dumps(payload, default=json_default).encode(),
+                                         headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=120) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read())['error']
+            except (ValueError, KeyError):
+                message = str(e)
+            raise Error(f"query service: {message}")
+        except (urllib.error.URLError, OSError) as e:
+            raise Error(f"query service unreachable at {self.url}: {e}")
+
+    def cursor(self, dictionary: bool = True):
+        return ServiceCursor(self)
+
+    def is_connected(self) -> bool:
+        return True
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
 
 class DatabaseCLI:
     def __init__(self):
-        self.connection: Optional[mysql.connector.MySQLConnection] = None
+        self.connection: Optional['mysql.connector.MySQLConnection'] = None
         self.cursor = None
+        self.connection_settings: Dict[str, str] = {}
+        self.config_path = os.path.expanduser('~/.mini_world_db.cnf')
+        self.connect_thread: Optional[threading.Thread] = None
+        self.connect_result: Dict[str, Any] = {}
+        self.startup_profile: Optional[Dict[str, float]] = None
+        
+        # Scatter-gather: shard name -> (connection, cursor), and shards still running a timed-out query
+        self.shard_connections: Dict[str, tuple] = {}
+        self.busy_shards = set()
+        self.scatter_gather_limit: Optional[int] = None
+        
+        # Thin-client mode: read queries go to a --serve query service instead of MySQL
+        self.service_url: Optional[str] = None
+        
+        # Precomputed analysis reports (--precompute) and whether to bypass them (--fresh)
+        self.report_store_dir = '~/.mini_world_db_reports'
+        self.fresh_reports = False
+        
+        # Event tables partitioned by Event_Time (their foreign keys are enforced by schema triggers) and the
+        # --since/--until window applied to the combat reports
+        self.partitioned_tables = ('SUSPIOUS_ACTIVITIES', 'COMBAT_EVENT')
+        self.default_columns = {'SUSPIOUS_ACTIVITIES': ['Event_Time'], 'COMBAT_EVENT': ['Event_Time']}
+        self.report_since: Optional[datetime] = None
+        self.report_until: Optional[datetime] = None
+        
+        # Seconds ROW_CHANGES entries are kept (--change-log-retention); watch refreshes and --precompute passes prune older ones
+        self.row_change_retention = 86400.0
+        
+        # Species fetched per page by the recipe report
+        self.recipe_page_size = 200
+        
+        # Per-operation instrumentation: counters/timings, optional tracemalloc profiling and JSON-lines metrics output
+        self.op_stats: Dict[str, Dict[str, Any]] = {}
+        self.current_operation: Optional[str] = None
+        self.operation_counters: Dict[str, float] = {}
+        
+        # Retry policy for deadlocks and lock wait timeouts in write transactions
+        self.retry_max_attempts = 5
+        self.retry_base_delay = 0.05
+        self.retry_max_delay = 1.0
+        self.retry_budget = 3.0
+        
+        # Statement time limits (MAX_EXECUTION_TIME) per operation in seconds, 0 for none (the default); --query-timeout
+        # overrides the [timeouts] config section. Ctrl-C kills the running statement from a side connection.
+        self.default_query_timeout = 0.0
+        self.query_timeouts: Dict[str, float] = {}
+        self.query_timeout_override: Optional[float] = None
+        self.session_timeouts: Dict[int, int] = {}
+        self.max_execution_time_supported = True
+        self.query_in_flight = False
+        self.memprofile = False
+        self.metrics_file: Optional[str] = None
+        
+        # Read/write splitting: replica pool, round-robin position and read-your-writes state
+        self.replicas: List[Dict] = []
+        self.next_replica = 0
+        self.last_write_at: Optional[float] = None
+        self.last_write_gtid: Optional[str] = None
+        self.read_your_writes_window = 5.0
+        self.max_replica_lag = 10.0
         
         self.tables = [
             'INTRUDERS', 'MODERATORS', 'FOODIMALS_SPECIES', 'INDIVIDUAL_FOODIMAL_CREATURES',
@@ -29,8 +260,8 @@ class DatabaseCLI:
             'INVENTIONS': ['Item_Owner', 'Item_Name'],
             'LIVECORP_CELLS': ['Cell_Id', 'Colony_Id', 'Type'],
             'WEAKNESS': ['Species_Id', 'Item_Inventor_Id', 'Item_Name'],
-            'SUSPIOUS_ACTIVITIES': ['Intruder_Id', 'Creature_Id', 'Colony_Id', 'Cell_Id'],
-            'COMBAT_EVENT': ['Intruder_Id', 'Creature_Id', 'Item_Owner_Id', 'Region_Id', 'Item_Name'],
+            'SUSPIOUS_ACTIVITIES': ['Intruder_Id', 'Creature_Id', 'Colony_Id', 'Cell_Id', 'Event_Time'],
+            'COMBAT_EVENT': ['Intruder_Id', 'Creature_Id', 'Item_Owner_Id', 'Region_Id', 'Item_Name', 'Event_Time'],
             'CREATES': ['Moderator_Id', 'Species_Id', 'Creature_Id'],
             'DESCRIPTIONS': ['Description', 'Item_Owner_Id', 'Item_Name'],
             'INVENTOR': ['Name', 'Item_Owner_Id', 'Item_Name'],
@@ -48,6 +279,26 @@ class DatabaseCLI:
             'LIVECORP_CELLS': ['Cell_Id']
         }
         
+        # Primary keys from schema.sql (CREATES has none)
+        self.primary_keys = {
+            'INTRUDERS': ('User_Id',),
+            'MODERATORS': ('Moderator_Id',),
+            'FOODIMALS_SPECIES': ('Species_Id',),
+            'INDIVIDUAL_FOODIMAL_CREATURES': ('Creature_Id',),
+            'ISLAND_REGIONS': ('Region_Id',),
+            'LIVECORP_COLONY': ('Colony_Id',),
+            'POPULATORY_SPECIES': ('Species_Id',),
+            'INVENTIONS': ('Item_Owner', 'Item_Name'),
+            'LIVECORP_CELLS': ('Cell_Id', 'Colony_Id'),
+            'WEAKNESS': ('Species_Id', 'Item_Inventor_Id', 'Item_Name'),
+            'SUSPIOUS_ACTIVITIES': ('Intruder_Id', 'Creature_Id', 'Colony_Id', 'Cell_Id', 'Event_Time'),
+            'COMBAT_EVENT': ('Intruder_Id', 'Creature_Id', 'Item_Owner_Id', 'Item_Name', 'Event_Time'),
+            'DESCRIPTIONS': ('Item_Owner_Id', 'Item_Name', 'Description'),
+            'INVENTOR': ('Item_Owner_Id', 'Item_Name', 'Name'),
+            'ANIMAL': ('Species_Id', 'Name'),
+            'FOOD_ITEM': ('Species_Id', 'Name')
+        }
+        
         # Foreign key relationships: column_name -> (referenced_table, id_column, display_column)
         self.foreign_keys = {
             'Location_Id': ('ISLAND_REGIONS', 'Region_Id', 'Region_Name'),
@@ -63,27 +314,185 @@ class DatabaseCLI:
             'Item_Inventor_Id': ('INVENTIONS', 'Item_Owner', 'Item_Name'),
             'Item_Owner': ('INVENTIONS', 'Item_Owner', 'Item_Name')
         }
+        
+        # Table-level foreign keys from schema.sql: table -> [(columns, referenced_table, referenced_columns)]
+        self.table_foreign_keys = {
+            'INTRUDERS': [(('Location_Id',), 'ISLAND_REGIONS', ('Region_Id',))],
+            'INDIVIDUAL_FOODIMAL_CREATURES': [
+                (('Species_Id',), 'FOODIMALS_SPECIES', ('Species_Id',)),
+                (('Populatory_Species_Id',), 'POPULATORY_SPECIES', ('Species_Id',)),
+                (('Location_Id',), 'ISLAND_REGIONS', ('Region_Id',))
+            ],
+            'LIVECORP_COLONY': [(('Region_Id',), 'ISLAND_REGIONS', ('Region_Id',))],
+            'POPULATORY_SPECIES': [(('Species_Id',), 'FOODIMALS_SPECIES', ('Species_Id',))],
+            'INVENTIONS': [(('Item_Owner',), 'INTRUDERS', ('User_Id',))],
+            'LIVECORP_CELLS': [(('Colony_Id',), 'LIVECORP_COLONY', ('Colony_Id',))],
+            'WEAKNESS': [
+                (('Species_Id',), 'FOODIMALS_SPECIES', ('Species_Id',)),
+                (('Item_Inventor_Id', 'Item_Name'), 'INVENTIONS', ('Item_Owner', 'Item_Name'))
+            ],
+            'SUSPIOUS_ACTIVITIES': [
+                (('Intruder_Id',), 'INTRUDERS', ('User_Id',)),
+                (('Creature_Id',), 'INDIVIDUAL_FOODIMAL_CREATURES', ('Creature_Id',)),
+                (('Cell_Id', 'Colony_Id'), 'LIVECORP_CELLS', ('Cell_Id', 'Colony_Id'))
+            ],
+            'COMBAT_EVENT': [
+                (('Intruder_Id',), 'INTRUDERS', ('User_Id',)),
+                (('Creature_Id',), 'INDIVIDUAL_FOODIMAL_CREATURES', ('Creature_Id',)),
+                (('Item_Owner_Id', 'Item_Name'), 'INVENTIONS', ('Item_Owner', 'Item_Name')),
+                (('Region_Id',), 'ISLAND_REGIONS', ('Region_Id',))
+            ],
+            'CREATES': [
+                (('Creature_Id',), 'INDIVIDUAL_FOODIMAL_CREATURES', ('Creature_Id',)),
+                (('Moderator_Id',), 'MODERATORS', ('Moderator_Id',)),
+                (('Species_Id',), 'FOODIMALS_SPECIES', ('Species_Id',))
+            ],
+            'DESCRIPTIONS': [(('Item_Owner_Id', 'Item_Name'), 'INVENTIONS', ('Item_Owner', 'Item_Name'))],
+            'INVENTOR': [(('Item_Owner_Id', 'Item_Name'), 'INVENTIONS', ('Item_Owner', 'Item_Name'))],
+            'ANIMAL': [(('Species_Id',), 'FOODIMALS_SPECIES', ('Species_Id',))],
+            'FOOD_ITEM': [(('Species_Id',), 'FOODIMALS_SPECIES', ('Species_Id',))]
+        }
+        
+        # CHECK constraints from schema.sql: table -> {column: ('in', allowed) | ('range', low, high)}
+        self.check_constraints = {
+            'INTRUDERS': {
+                'Gender': ('in', ('M', 'F', 'O')),
+                'Height': ('range', 1, 300),
+                'Weight': ('range', 1, None),
+                'Intelligence': ('range', 50, 170)
+            },
+            'LIVECORP_CELLS': {
+                'Type': ('in', ('MANUFACTURING', 'RESEARCH', 'RECREATION', 'HOUSING'))
+            }
+        }
+        
+        # Columns that may be NULL (everything else is NOT NULL in schema.sql)
+        self.nullable_columns = {
+            'INDIVIDUAL_FOODIMAL_CREATURES': ['Species_Id', 'Populatory_Species_Id'],
+            'CREATES': ['Creature_Id']
+        }
+        
+        # Cached key sets of referenced tables used for client-side FK validation
+        self.key_cache = {}
+        
+        # Versioned id -> name / name -> ids dictionaries for retrieval by integer key; a table's version is bumped
+        # whenever this session writes to it, and dictionaries are also reloaded after name_dictionary_ttl seconds
+        self.name_dictionaries: Dict[str, Dict[str, Any]] = {}
+        self.table_versions: Dict[str, int] = {}
+        self.name_dictionary_ttl = 300.0
+        
+        # Intruder attribute arrays loaded once for what-if threat modeling
+        self.threat_model_data = None
+        
+        # Region x species count matrix, reused until one of its tables is written to
+        self.crosstab_cache = None
+        
+        # Stored-procedure backend from procedures.sql: None until looked up; --no-procedures forces inline SQL
+        self.procedures: Dict[tuple, set] = {}
+        self.use_procedures = True
+        
+        # Combat event cube with ROLLUP subtotals, topped up with newer events on each visit
+        self.combat_cube_cache: Optional[Dict] = None
+        
+        # Region/species/invention/intruder adjacency arrays for multi-hop queries
+        self.relationship_graph = None
+        
+        # Features available to threat formulas: name -> description
+        self.threat_features = {
+            'int': 'Intelligence',
+            'int2': 'Intelligence squared',
+            'height': 'Height (cm)',
+            'weight': 'Weight (kg)',
+            'wph': 'Weight / Height',
+            'region': 'Threat_To_Intruders of the intruder\'s region'
+        }
+
+    def prompt_connection_settings(self) -> Dict[str, str]:
+        """Prompt user for database connection details"""
+        host = input("Enter host (default: localhost): ").strip() or "localhost"
+        user = input("Enter username: ").strip()
+        password = input("Enter password: ").strip()
+        database = input("Enter database name (default: mini_world_db): ").strip() or "mini_world_db"
+        return {'host': host, 'user': user, 'password': password, 'database': database}
+
+    def load_connection_config(self) -> Optional[Dict[str, str]]:
+        """Read connection settings from MINI_WORLD_DB_* env vars or the [client] section of the config file"""
+        settings = {'host': 'localhost', 'user': '', 'password': '', 'database': 'mini_world_db'}
+        
+        config = configparser.ConfigParser()
+        if os.path.exists(self.config_path):
+            try:
+                config.read(self.config_path)
+            except configparser.Error as e:
+                print(f"✗ Could not read {self.config_path}: {e}")
+        if config.has_section('client'):
+            for key in settings:
+                settings[key] = config.get('client', key, fallback=settings[key])
+        
+        env_names = {'host': 'MINI_WORLD_DB_HOST', 'user': 'MINI_WORLD_DB_USER',
+                     'password': 'MINI_WORLD_DB_PASSWORD', 'database': 'MINI_WORLD_DB_NAME'}
+        for key, env_name in env_names.items():
+            if os.environ.get(env_name) is not None:
+                settings[key] = os.environ[env_name]
+        
+        # Without a user name there is nothing to connect with, so fall back to prompting
+        return settings if settings['user'] else None
+
+    def open_connection(self, settings: Dict[str, str]):
+        """Open a connection and a dictionary cursor with the given settings"""
+        connector = load_mysql_connector()
+        connection = connector.connect(**settings)
+        return connection, connection.cursor(dictionary=True)
+
+    def start_background_connect(self, settings: Dict[str, str]):
+        """Import the connector and connect on a background thread while the menu renders"""
+        self.connection_settings = settings
+        
+        def connect():
+            start = time.perf_counter()
+            try:
+                self.connect_result['connection'], self.connect_result['cursor'] = self.open_connection(settings)
+            except Exception as e:
+                self.connect_result['error'] = e
+            self.connect_result['ready_at'] = time.perf_counter() - STARTUP_START
+            self.connect_result['connect_time'] = time.perf_counter() - start
+        
+        self.connect_thread = threading.Thread(target=connect, name="db-connect", daemon=True)
+        self.connect_thread.start()
+
+    def ensure_connected(self) -> bool:
+        """Wait for the background connection if one is pending; prompt for details if it failed"""
+        if self.connection is not None:
+            return True
+        
+        if self.connect_thread is not None:
+            if self.connect_thread.is_alive():
+                print("\n… Waiting for database connection...")
+            self.connect_thread.join()
+            self.connect_thread = None
+            if 'error' not in self.connect_result:
+                self.connection = self.connect_result['connection']
+                self.cursor = self.connect_result['cursor']
+                print(f"\n✓ Connected to {self.connection_settings['database']} on {self.connection_settings['host']}")
+                return True
+            print(f"\n✗ Error connecting with configured settings: {self.connect_result['error']}")
+        
+        return self.connect_to_database(use_config=False)
 
-    def connect_to_database(self):
+    def connect_to_database(self, use_config: bool = True):
         """Prompt user for database connection details and establish connection"""
         print("\n" + "="*60)
         print("DATABASE CONNECTION")
         print("="*60)
         
         try:
-            host = input("Enter host (default: localhost): ").strip() or "localhost"
-            user = input("Enter username: ").strip()
-            password = input("Enter password: ").strip()
-            database = input("Enter database name (default: mini_world_db): ").strip() or "mini_world_db"
+            settings = self.load_connection_config() if use_config else None
+            if settings:
+                print(f"Using configured connection {settings['user']}@{settings['host']}/{settings['database']}")
+            self.connection_settings = settings or self.prompt_connection_settings()
             
-            self.connection = mysql.connector.connect(
-                host=host,
-                user=user,
-                password=password,
-                database=database
-            )
+            self.connection, self.cursor = self.open_connection(self.connection_settings)
             
-            self.cursor = self.connection.cursor(dictionary=True)
             print("\n✓ Successfully connected to the database!")
             return True
             
@@ -91,6 +500,28 @@ class DatabaseCLI:
             print(f"\n✗ Error connecting to database: {e}")
             return False
 
+    def report_startup_profile(self):
+        """Print how long startup took up to the first menu"""
+        profile = self.startup_profile
+        first_menu = profile['first_menu'] * 1000
+        print("\n" + "-"*60)
+        print("STARTUP PROFILE")
+        print("-"*60)
+        print(f"Module imports:        {profile['imports'] * 1000:8.1f} ms")
+        print(f"Config load:           {profile['config'] * 1000:8.1f} ms")
+        print(f"First menu rendered:   {first_menu:8.1f} ms  ({'within' if first_menu < 100 else 'over'} 100 ms target)")
+        if self.connect_thread is not None and self.connect_thread.is_alive():
+            print("Background connect:    still in progress")
+        elif self.connect_result:
+            if 'error' in self.connect_result:
+                print(f"Background connect:    failed ({self.connect_result['error']})")
+            else:
+                print(f"Background connect:    {self.connect_result['connect_time'] * 1000:8.1f} ms "
+                      f"(ready at {self.connect_result['ready_at'] * 1000:.1f} ms)")
+        else:
+            print("Background connect:    not used (no config file or MINI_WORLD_DB_USER)")
+        print("-"*60)
+
     def display_menu(self):
         """Display main menu"""
         print("\n" + "="*60)
@@ -102,7 +533,9 @@ class DatabaseCLI:
         print("4. View tables")
         print("5. Retrieval Operations")
         print("6. Analysis Reports")
-        print("7. Exit")
+        print("7. Insert session (group commit)")
+        print("8. Scatter-Gather Reports (All Shards)")
+        print("9. Exit")
         print("="*60)
 
     def display_analysis_reports_menu(self):
@@ -113,9 +546,336 @@ class DatabaseCLI:
         print("1. Intruder Threat Assessment by Region")
         print("2. Foodimal Defensive Readiness Report")
         print("3. Combat Effectiveness Analysis")
-        print("4. Back to Main Menu")
+        print("4. Populatory Species Population Projection")
+        print("5. What-If Threat Modeling")
+        print("6. Region x Species Cross-Tab")
+        print("7. Watch a Report (Live Refresh)")
+        print("8. Region / Invention Activity by Time Window")
+        print("9. Combat Cube (Region x Invention x Intruder x Species)")
+        print("10. Back to Main Menu")
         print("="*60)
 
+    # MySQL error numbers by how a write should react to them
+    RETRYABLE_ERRORS = {1213: 'Deadlock', 1205: 'Lock wait timeout'}
+    CONNECTION_ERRORS = {2006, 2013, 2055}
+    CONSTRAINT_ERRORS = {1048, 1062, 1216, 1217, 1451, 1452, 3819}
+    TIMEOUT_ERRORS = {3024}
+    
+    # Name dictionaries: kind -> (table, id column, name column); colonies have no name, so map to their region
+    NAME_DICTIONARIES = {
+        'species': ('FOODIMALS_SPECIES', 'Species_Id', 'Species_Name'),
+        'regions': ('ISLAND_REGIONS', 'Region_Id', 'Region_Name'),
+        'colonies': ('LIVECORP_COLONY', 'Colony_Id', 'Region_Id'),
+    }
+
+    def classify_error(self, error: Exception) -> str:
+        """Classify a MySQL error as 'retryable', 'timeout', 'connection', 'constraint' or 'other'"""
+        errno = getattr(error, 'errno', None)
+        if errno in self.RETRYABLE_ERRORS:
+            return 'retryable'
+        if errno in self.TIMEOUT_ERRORS:
+            return 'timeout'
+        if errno in self.CONNECTION_ERRORS:
+            return 'connection'
+        if errno in self.CONSTRAINT_ERRORS:
+            return 'constraint'
+        return 'other'
+
+    def count_operation_event(self, key: str, amount: float = 1):
+        """Add to a counter of the running menu operation, for the instrumentation store and metrics"""
+        self.operation_counters[key] = self.operation_counters.get(key, 0) + amount
+        self.record_op_stat(self.current_operation or 'unknown', key, amount)
+
+    def operation_timeout(self, name: str) -> float:
+        """Statement time limit in seconds for an operation (0 means unlimited)"""
+        if self.query_timeout_override is not None:
+            return self.query_timeout_override
+        return self.query_timeouts.get(name, self.default_query_timeout)
+
+    def load_timeout_config(self):
+        """Read the [timeouts] section: a default and per-operation statement time limits in seconds"""
+        config = configparser.ConfigParser()
+        try:
+            config.read(self.config_path)
+        except configparser.Error as e:
+            print(f"✗ Could not read {self.config_path}: {e}")
+            return
+        if not config.has_section('timeouts'):
+            return
+        for key, value in config.items('timeouts'):
+            try:
+                seconds = float(value)
+            except ValueError:
+                print(f"✗ Invalid [timeouts] {key} = {value} in {self.config_path}")
+                continue
+            if key == 'default':
+                self.default_query_timeout = seconds
+            else:
+                self.query_timeouts[key] = seconds
+
+    def apply_query_timeout(self, name: str):
+        """Set MAX_EXECUTION_TIME on the current connection for the operation about to run"""
+        if self.connection is None or not self.max_execution_time_supported:
+            return
+        limit_ms = int(self.operation_timeout(name) * 1000)
+        key = id(self.connection)
+        # Without a configured limit the session keeps the server's own max_execution_time
+        if self.session_timeouts.get(key, 0) == limit_ms:
+            return
+        try:
+            self.cursor.execute(f"SET SESSION max_execution_time = {limit_ms}")
+            self.session_timeouts[key] = limit_ms
+        except Error as e:
+            # e.g. MariaDB, which calls it max_statement_time
+            print(f"\n⚠ Statement time limits are not available on this server: {e}")
+            self.max_execution_time_supported = False
+
+    def note_query_timeout(self):
+        """Count a statement stopped by MAX_EXECUTION_TIME and say how to raise the limit"""
+        name = self.current_operation or 'unknown'
+        self.count_operation_event('timeouts')
+        print(f"\n⚠ Query stopped by the {self.operation_timeout(name):g}s time limit of {name}. "
+              f"Raise it with '{name} = SECONDS' under [timeouts] in {self.config_path} or with --query-timeout.")
+
+    def kill_running_query(self, connection_id: int, settings: Dict[str, str]):
+        """Stop the statement running on a connection with KILL QUERY from a side connection"""
+        side_connection, side_cursor = self.open_connection(settings)
+        try:
+            side_cursor.execute(f"KILL QUERY {int(connection_id)}")
+        finally:
+            side_connection.close()
+
+    def cancel_operation(self):
+        """Handle Ctrl-C during an operation: kill its running statement from a side connection and reset the session"""
+        self.count_operation_event('cancellations')
+        connection = self.connection
+        if connection is None or isinstance(connection, ServiceConnection):
+            print("\n\n✗ Operation cancelled")
+            return
+        
+        if not self.query_in_flight and not getattr(connection, 'unread_result', False):
+            # Interrupted at a prompt: just discard anything uncommitted
+            try:
+                connection.rollback()
+            except Error:
+                pass
+            print("\n\n✗ Operation cancelled")
+            return
+        
+        connection_id = connection.connection_id
+        try:
+            self.kill_running_query(connection_id, self.connection_settings)
+            print(f"\n\n✗ Operation cancelled; killed the running query on connection {connection_id}")
+        except Error as e:
+            print(f"\n\n✗ Operation cancelled, but the query could not be killed: {e}")
+        
+        # The interrupted connection may be part-way through a result, so start a fresh session
+        self.session_timeouts.pop(id(connection), None)
+        try:
+            connection.reconnect()
+            self.cursor = connection.cursor(dictionary=True)
+        except Error as e:
+            print(f"✗ Reconnecting after the cancellation failed: {e}")
+
+    def call_operation(self, name: str, operation, args):
+        """Call an operation under its statement time limit; Ctrl-C cancels it and returns to the menu"""
+        self.apply_query_timeout(name)
+        if self.cursor is not None:
+            self.cursor = OperationCursor(self.cursor, self)
+        try:
+            return operation(*args)
+        except KeyboardInterrupt:
+            self.cancel_operation()
+            return None
+        finally:
+            self.query_in_flight = False
+            if isinstance(self.cursor, OperationCursor):
+                self.cursor = self.cursor.cursor
+
+    def run_transaction(self, work, on_rollback=None):
+        """Run work() and commit; deadlocks and lock wait timeouts roll back and re-run it with jittered backoff.
+        
+        work must only use values collected beforehand, so a retry repeats the same statements without
+        prompting again. Other errors, or running out of attempts or backoff budget, are re-raised.
+        """
+        import random
+        attempt = 0
+        backoff = 0.0
+        while True:
+            attempt += 1
+            try:
+                result = work()
+                self.connection.commit()
+                return result
+            except Error as e:
+                try:
+                    self.connection.rollback()
+                except Error:
+                    pass
+                if on_rollback:
+                    on_rollback()
+                if self.classify_error(e) != 'retryable':
+                    raise
+                
+                label = self.RETRYABLE_ERRORS[e.errno]
+                self.count_operation_event('deadlocks' if e.errno == 1213 else 'lock_wait_timeouts')
+                if attempt >= self.retry_max_attempts or backoff >= self.retry_budget:
+                    print(f"\n⚠ {label} persisted after {attempt} attempt(s) and {backoff*1000:.0f} ms of backoff; giving up.")
+                    raise
+                
+                # Full jitter: a random delay up to an exponentially growing cap, within the remaining budget
+                delay = min(random.uniform(0, min(self.retry_base_delay * 2 ** (attempt - 1), self.retry_max_delay)),
+                            self.retry_budget - backoff)
+                print(f"\n⚠ {label}; transaction rolled back, retrying in {delay*1000:.0f} ms (attempt {attempt + 1}/{self.retry_max_attempts})")
+                self.count_operation_event('retries')
+                self.count_operation_event('backoff_time', delay)
+                backoff += delay
+                time.sleep(delay)
+
+    def report_operation_stats(self):
+        """Print the per-operation instrumentation collected this session"""
+        if not self.op_stats:
+            return
+        print("\n" + "="*80)
+        print("SESSION OPERATION STATISTICS")
+        print("="*80)
+        print(f"{'Operation':<23}{'Calls':<6}{'Avg ms':<8}{'Retry':<6}{'Backoff ms':<11}{'Deadlk':<7}{'LockTO':<7}"
+              f"{'Tmout':<6}{'Cancel':<6}")
+        print("-"*80)
+        for name, stats in sorted(self.op_stats.items()):
+            calls = stats.get('calls', 0)
+            average = stats['total_time'] / calls * 1000 if calls else 0
+            print(f"{name[:22]:<23}{calls:<6}{average:<8.1f}{stats.get('retries', 0):<6}{stats.get('backoff_time', 0)*1000:<11.0f}"
+                  f"{stats.get('deadlocks', 0):<7}{stats.get('lock_wait_timeouts', 0):<7}{stats.get('timeouts', 0):<6}"
+                  f"{stats.get('cancellations', 0):<6}")
+        print("="*80)
+
+    def record_op_stat(self, name: str, key: str, amount: float = 1):
+        """Add to a per-operation counter (calls, time, retries, ...) in the instrumentation store"""
+        stats = self.op_stats.setdefault(name, {'calls': 0, 'total_time': 0.0})
+        stats[key] = stats.get(key, 0) + amount
+
+    def classify_allocation(self, traceback) -> str:
+        """Attribute an allocation to fetch buffers, row objects or report structures by its innermost connector frame"""
+        for frame in reversed(traceback):
+            filename = frame.filename.replace('\\', '/')
+            if '/mysql/connector/' not in filename:
+                continue
+            module = os.path.basename(filename)
+            if module.startswith('cursor') or module == 'conversion.py':
+                return 'row objects'
+            return 'fetch buffers'
+        return 'report structures'
+
+    def allocation_breakdown(self, snapshot, baseline) -> Dict[str, int]:
+        """Bytes allocated since baseline that are live in snapshot, per category"""
+        breakdown = {'fetch buffers': 0, 'row objects': 0, 'report structures': 0}
+        for stat in snapshot.compare_to(baseline, 'traceback'):
+            if stat.size_diff > 0:
+                breakdown[self.classify_allocation(stat.traceback)] += stat.size_diff
+        return breakdown
+
+    def run_operation(self, operation, *args):
+        """Run a menu operation, recording its timing (and memory with --memprofile) in the instrumentation store"""
+        name = operation.__name__
+        self.current_operation = name
+        self.operation_counters = {}
+        
+        if not self.memprofile:
+            start = time.perf_counter()
+            try:
+                return self.call_operation(name, operation, args)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.current_operation = None
+                self.record_op_stat(name, 'calls')
+                self.record_op_stat(name, 'total_time', elapsed)
+                self.write_metrics(dict(self.operation_counters, operation=name, time=elapsed))
+        
+        import tracemalloc
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, threading.__file__)]
+        baseline = tracemalloc.take_snapshot().filter_traces(filters)
+        base_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        profile = {'peak': 0, 'sampled_size': 0, 'breakdown': None, 'sites': None}
+        done = threading.Event()
+        
+        def capture():
+            # Break down current usage, then drop the snapshot so its own memory is not counted as the operation's
+            current, peak = tracemalloc.get_traced_memory()
+            profile['peak'] = max(profile['peak'], peak - base_size)
+            snapshot = tracemalloc.take_snapshot().filter_traces(filters)
+            profile['breakdown'] = self.allocation_breakdown(snapshot, baseline)
+            profile['sites'] = [(stat.size_diff, stat.traceback[0]) for stat in snapshot.compare_to(baseline, 'lineno')[:5]
+                                if stat.size_diff > 0]
+            profile['sampled_size'] = current - base_size
+            del snapshot
+            tracemalloc.reset_peak()
+        
+        def sample_peak():
+            # Re-capture whenever usage grows 10% past the last capture so the peak can be broken down
+            while not done.wait(0.01):
+                current = tracemalloc.get_traced_memory()[0] - base_size
+                if current > 1.1 * profile['sampled_size'] and current > 64 * 1024:
+                    capture()
+        
+        sampler = threading.Thread(target=sample_peak, name="memprofile", daemon=True)
+        sampler.start()
+        start = time.perf_counter()
+        try:
+            return self.call_operation(name, operation, args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.current_operation = None
+            done.set()
+            sampler.join()
+            current, peak = tracemalloc.get_traced_memory()
+            peak_bytes = max(profile['peak'], peak - base_size, 0)
+            retained_bytes = current - base_size
+            at_peak = profile['breakdown']
+            sites = profile['sites']
+            end_snapshot = tracemalloc.take_snapshot().filter_traces(filters)
+            retained = self.allocation_breakdown(end_snapshot, baseline)
+            if at_peak is None or retained_bytes >= profile['sampled_size']:
+                at_peak = retained
+                sites = [(stat.size_diff, stat.traceback[0]) for stat in end_snapshot.compare_to(baseline, 'lineno')[:5]
+                         if stat.size_diff > 0]
+            del end_snapshot
+            
+            self.record_op_stat(name, 'calls')
+            self.record_op_stat(name, 'total_time', elapsed)
+            stats = self.op_stats[name]
+            stats['peak_bytes'] = max(stats.get('peak_bytes', 0), peak_bytes)
+            stats['retained_bytes'] = retained_bytes
+            
+            print("\n" + "-"*80)
+            print(f"MEMORY PROFILE: {name} ({elapsed*1000:.1f} ms)")
+            print(f"  Peak: {peak_bytes/1024:,.1f} KiB    Retained: {retained_bytes/1024:,.1f} KiB")
+            print(f"  {'Category':<20} {'At Peak (KiB)':>15} {'Retained (KiB)':>15}")
+            for category in at_peak:
+                print(f"  {category:<20} {at_peak[category]/1024:>15,.1f} {retained[category]/1024:>15,.1f}")
+            print("  Top allocation sites at peak:")
+            for size, frame in sites:
+                print(f"    {size/1024:>10,.1f} KiB  {os.path.basename(frame.filename)}:{frame.lineno}")
+            if self.operation_counters.get('retries'):
+                print(f"  Retries: {self.operation_counters['retries']}    Backoff: {self.operation_counters['backoff_time']*1000:.0f} ms")
+            print("-"*80)
+            
+            self.write_metrics(dict(self.operation_counters, operation=name, time=elapsed, peak_bytes=peak_bytes,
+                                    retained_bytes=retained_bytes, peak_breakdown=at_peak,
+                                    retained_breakdown=retained))
+
+    def write_metrics(self, record: Dict):
+        """Append one JSON line to the --metrics-file benchmark results, if enabled"""
+        if not self.metrics_file:
+            return
+        record = dict(record, timestamp=time.time())
+        try:
+            with open(self.metrics_file, 'a') as metrics_file:
+                metrics_file.write(json.dumps(record) + '\n')
+        except OSError as e:
+            print(f"⚠ Could not write metrics to {self.metrics_file}: {e}")
+
     def display_retrieval_operations_menu(self):
         """Display retrieval operations submenu"""
         print("\n" + "="*60)
@@ -131,7 +891,8 @@ class DatabaseCLI:
         print("8. Identify High-Threat Intruders")
         print("9. Find Foodimals in a Specific Region")
         print("10. List Inventions Effective Against a Species")
-        print("11. Back to Main Menu")
+        print("11. Counter-Strategy Graph Queries")
+        print("12. Back to Main Menu")
         print("="*60)
 
     def display_tables(self):
@@ -157,6 +918,7 @@ class DatabaseCLI:
             print("✗ Please enter a valid number!")
             return None
 
+    @plan_samples(table='INTRUDERS')
     def get_table_data(self, table: str) -> List[Dict]:
         """Fetch all data from a table"""
         try:
@@ -166,6 +928,7 @@ class DatabaseCLI:
             print(f"✗ Error fetching data: {e}")
             return []
     
+    @plan_samples(id_col='Region_Id', display_col='Region_Name', ref_table='ISLAND_REGIONS')
     def show_reference_data(self, column_name: str):
         """Display reference data for foreign key columns"""
         if column_name not in self.foreign_keys:
@@ -226,18 +989,240 @@ class DatabaseCLI:
         print(f"\nTotal rows: {len(data)}")
         print("="*60)
 
-    def insert_data(self):
-        """Insert data into a table"""
-        table = self.select_table()
-        if not table:
-            return
+    def normalize_key_value(self, value) -> str:
+        """Normalize a key value the way MySQL compares it (case-insensitive, trailing spaces ignored)"""
+        return str(value).rstrip().casefold()
+
+    @plan_samples(column_list='Region_Id', ref_table='ISLAND_REGIONS', incremental_col='Region_Id')
+    def load_key_cache(self, ref_table: str, ref_cols: tuple) -> Dict:
+        """Load (or incrementally refresh) the cached key set of a referenced table"""
+        cache_key = (ref_table, ref_cols)
+        entry = self.key_cache.get(cache_key)
+        auto_cols = self.auto_increment_columns.get(ref_table, [])
+        # Tables keyed by their own AUTO_INCREMENT column can be refreshed by fetching only newer ids
+        incremental_col = ref_cols[0] if len(ref_cols) == 1 and ref_cols[0] in auto_cols else None
+        column_list = ', '.join(ref_cols)
         
-        print(f"\n{'='*60}")
-        print(f"INSERT DATA INTO {table}")
-        print("="*60)
+        if entry is None:
+            self.cursor.execute(f"SELECT {column_list} FROM {ref_table}")
+            rows = self.cursor.fetchall()
+            entry = {'keys': set(), 'high_water': None}
+            self.key_cache[cache_key] = entry
+        elif incremental_col:
+            if entry['high_water'] is None:
+                self.cursor.execute(f"SELECT {column_list} FROM {ref_table}")
+            else:
+                self.cursor.execute(f"SELECT {column_list} FROM {ref_table} WHERE {incremental_col} > %s", (entry['high_water'],))
+            rows = self.cursor.fetchall()
+        else:
+            return entry
+        
+        for row in rows:
+            entry['keys'].add(tuple(self.normalize_key_value(row[col]) for col in ref_cols))
+            if incremental_col and (entry['high_water'] is None or row[incremental_col] > entry['high_water']):
+                entry['high_water'] = row[incremental_col]
+        return entry
+
+    @plan_samples(column_list='Item_Owner, Item_Name', ref_table='INVENTIONS', condition='(Item_Owner = %s AND Item_Name = %s)')
+    def confirm_missing_keys(self, ref_table: str, ref_cols: tuple, missing: set) -> set:
+        """Refresh the cache for keys that were not found and return the ones that really do not exist"""
+        entry = self.load_key_cache(ref_table, ref_cols)
+        missing = {key for key in missing if key not in entry['keys']}
+        
+        if missing and not (len(ref_cols) == 1 and ref_cols[0] in self.auto_increment_columns.get(ref_table, [])):
+            # Non AUTO_INCREMENT keys cannot be fetched by high-water mark, so look up only the missing ones
+            key_list = list(missing)
+            condition = ' OR '.join(['(' + ' AND '.join(f"{col} = %s" for col in ref_cols) + ')'] * len(key_list))
+            params = [value for key in key_list for value in key]
+            column_list = ', '.join(ref_cols)
+            self.cursor.execute(f"SELECT {column_list} FROM {ref_table} WHERE {condition}", params)
+            for row in self.cursor.fetchall():
+                found = tuple(self.normalize_key_value(row[col]) for col in ref_cols)
+                entry['keys'].add(found)
+                missing.discard(found)
+        return missing
+
+    def dependent_tables(self, table: str) -> set:
+        """A table and every table that references it directly or transitively (ON DELETE/UPDATE CASCADE)"""
+        affected = {table}
+        changed = True
+        while changed:
+            changed = False
+            for child, fks in self.table_foreign_keys.items():
+                if child not in affected and any(ref_table in affected for _, ref_table, _ in fks):
+                    affected.add(child)
+                    changed = True
+        return affected
+
+    def invalidate_key_cache(self, table: str):
+        """Drop cached key sets for a table and every table that references it (ON DELETE/UPDATE CASCADE)"""
+        affected = self.dependent_tables(table)
+        for cache_key in list(self.key_cache):
+            if cache_key[0] in affected:
+                del self.key_cache[cache_key]
+
+    def invalidate_report_caches(self, table: str):
+        """Drop in-memory report data that was built from a table that has just been written to"""
+        if table in ('INTRUDERS', 'ISLAND_REGIONS'):
+            self.threat_model_data = None
+        if table in ('INDIVIDUAL_FOODIMAL_CREATURES', 'ISLAND_REGIONS', 'FOODIMALS_SPECIES', 'POPULATORY_SPECIES'):
+            self.crosstab_cache = None
+        if table in ('COMBAT_EVENT', 'INTRUDERS', 'INVENTIONS', 'INDIVIDUAL_FOODIMAL_CREATURES', 'ISLAND_REGIONS',
+                     'FOODIMALS_SPECIES', 'POPULATORY_SPECIES'):
+            # Edits and app-enforced cascade deletes can change past cells, which the incremental refresh never revisits
+            self.combat_cube_cache = None
+        self.table_versions[table] = self.table_versions.get(table, 0) + 1
+        if table == 'ISLAND_REGIONS':
+            # Region deletes and key updates cascade to colonies
+            self.table_versions['LIVECORP_COLONY'] = self.table_versions.get('LIVECORP_COLONY', 0) + 1
+
+    @plan_samples(table='FOODIMALS_SPECIES', id_column='Species_Id', name_column='Species_Name')
+    def name_dictionary(self, kind: str, refresh: bool = False) -> Dict[str, Any]:
+        """Load (or reuse) the id -> name and name -> ids dictionaries of a small lookup table"""
+        table, id_column, name_column = self.NAME_DICTIONARIES[kind]
+        version = self.table_versions.get(table, 0)
+        entry = self.name_dictionaries.get(kind)
+        if (refresh or entry is None or entry['version'] != version
+                or time.monotonic() - entry['loaded_at'] > self.name_dictionary_ttl):
+            self.cursor.execute(f"SELECT {id_column}, {name_column} FROM {table}")
+            by_id = {row[id_column]: row[name_column] for row in self.cursor.fetchall()}
+            by_name: Dict[str, List[int]] = {}
+            for row_id, name in by_id.items():
+                by_name.setdefault(self.normalize_key_value(name), []).append(row_id)
+            entry = {'version': version, 'loaded_at': time.monotonic(), 'by_id': by_id, 'by_name': by_name}
+            self.name_dictionaries[kind] = entry
+        return entry
+
+    def dictionary_name(self, kind: str, row_id):
+        """Name of an id from a name dictionary, reloading once for ids added since it was loaded"""
+        by_id = self.name_dictionary(kind)['by_id']
+        if row_id not in by_id:
+            by_id = self.name_dictionary(kind, refresh=True)['by_id']
+        return by_id.get(row_id)
+
+    def resolve_name(self, kind: str, text: str, label: str) -> Optional[int]:
+        """Resolve an entered name (or id) to its id; a name shared by several rows is listed for the user to pick"""
+        entry = self.name_dictionary(kind)
+        key = self.normalize_key_value(text)
+        if key not in entry['by_name']:
+            if text.isdigit() and int(text) in entry['by_id']:
+                return int(text)
+            # Another session may have added it since the dictionary was loaded
+            entry = self.name_dictionary(kind, refresh=True)
+            if key not in entry['by_name']:
+                print(f"\n✗ No {label} found with the name '{text}'.")
+                return None
+        
+        ids = entry['by_name'][key]
+        if len(ids) == 1:
+            return ids[0]
+        
+        print(f"\n⚠ '{text}' is ambiguous: {len(ids)} {label} entries share this name.")
+        for row_id in sorted(ids):
+            print(f"  {row_id}: {entry['by_id'][row_id]}")
+        choice = input(f"Enter the ID of the {label} you mean: ").strip()
+        if choice.isdigit() and int(choice) in ids:
+            return int(choice)
+        print("✗ That is not one of the listed IDs.")
+        return None
+
+    def note_inserted_row(self, table: str, columns: List[str], values: List, generated_id=None):
+        """Add a freshly inserted row's keys to any cached key sets of its table"""
+        row = dict(zip(columns, values))
+        for col in self.auto_increment_columns.get(table, []):
+            if row.get(col) is None and generated_id:
+                row[col] = generated_id
+        for (ref_table, ref_cols), entry in self.key_cache.items():
+            if ref_table == table and all(row.get(col) is not None for col in ref_cols):
+                entry['keys'].add(tuple(self.normalize_key_value(row[col]) for col in ref_cols))
+
+    def validate_rows(self, table: str, columns: List[str], rows: List[List], partial: bool = False,
+                      pending_keys: Optional[Dict] = None) -> List[tuple]:
+        """Validate rows against the schema's CHECK, NOT NULL and FK constraints before any SQL is sent.
         
+        Rows are checked column by column so a whole batch is validated in one pass per constraint,
+        with one cache lookup per referenced table. With partial=True only the given columns are
+        checked (UPDATE ... SET). Returns a list of (row_index, message) for every violation.
+        """
+        errors = []
+        column_values = {col: [row[idx] for row in rows] for idx, col in enumerate(columns)}
+        pending_keys = pending_keys or {}
+        
+        # NOT NULL pass
+        nullable = self.nullable_columns.get(table, [])
+        auto_cols = self.auto_increment_columns.get(table, [])
+        for col in self.table_columns[table]:
+            if col in nullable or col in auto_cols:
+                continue
+            if col not in column_values:
+                if not partial and col not in self.default_columns.get(table, []):
+                    errors.extend((idx, f"{col} cannot be NULL") for idx in range(len(rows)))
+                continue
+            errors.extend((idx, f"{col} cannot be NULL") for idx, value in enumerate(column_values[col]) if value is None)
+        
+        # CHECK constraint passes
+        for col, rule in self.check_constraints.get(table, {}).items():
+            if col not in column_values:
+                continue
+            for idx, value in enumerate(column_values[col]):
+                if value is None:
+                    continue
+                if rule[0] == 'in':
+                    if self.normalize_key_value(value) not in {self.normalize_key_value(v) for v in rule[1]}:
+                        errors.append((idx, f"{col} must be one of {', '.join(rule[1])} (got '{value}')"))
+                elif rule[0] == 'range':
+                    try:
+                        number = int(value)
+                    except (TypeError, ValueError):
+                        errors.append((idx, f"{col} must be an integer (got '{value}')"))
+                        continue
+                    low, high = rule[1], rule[2]
+                    if (low is not None and number < low) or (high is not None and number > high):
+                        bounds = f"between {low} and {high}" if high is not None else f"at least {low}"
+                        errors.append((idx, f"{col} must be {bounds} (got {number})"))
+        
+        # Foreign key passes: collect distinct keys, resolve misses once per referenced table
+        for fk_cols, ref_table, ref_cols in self.table_foreign_keys.get(table, []):
+            if not all(col in column_values for col in fk_cols):
+                continue
+            keys = []
+            for idx in range(len(rows)):
+                raw = [column_values[col][idx] for col in fk_cols]
+                # NULL components skip the FK check, '@N' placeholders are resolved at commit time
+                if any(value is None or (isinstance(value, str) and value.startswith('@')) for value in raw):
+                    keys.append(None)
+                else:
+                    keys.append(tuple(self.normalize_key_value(value) for value in raw))
+            
+            try:
+                entry = self.load_key_cache(ref_table, ref_cols)
+                known = entry['keys'] | pending_keys.get((ref_table, ref_cols), set())
+                missing = {key for key in keys if key is not None and key not in known}
+                if missing:
+                    missing = self.confirm_missing_keys(ref_table, ref_cols, missing)
+            except Error as e:
+                print(f"  (Could not validate {', '.join(fk_cols)} against {ref_table}: {e})")
+                continue
+            
+            for idx, key in enumerate(keys):
+                if key is not None and key in missing:
+                    shown = ', '.join(f"{col}={column_values[col][idx]}" for col in fk_cols)
+                    errors.append((idx, f"({shown}) does not exist in {ref_table}({', '.join(ref_cols)})"))
+        
+        return sorted(errors, key=lambda error: error[0])
+
+    def report_validation_errors(self, errors: List[tuple], labels: Optional[List[str]] = None):
+        """Print validation errors, optionally labelling each row"""
+        print(f"\n✗ Validation failed, nothing was sent to the database:")
+        for idx, message in errors:
+            label = labels[idx] if labels else None
+            print(f"  {label + ': ' if label else ''}{message}")
+
+    def collect_insert_values(self, table: str):
+        """Prompt the user for the values of a new row and return (columns, values)"""
         columns = self.table_columns[table]
         auto_cols = self.auto_increment_columns.get(table, [])
+        default_cols = self.default_columns.get(table, [])
         
         values = []
         insert_columns = []
@@ -248,6 +1233,11 @@ class DatabaseCLI:
                 if response:
                     insert_columns.append(col)
                     values.append(response if response.lower() != 'null' else None)
+            elif col in default_cols:
+                response = input(f"{col} (YYYY-MM-DD HH:MM:SS - press Enter for the current time): ").strip()
+                if response:
+                    insert_columns.append(col)
+                    values.append(response if response.lower() != 'null' else None)
             else:
                 # Show reference data for foreign keys
                 self.show_reference_data(col)
@@ -265,19 +1255,265 @@ class DatabaseCLI:
                     else:
                         print("✗ Value cannot be empty (use 'null' for NULL values)")
         
+        return insert_columns, values
+
+    def insert_data(self):
+        """Insert data into a table"""
+        table = self.select_table()
+        if not table:
+            return
+        
+        print(f"\n{'='*60}")
+        print(f"INSERT DATA INTO {table}")
+        print("="*60)
+        
+        insert_columns, values = self.collect_insert_values(table)
+        
+        errors = self.validate_rows(table, insert_columns, [values])
+        if errors:
+            self.report_validation_errors(errors)
+            return
+        
         try:
             placeholders = ', '.join(['%s'] * len(values))
             column_names = ', '.join(insert_columns)
             query = f"INSERT INTO {table} ({column_names}) VALUES ({placeholders})"
             
-            self.cursor.execute(query, values)
-            self.connection.commit()
+            def work():
+                self.cursor.execute(query, values)
+                return self.cursor.lastrowid
+            
+            new_id = self.run_transaction(work)
+            self.note_inserted_row(table, insert_columns, values, new_id)
+            self.invalidate_report_caches(table)
             print(f"\n✓ Data inserted successfully into {table}!")
             
         except Error as e:
             self.connection.rollback()
             print(f"\n✗ Error inserting data: {e}")
 
+    def get_fk_safe_order(self) -> Dict[str, int]:
+        """Rank every table so that referenced (parent) tables come before the tables that reference them"""
+        ranks = {}
+        
+        def rank_of(table, visiting=()):
+            if table in ranks:
+                return ranks[table]
+            parents = [ref_table for _, ref_table, _ in self.table_foreign_keys.get(table, [])
+                       if ref_table != table and ref_table not in visiting]
+            ranks[table] = max((rank_of(parent, visiting + (table,)) + 1 for parent in parents), default=0)
+            return ranks[table]
+        
+        for table in self.tables:
+            rank_of(table)
+        return ranks
+
+    def display_insert_session_menu(self):
+        """Display insert session submenu"""
+        print("\n" + "="*60)
+        print("INSERT SESSION (GROUP COMMIT)")
+        print("="*60)
+        print("1. Add insert to session")
+        print("2. Undo last step")
+        print("3. Show pending inserts")
+        print("4. Commit session")
+        print("5. Discard session and return")
+        print("="*60)
+
+    def show_insert_session_summary(self, steps: List[Dict]):
+        """Display queued inserts in the order they will be executed"""
+        print("\n" + "-"*80)
+        print(f"{'Step':<8}{'Table':<32}{'Values':<40}")
+        print("-"*80)
+        for step in steps:
+            values = ', '.join(f"{col}={'NULL' if val is None else val}" for col, val in zip(step['columns'], step['values']))
+            if len(values) > 38:
+                values = values[:35] + "..."
+            print(f"{step['step']:<8}{step['table']:<32}{values:<40}")
+        print("-"*80)
+        
+        per_table = {}
+        for step in steps:
+            per_table[step['table']] = per_table.get(step['table'], 0) + 1
+        print(f"\nTotal rows: {len(steps)} across {len(per_table)} table(s)")
+        for table, count in per_table.items():
+            print(f"  {table}: {count}")
+
+    def commit_insert_session(self, queue: List[Dict]) -> bool:
+        """Execute queued inserts in FK-safe order inside one transaction and commit once"""
+        ranks = self.get_fk_safe_order()
+        ordered = sorted(queue, key=lambda step: (ranks.get(step['table'], 0), step['step']))
+        
+        # Validate the whole session table by table; keys of queued parent rows count as existing
+        pending_keys = {}
+        for step in ordered:
+            row = dict(zip(step['columns'], step['values']))
+            for fks in self.table_foreign_keys.values():
+                for _, ref_table, ref_cols in fks:
+                    if ref_table == step['table'] and all(row.get(col) is not None for col in ref_cols):
+                        pending_keys.setdefault((ref_table, ref_cols), set()).add(
+                            tuple(self.normalize_key_value(row[col]) for col in ref_cols))
+        
+        errors = []
+        labels = []
+        for table in dict.fromkeys(step['table'] for step in ordered):
+            table_steps = [step for step in ordered if step['table'] == table]
+            # Steps may list different columns (skipped AUTO_INCREMENT), so validate them per column set
+            by_columns = {}
+            for step in table_steps:
+                by_columns.setdefault(tuple(step['columns']), []).append(step)
+            for columns, steps in by_columns.items():
+                for idx, message in self.validate_rows(table, list(columns), [step['values'] for step in steps],
+                                                       pending_keys=pending_keys):
+                    errors.append((len(labels), message))
+                    labels.append(f"Step {steps[idx]['step']} ({table})")
+        if errors:
+            self.report_validation_errors(errors, labels)
+            print("  Undo the invalid steps and commit again.")
+            return False
+        
+        print("\n" + "="*80)
+        print("SESSION SUMMARY (FK-SAFE EXECUTION ORDER)")
+        print("="*80)
+        self.show_insert_session_summary(ordered)
+        
+        confirm = input("\nCommit all of the above in a single transaction? (yes/no): ").strip().lower()
+        if confirm != 'yes':
+            print("✗ Commit cancelled. Session is still open.")
+            return False
+        
+        tables = {step['table'] for step in ordered}
+        # Step number -> whether to skip it when it fails; asked outside the transaction and reused by every re-run
+        skip_decisions: Dict[int, bool] = {}
+        
+        def work():
+            generated_ids = {}
+            inserted = 0
+            for step in ordered:
+                savepoint = f"session_step_{step['step']}"
+                
+                # '@N' refers to the AUTO_INCREMENT id generated by step N of this session
+                values = []
+                for value in step['values']:
+                    if isinstance(value, str) and re.fullmatch(r'@\d+', value):
+                        ref_step = int(value[1:])
+                        if ref_step not in generated_ids:
+                            raise ValueError(f"step {step['step']} references {value}, which has not generated an id")
+                        value = generated_ids[ref_step]
+                    values.append(value)
+                
+                placeholders = ', '.join(['%s'] * len(values))
+                column_names = ', '.join(step['columns'])
+                query = f"INSERT INTO {step['table']} ({column_names}) VALUES ({placeholders})"
+                
+                self.cursor.execute(f"SAVEPOINT {savepoint}")
+                try:
+                    self.cursor.execute(query, values)
+                except Error as e:
+                    # A deadlock or lock wait timeout aborts the whole session; let run_transaction retry it
+                    if self.classify_error(e) == 'retryable':
+                        raise
+                    self.cursor.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                    if step['step'] not in skip_decisions:
+                        raise SessionStepFailed(step, e)
+                    if not skip_decisions[step['step']]:
+                        raise
+                    print(f"\n⚠ Step {step['step']} ({step['table']}) skipped: {e}")
+                    continue
+                
+                if self.cursor.lastrowid:
+                    generated_ids[step['step']] = self.cursor.lastrowid
+                self.note_inserted_row(step['table'], step['columns'], values, self.cursor.lastrowid)
+                self.cursor.execute(f"RELEASE SAVEPOINT {savepoint}")
+                inserted += 1
+            return generated_ids, inserted
+        
+        def forget_session_keys():
+            # Keys noted for rows that were just rolled back must not stay in the key caches
+            for table in tables:
+                self.invalidate_key_cache(table)
+        
+        try:
+            while True:
+                # Make sure the session starts from a clean transaction boundary
+                self.connection.rollback()
+                try:
+                    generated_ids, inserted = self.run_transaction(work, on_rollback=forget_session_keys)
+                    break
+                except SessionStepFailed as failure:
+                    # Roll back before prompting so no locks are held while waiting for the answer, then re-run
+                    self.connection.rollback()
+                    forget_session_keys()
+                    step, error = failure.args
+                    print(f"\n✗ Step {step['step']} ({step['table']}) failed: {error}")
+                    skip = input("Skip this step and continue with the rest? (yes/no): ").strip().lower()
+                    skip_decisions[step['step']] = skip == 'yes'
+                    if skip != 'yes':
+                        raise error
+            for table in tables:
+                self.invalidate_report_caches(table)
+            print(f"\n✓ Session committed: {inserted} row(s) inserted with a single commit!")
+            for step_no, new_id in sorted(generated_ids.items()):
+                print(f"  Step {step_no} generated id {new_id}")
+            return True
+            
+        except (Error, ValueError) as e:
+            self.connection.rollback()
+            forget_session_keys()
+            print(f"\n✗ Session rolled back, nothing was inserted: {e}")
+            print("  The session is still open; undo or fix steps and commit again.")
+            return False
+
+    def insert_session(self):
+        """Queue inserts across several tables and commit them together"""
+        queue = []
+        next_step = 1
+        
+        print("\nValues of the form @N use the AUTO_INCREMENT id generated by step N.")
+        
+        while True:
+            self.display_insert_session_menu()
+            choice = input(f"\nEnter your choice (1-5) [{len(queue)} pending]: ").strip()
+            
+            if choice == '1':
+                table = self.select_table()
+                if not table:
+                    continue
+                print(f"\n{'='*60}")
+                print(f"QUEUE INSERT INTO {table} (step {next_step})")
+                print("="*60)
+                insert_columns, values = self.collect_insert_values(table)
+                queue.append({'step': next_step, 'table': table, 'columns': insert_columns, 'values': values})
+                print(f"\n✓ Step {next_step} queued for {table}.")
+                next_step += 1
+            elif choice == '2':
+                if not queue:
+                    print("✗ Nothing to undo.")
+                    continue
+                removed = queue.pop()
+                print(f"✓ Step {removed['step']} ({removed['table']}) removed from the session.")
+            elif choice == '3':
+                if not queue:
+                    print("\n✗ No pending inserts.")
+                    continue
+                self.show_insert_session_summary(queue)
+            elif choice == '4':
+                if not queue:
+                    print("✗ No pending inserts to commit.")
+                    continue
+                if self.commit_insert_session(queue):
+                    break
+            elif choice == '5':
+                if queue:
+                    confirm = input(f"\n⚠ Discard {len(queue)} pending insert(s)? (yes/no): ").strip().lower()
+                    if confirm != 'yes':
+                        continue
+                print("✓ Insert session closed.")
+                break
+            else:
+                print("✗ Invalid choice! Please enter a number between 1 and 5.")
+
+    @plan_samples(table='INTRUDERS', set_clause='Intelligence = %s', where_clause='Name = %s')
     def update_data(self):
         """Update data in a table"""
         table = self.select_table()
@@ -350,17 +1586,30 @@ class DatabaseCLI:
             print("✗ At least one column to update is required!")
             return
         
+        set_columns = [condition.split(' = ')[0] for condition in update_columns]
+        errors = self.validate_rows(table, set_columns, [update_values], partial=True)
+        if errors:
+            self.report_validation_errors(errors)
+            return
+        
         try:
             set_clause = ', '.join(update_columns)
             where_clause = ' AND '.join(where_conditions)
             query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
             
             all_values = update_values + where_values
-            self.cursor.execute(query, all_values)
-            self.connection.commit()
             
-            if self.cursor.rowcount > 0:
-                print(f"\n✓ {self.cursor.rowcount} row(s) updated successfully in {table}!")
+            def work():
+                self.cursor.execute(query, all_values)
+                return self.cursor.rowcount
+            
+            updated = self.run_transaction(work)
+            self.invalidate_key_cache(table)
+            self.invalidate_report_caches(table)
+            self.invalidate_event_caches(table)
+            
+            if updated > 0:
+                print(f"\n✓ {updated} row(s) updated successfully in {table}!")
             else:
                 print(f"\n✗ No rows matched the WHERE condition.")
                 
@@ -368,6 +1617,7 @@ class DatabaseCLI:
             self.connection.rollback()
             print(f"\n✗ Error updating data: {e}")
 
+    @plan_samples(table='INTRUDERS', where_clause='Name = %s')
     def delete_data(self):
         """Delete data from a table"""
         table = self.select_table()
@@ -420,11 +1670,18 @@ class DatabaseCLI:
         
         try:
             query = f"DELETE FROM {table} WHERE {where_clause}"
-            self.cursor.execute(query, where_values)
-            self.connection.commit()
             
-            if self.cursor.rowcount > 0:
-                print(f"\n✓ {self.cursor.rowcount} row(s) deleted successfully from {table}!")
+            def work():
+                self.cursor.execute(query, where_values)
+                return self.cursor.rowcount
+            
+            deleted = self.run_transaction(work)
+            self.invalidate_key_cache(table)
+            self.invalidate_report_caches(table)
+            self.invalidate_event_caches(table)
+            
+            if deleted > 0:
+                print(f"\n✓ {deleted} row(s) deleted successfully from {table}!")
             else:
                 print(f"\n✗ No rows matched the WHERE condition.")
                 
@@ -432,135 +1689,720 @@ class DatabaseCLI:
             self.connection.rollback()
             print(f"\n✗ Error deleting data: {e}")
 
-    def intruder_threat_assessment(self):
-        """Display Intruder Threat Assessment by Region Report"""
-        print("\n" + "="*80)
-        print("INTRUDER THREAT ASSESSMENT BY REGION")
+    def invalidate_event_caches(self, table: str):
+        """Drop report data built from the event tables when a write to table reaches them through the schema triggers"""
+        for child in self.partitioned_tables:
+            if child != table and child in self.dependent_tables(table):
+                self.invalidate_report_caches(child)
+
+    def write_csv_export(self, cursor, path: str) -> int:
+        """Stream a query result into a CSV in the format read by --bulk-load, returning the row count"""
+        columns = [description[0] for description in cursor.description]
+        rows = 0
+        with open(path, 'w', newline='') as csv_file:
+            writer = csv.writer(csv_file, lineterminator='\n')
+            writer.writerow(columns)
+            while True:
+                batch = cursor.fetchmany(10000)
+                if not batch:
+                    break
+                writer.writerows([self.csv_export_row(row) for row in batch])
+                rows += len(batch)
+        return rows
+
+    def csv_export_row(self, row) -> List[str]:
+        """Encode a row with the MySQL LOAD DATA conventions: \\N is NULL and backslashes are escaped"""
+        return ['\\N' if value is None else str(value).replace('\\', '\\\\') for value in row]
+
+    def list_partitions(self, cursor, table: str) -> List[tuple]:
+        """(partition name, TO_DAYS upper bound or None for MAXVALUE, estimated rows) in order"""
+        cursor.execute("SELECT PARTITION_NAME, PARTITION_DESCRIPTION, TABLE_ROWS FROM information_schema.PARTITIONS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL ORDER BY PARTITION_ORDINAL_POSITION", (table,))
+        return [(name, None if bound == 'MAXVALUE' else int(bound), rows) for name, bound, rows in cursor.fetchall()]
+
+    def ensure_future_partitions(self, cursor, months_ahead: int = 3):
+        """Split p_future with add_monthly_partitions (schema.sql) so every partitioned table has partitions for the coming months"""
+        for table in self.partitioned_tables:
+            partitions = self.list_partitions(cursor, table)
+            if not partitions or partitions[-1][1] is not None:
+                print(f"⚠ {table} has no p_future partition to split; skipping")
+                continue
+            cursor.execute("CALL add_monthly_partitions(%s, %s)", (table, months_ahead))
+            added = len(self.list_partitions(cursor, table)) - len(partitions)
+            if added:
+                print(f"✓ {table}: added {added} partition(s)")
+
+    def maintain_partitions(self, months_ahead: int = 3) -> bool:
+        """Add the monthly event partitions for the coming months, then exit (for cron)"""
+        print("\n" + "="*80)
+        print(f"EVENT PARTITIONS FOR THE NEXT {months_ahead} MONTHS")
         print("="*80)
         
+        cursor = self.connection.cursor()
         try:
-            # Query to get intruders with their region information
-            query = "SELECT i.User_Id, i.Name, i.Gender, i.Height, i.Weight, i.Intelligence, i.Time_Of_Entry, r.Region_Name, r.Region_Id, (i.Intelligence * i.Intelligence + i.Height - i.Weight / i.Height) AS Threat_Level FROM INTRUDERS i JOIN ISLAND_REGIONS r ON i.Location_Id = r.Region_Id ORDER BY Threat_Level DESC"
-            
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
-            
-            if not results:
-                print("\n✗ No intruder data found.")
-                print("="*80)
-                return
+            self.ensure_future_partitions(cursor, months_ahead)
+            print("\n✓ Event partitions are up to date")
+            return True
+        except Error as e:
+            print(f"\n✗ Error adding partitions: {e}")
+            return False
+        finally:
+            cursor.close()
+
+    @plan_samples(table='COMBAT_EVENT', name='p_future')
+    def archive_partitions(self, before: datetime, archive_dir: Optional[str]) -> bool:
+        """Export (optionally) and drop every event partition that only holds rows older than before"""
+        print("\n" + "="*80)
+        print(f"ARCHIVING EVENTS BEFORE {before}")
+        print("="*80)
+        
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("SELECT TO_DAYS(%s)", (before,))
+            cutoff = cursor.fetchone()[0]
+            if archive_dir:
+                os.makedirs(archive_dir, exist_ok=True)
             
-            # Display results in formatted table
-            print("\n" + "-"*80)
-            print(f"{'User ID':<10}{'Name':<20}{'Region':<20}{'Threat Level':<15}")
+            print(f"\n{'Table':<24}{'Partition':<14}{'Rows':<12}{'Action':<30}")
             print("-"*80)
-            
-            for row in results:
-                user_id = row['User_Id']
-                name = row['Name'][:19]  # Truncate if too long
-                region = row['Region_Name'][:19]
-                threat_level = row['Threat_Level']
-                
-                print(f"{user_id:<10}{name:<20}{region:<20}{threat_level:<15.2f}")
-            
+            archived = 0
+            for table in self.partitioned_tables:
+                for name, bound, _ in self.list_partitions(cursor, table):
+                    # A partition is archivable when all of it lies before the cutoff
+                    if bound is None or bound > cutoff:
+                        continue
+                    rows = 0
+                    action = "dropped"
+                    if archive_dir:
+                        cursor.execute(f"SELECT * FROM {table} PARTITION ({name})")
+                        path = os.path.join(archive_dir, f"{table}_{name}.csv")
+                        rows = self.write_csv_export(cursor, path)
+                        action = "exported, dropped"
+                    cursor.execute(f"ALTER TABLE {table} DROP PARTITION {name}")
+                    # Dropping a partition fires no triggers; log it so relationship graphs see the removed events
+                    cursor.execute("INSERT INTO ROW_CHANGES (Table_Name) VALUES (%s)", (table,))
+                    archived += 1
+                    print(f"{table:<24}{name:<14}{rows if archive_dir else '-':<12}{action:<30}")
             print("-"*80)
-            print(f"\nTotal Intruders: {len(results)}")
+            print(f"\n✓ Archived {archived} partition(s)" + (f" to {archive_dir}" if archive_dir else ""))
             
-            # Display detailed breakdown
-            print("\n" + "="*80)
-            print("DETAILED BREAKDOWN")
-            print("="*80)
+            # Watchers only read recent change-log entries, so older ones go with the archived events
+            cursor.execute("DELETE FROM ROW_CHANGES WHERE Changed_At < %s", (before,))
+            self.connection.commit()
+            print(f"✓ Pruned {cursor.rowcount} change-log entries")
             
-            for row in results:
-                print(f"\nIntruder ID: {row['User_Id']} | Name: {row['Name']}")
-                print(f"  Region: {row['Region_Name']} (ID: {row['Region_Id']})")
-                print(f"  Physical Stats: Height={row['Height']}cm, Weight={row['Weight']}kg")
-                print(f"  Intelligence: {row['Intelligence']}")
-                print(f"  Time of Entry: {row['Time_Of_Entry']}")
-                print(f"  THREAT LEVEL: {row['Threat_Level']:.2f}")
-                print(f"    Formula: ({row['Intelligence']}^2) + {row['Height']} - ({row['Weight']}/{row['Height']})")
-                print("  " + "-"*76)
+            self.ensure_future_partitions(cursor)
+            return True
+        except (Error, OSError) as e:
+            print(f"\n✗ Error archiving partitions: {e}")
+            return False
+        finally:
+            cursor.close()
+
+    def analysis_report_queries(self) -> Dict[str, str]:
+        """Queries behind the analysis reports that --precompute stores, keyed by report method name"""
+        return {
+            'intruder_threat_assessment': "SELECT i.User_Id, i.Name, i.Gender, i.Height, i.Weight, i.Intelligence, i.Time_Of_Entry, r.Region_Name, r.Region_Id, (i.Intelligence * i.Intelligence + i.Height - i.Weight / i.Height) AS Threat_Level FROM INTRUDERS i JOIN ISLAND_REGIONS r ON i.Location_Id = r.Region_Id ORDER BY Threat_Level DESC",
+            'foodimal_defensive_readiness': "SELECT r.Region_Name, r.Region_Id, fs.Species_Name, fs.Species_Id, COUNT(ifc.Creature_Id) AS Number_of_Units FROM INDIVIDUAL_FOODIMAL_CREATURES ifc JOIN FOODIMALS_SPECIES fs ON ifc.Species_Id = fs.Species_Id JOIN ISLAND_REGIONS r ON ifc.Location_Id = r.Region_Id GROUP BY r.Region_Name, r.Region_Id, fs.Species_Name, fs.Species_Id ORDER BY r.Region_Name, Number_of_Units DESC",
+            'combat_effectiveness_analysis': "SELECT i.Name AS Intruder_Name, i.User_Id, inv.Item_Name AS Invention_Used, inv.Item_Owner, COUNT(*) AS Frequency_of_Use FROM COMBAT_EVENT ce JOIN INTRUDERS i ON ce.Intruder_Id = i.User_Id JOIN INVENTIONS inv ON ce.Item_Owner_Id = inv.Item_Owner AND ce.Item_Name = inv.Item_Name GROUP BY i.Name, i.User_Id, inv.Item_Name, inv.Item_Owner ORDER BY Frequency_of_Use DESC",
+        }
+
+    def stored_procedure_queries(self) -> Dict[str, List[str]]:
+        """Inline SQL used when a procedure from procedures.sql is not installed"""
+        # One query per result set the caller reads; extra pre-aggregated sets from a procedure are computed client-side instead
+        reports = self.analysis_report_queries()
+        return {
+            'mw_species_by_food_item': ["SELECT DISTINCT fs.Species_Id, fs.Species_Name, fi.Name AS Food_Item_Name FROM FOODIMALS_SPECIES fs JOIN FOOD_ITEM fi ON fs.Species_Id = fi.Species_Id WHERE fi.Name LIKE %s ORDER BY fs.Species_Name"],
+            'mw_search_invention_descriptions': ["SELECT inv.Item_Owner, inv.Item_Name, d.Description, i.Name AS Owner_Name FROM INVENTIONS inv JOIN DESCRIPTIONS d ON inv.Item_Owner = d.Item_Owner_Id AND inv.Item_Name = d.Item_Name JOIN INTRUDERS i ON inv.Item_Owner = i.User_Id WHERE LOWER(d.Description) LIKE LOWER(%s) ORDER BY inv.Item_Name"],
+            'mw_count_foodimals_by_species': ["SELECT COUNT(*) AS Total_Count FROM INDIVIDUAL_FOODIMAL_CREATURES WHERE Species_Id = %s"],
+            'mw_colony_intelligence': ["SELECT AVG(i.Intelligence) AS Average_Intelligence, COUNT(DISTINCT i.User_Id) AS Total_Intruders FROM SUSPIOUS_ACTIVITIES sa JOIN INTRUDERS i ON sa.Intruder_Id = i.User_Id WHERE sa.Colony_Id = %s"],
+            'mw_most_dangerous_region': ["SELECT Region_Id, Region_Name, Threat_To_Intruders FROM ISLAND_REGIONS WHERE Threat_To_Intruders = (SELECT MAX(Threat_To_Intruders) FROM ISLAND_REGIONS)"],
+            'mw_intruder_threat_profiles': ["SELECT Name, Intelligence, (Intelligence * Intelligence + Height - Weight / Height) AS Threat_Status FROM INTRUDERS ORDER BY Threat_Status DESC"],
+            'mw_high_threat_intruders': ["SELECT User_Id, Name, Gender, Height, Weight, Intelligence, Time_Of_Entry, Location_Id, (Intelligence * Intelligence + Height - Weight / Height) AS Threat_Status FROM INTRUDERS HAVING Threat_Status > %s ORDER BY Threat_Status DESC"],
+            'mw_species_inventions': ["SELECT inv.Item_Name, inv.Item_Owner, i.Name AS Owner_Name FROM WEAKNESS w JOIN INVENTIONS inv ON w.Item_Inventor_Id = inv.Item_Owner AND w.Item_Name = inv.Item_Name JOIN INTRUDERS i ON inv.Item_Owner = i.User_Id WHERE w.Species_Id = %s ORDER BY inv.Item_Name"],
+            'mw_region_foodimals': ["SELECT Creature_Id, Species_Id, Populatory_Species_Id FROM INDIVIDUAL_FOODIMAL_CREATURES WHERE Location_Id = %s AND Species_Id IS NOT NULL"],
+            'mw_intruder_threat_assessment': [reports['intruder_threat_assessment']],
+            'mw_foodimal_defensive_readiness': [reports['foodimal_defensive_readiness']],
+            'mw_combat_effectiveness_analysis': [reports['combat_effectiveness_analysis']],
+        }
+
+    def installed_procedures(self) -> set:
+        """Procedures from procedures.sql installed in the database of the current connection, looked up once per server"""
+        settings = self.connection_settings or {}
+        # A replica may lack procedures installed on the primary (or the reverse), so each server is checked on its own
+        key = (settings.get('host'), settings.get('port'), settings.get('database'))
+        if key not in self.procedures:
+            procedures = self.procedures[key] = set()
+            # The thin client cannot CALL through the query service, and older connectors cannot read multiple result sets
+            if self.use_procedures and not self.service_url and hasattr(self.cursor, 'nextset'):
+                try:
+                    self.cursor.execute("SELECT ROUTINE_NAME FROM information_schema.ROUTINES WHERE ROUTINE_SCHEMA = DATABASE() AND ROUTINE_TYPE = 'PROCEDURE'")
+                    procedures.update({row['ROUTINE_NAME'] for row in self.cursor.fetchall()} & set(self.stored_procedure_queries()))
+                except Error as e:
+                    print(f"\n⚠ Could not check for stored procedures, using inline SQL: {e}")
+                if procedures:
+                    print(f"\n✓ Using {len(procedures)} stored procedure(s) from procedures.sql on {key[0]}")
+        return self.procedures[key]
+
+    def query_result_sets(self, procedure: str, params: tuple = (), use_procedure: Optional[bool] = None) -> List[List[Dict]]:
+        """Result sets of a retrieval or report: from its stored procedure when installed, otherwise from its inline SQL"""
+        if use_procedure is None:
+            use_procedure = procedure in self.installed_procedures()
+        if use_procedure:
+            # MAX_EXECUTION_TIME does not reach statements inside a procedure, so a timer kills the CALL at the limit instead
+            limit = self.operation_timeout(self.current_operation or 'unknown')
+            watchdog = None
+            if limit > 0:
+                connection_id, settings = self.connection.connection_id, dict(self.connection_settings)
+                
+                def expire():
+                    try:
+                        self.kill_running_query(connection_id, settings)
+                    except Error as e:
+                        print(f"\n⚠ Could not stop {procedure} at its {limit:g}s time limit: {e}")
+                
+                watchdog = threading.Timer(limit, expire)
+                watchdog.daemon = True
+                watchdog.start()
+            try:
+                # A plain CALL is one round trip; callproc() would add a SET and a SELECT for the arguments
+                self.cursor.execute(f"CALL {procedure}({', '.join(['%s'] * len(params))})", params)
+                result_sets = []
+                while True:
+                    if self.cursor.description is not None:
+                        result_sets.append(self.cursor.fetchall())
+                    if not self.cursor.nextset():
+                        return result_sets
+            except Error as e:
+                # 1317: query interrupted, here by the watchdog's KILL QUERY
+                if watchdog is not None and watchdog.finished.is_set() and getattr(e, 'errno', None) == 1317:
+                    self.note_query_timeout()
+                    raise
+                # Missing, or installed from an older procedures.sql with different parameters
+                if getattr(e, 'errno', None) not in (1305, 1318):
+                    raise
+                print(f"\n⚠ Stored procedure {procedure} is unusable ({e}); using inline SQL")
+                self.installed_procedures().discard(procedure)
+            finally:
+                if watchdog is not None:
+                    watchdog.cancel()
+        
+        result_sets = []
+        for query in self.stored_procedure_queries()[procedure]:
+            self.cursor.execute(query, params)
+            result_sets.append(self.cursor.fetchall())
+        return result_sets
+
+    def session_traffic(self) -> Dict[str, int]:
+        """Statements and bytes this session has exchanged with the server so far"""
+        self.cursor.execute("SHOW SESSION STATUS WHERE Variable_name IN ('Questions', 'Bytes_sent', 'Bytes_received')")
+        return {row['Variable_name']: int(row['Value']) for row in self.cursor.fetchall()}
+
+    def benchmark_procedures(self, iterations: int) -> bool:
+        """Compare round trips, bytes transferred and latency of each installed procedure against its inline SQL"""
+        print("\n" + "="*80)
+        print("STORED PROCEDURE BENCHMARK")
+        print("="*80)
+        
+        installed = self.installed_procedures()
+        if not installed:
+            print("✗ No procedures from procedures.sql are installed (mysql -u <user> -p < src/procedures.sql)")
+            return False
+        
+        # Smallest ids and broad patterns, so every query returns rows on the sample data
+        species_id = min(self.name_dictionary('species')['by_id'], default=0)
+        samples = {
+            'mw_species_by_food_item': ('%a%',),
+            'mw_search_invention_descriptions': ('%a%',),
+            'mw_count_foodimals_by_species': (species_id,),
+            'mw_colony_intelligence': (min(self.name_dictionary('colonies')['by_id'], default=0),),
+            'mw_high_threat_intruders': (10000,),
+            'mw_region_foodimals': (min(self.name_dictionary('regions')['by_id'], default=0),),
+            'mw_species_inventions': (species_id,),
+        }
+        
+        try:
+            # SHOW SESSION STATUS counts itself; measure that once and subtract it from every reading
+            first = self.session_traffic()
+            second = self.session_traffic()
+            overhead = {name: second[name] - first[name] for name in first}
+        except Error as e:
+            print(f"✗ Could not read session status: {e}")
+            return False
+        
+        print(f"{iterations} call(s) per path; Trips = statements sent, Bytes = sent + received, per call\n")
+        print(f"{'Procedure':<34}{'Path':<8}{'Trips':<7}{'Bytes':<10}{'Mean ms':<10}{'p50 ms':<10}")
+        print("-"*80)
+        
+        totals = {False: [0.0, 0.0, 0.0], True: [0.0, 0.0, 0.0]}
+        failed = 0
+        for procedure in sorted(installed):
+            params = samples.get(procedure, ())
+            try:
+                for use_procedure in (False, True):
+                    # Warm up the buffer pool and the procedure cache before measuring
+                    self.query_result_sets(procedure, params, use_procedure)
+                    before = self.session_traffic()
+                    latencies = []
+                    for _ in range(iterations):
+                        started = time.perf_counter()
+                        self.query_result_sets(procedure, params, use_procedure)
+                        latencies.append((time.perf_counter() - started) * 1000)
+                    after = self.session_traffic()
+                    
+                    delta = {name: after[name] - before[name] - overhead[name] for name in after}
+                    trips = delta['Questions'] / iterations
+                    transferred = (delta['Bytes_sent'] + delta['Bytes_received']) / iterations
+                    mean = sum(latencies) / len(latencies)
+                    for i, value in enumerate((trips, transferred, mean)):
+                        totals[use_procedure][i] += value
+                    print(f"{procedure if not use_procedure else '':<34}{'CALL' if use_procedure else 'inline':<8}"
+                          f"{trips:<7.1f}{transferred:<10.0f}{mean:<10.2f}{self.percentile(sorted(latencies), 0.5):<10.2f}")
+            except Error as e:
+                failed += 1
+                print(f"{procedure:<34}✗ {e}")
+        
+        print("-"*80)
+        for use_procedure in (False, True):
+            trips, transferred, mean = totals[use_procedure]
+            print(f"{'Total per pass' if not use_procedure else '':<34}{'CALL' if use_procedure else 'inline':<8}"
+                  f"{trips:<7.1f}{transferred:<10.0f}{mean:<10.2f}")
+        print("="*80)
+        if failed:
+            print(f"✗ {failed} procedure(s) failed")
+            return False
+        return True
+
+    def report_store_path(self, report: str) -> str:
+        """Path of a report's precomputed result in the report store"""
+        return os.path.join(os.path.expanduser(self.report_store_dir), f"{report}.json.gz")
+
+    def store_report(self, report: str, rows: List[Dict], interval: float):
+        """Write a report's rows to the store as gzipped JSON, replacing the previous version atomically"""
+        path = self.report_store_path(report)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        payload = {'report': report, 'generated_at': time.time(), 'interval': interval, 'rows': rows}
+        with gzip.open(path + '.tmp', 'wt', encoding='utf-8') as store_file:
+            json.dump(payload, store_file, default=json_default, separators=(',', ':'))
+        os.replace(path + '.tmp', path)
+
+    def load_stored_report(self, report: str) -> Optional[List[Dict]]:
+        """Return a report's precomputed rows and print their age, or None to compute it live"""
+        if self.fresh_reports:
+            return None
+        try:
+            with gzip.open(self.report_store_path(report), 'rt', encoding='utf-8') as store_file:
+                payload = json.load(store_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"\n⚠ Ignoring unreadable precomputed report: {e}")
+            return None
+        
+        age = max(time.time() - payload['generated_at'], 0)
+        generated = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(payload['generated_at']))
+        age_text = f"{int(age // 3600)}h {int(age % 3600 // 60)}m" if age >= 3600 else f"{int(age // 60)}m {int(age % 60)}s"
+        # A report that missed two scheduled refreshes is flagged as stale
+        if age > 2 * payload['interval']:
+            print(f"\n⚠ STALE: precomputed {age_text} ago ({generated}), refresh interval {payload['interval']:.0f}s. Run with --fresh for live data.")
+        else:
+            print(f"\n✓ Precomputed {age_text} ago ({generated}). Run with --fresh for live data.")
+        return payload['rows']
+
+    def precompute_reports(self, interval: float, once: bool) -> bool:
+        """Recompute the analysis reports into the report store every interval seconds (or once)"""
+        print("\n" + "="*80)
+        print(f"PRECOMPUTING ANALYSIS REPORTS INTO {os.path.expanduser(self.report_store_dir)}")
+        print("="*80)
+        
+        ok = True
+        try:
+            while True:
+                cycle_start = time.monotonic()
+                ok = True
+                try:
+                    self.connection.ping(reconnect=True, attempts=3, delay=5)
+                except Error as e:
+                    print(f"✗ Database unavailable: {e}")
+                    ok = False
+                
+                # A long-running scheduler also keeps the event partitions ahead of time and the change log bounded
+                if ok:
+                    maintenance_cursor = self.connection.cursor()
+                    try:
+                        self.ensure_future_partitions(maintenance_cursor)
+                        pruned = self.prune_row_changes(maintenance_cursor)
+                        if pruned:
+                            print(f"{time.strftime('%H:%M:%S')}  ✓ pruned {pruned} change-log entries")
+                    except Error as e:
+                        ok = False
+                        print(f"{time.strftime('%H:%M:%S')}  ✗ maintenance: {e}")
+                    finally:
+                        maintenance_cursor.close()
+                
+                for report, query in self.analysis_report_queries().items() if ok else ():
+                    start = time.perf_counter()
+                    try:
+                        # Each report reads the latest committed data
+                        self.connection.commit()
+                        self.cursor.execute(query)
+                        rows = self.cursor.fetchall()
+                        self.store_report(report, rows, interval)
+                        print(f"{time.strftime('%H:%M:%S')}  ✓ {report:<35}{len(rows):>8} rows {time.perf_counter() - start:>8.2f}s")
+                    except (Error, OSError) as e:
+                        ok = False
+                        print(f"{time.strftime('%H:%M:%S')}  ✗ {report}: {e}")
+                
+                if once:
+                    return ok
+                time.sleep(max(interval - (time.monotonic() - cycle_start), 0))
+        except KeyboardInterrupt:
+            print("\n✓ Precompute scheduler stopped.")
+            return ok
+
+    def intruder_threat_assessment(self):
+        """Display Intruder Threat Assessment by Region Report"""
+        print("\n" + "="*80)
+        print("INTRUDER THREAT ASSESSMENT BY REGION")
+        print("="*80)
+        
+        stored = self.load_stored_report('intruder_threat_assessment')
+        if stored is not None:
+            self.render_intruder_threat_assessment(stored)
+            return
+        
+        try:
+            # Query to get intruders with their region information
+            results = self.query_result_sets('mw_intruder_threat_assessment')[0]
             
-            print("\n" + "="*80)
+            self.render_intruder_threat_assessment(results)
             
         except Error as e:
             print(f"\n✗ Error generating report: {e}")
             print("="*80)
 
+    def render_intruder_threat_assessment(self, results: List[Dict]):
+        """Print the intruder threat assessment from rows ordered by Threat_Level"""
+        if not results:
+            print("\n✗ No intruder data found.")
+            print("="*80)
+            return
+        
+        # Display results in formatted table
+        print("\n" + "-"*80)
+        print(f"{'User ID':<10}{'Name':<20}{'Region':<20}{'Threat Level':<15}")
+        print("-"*80)
+        
+        for row in results:
+            user_id = row['User_Id']
+            name = row['Name'][:19]  # Truncate if too long
+            region = row['Region_Name'][:19]
+            threat_level = row['Threat_Level']
+            
+            print(f"{user_id:<10}{name:<20}{region:<20}{threat_level:<15.2f}")
+        
+        print("-"*80)
+        print(f"\nTotal Intruders: {len(results)}")
+        
+        # Display detailed breakdown
+        print("\n" + "="*80)
+        print("DETAILED BREAKDOWN")
+        print("="*80)
+        
+        for row in results:
+            print(f"\nIntruder ID: {row['User_Id']} | Name: {row['Name']}")
+            print(f"  Region: {row['Region_Name']} (ID: {row['Region_Id']})")
+            print(f"  Physical Stats: Height={row['Height']}cm, Weight={row['Weight']}kg")
+            print(f"  Intelligence: {row['Intelligence']}")
+            print(f"  Time of Entry: {row['Time_Of_Entry']}")
+            print(f"  THREAT LEVEL: {row['Threat_Level']:.2f}")
+            print(f"    Formula: ({row['Intelligence']}^2) + {row['Height']} - ({row['Weight']}/{row['Height']})")
+            print("  " + "-"*76)
+        
+        print("\n" + "="*80)
+
     def foodimal_defensive_readiness(self):
         """Display Foodimal Defensive Readiness Report by Region"""
         print("\n" + "="*80)
         print("FOODIMAL DEFENSIVE READINESS REPORT")
         print("="*80)
         
+        stored = self.load_stored_report('foodimal_defensive_readiness')
+        if stored is not None:
+            self.render_foodimal_defensive_readiness(stored)
+            return
+        
         try:
             # Query to get foodimal species distribution across regions
-            query = "SELECT r.Region_Name, r.Region_Id, fs.Species_Name, fs.Species_Id, COUNT(ifc.Creature_Id) AS Number_of_Units FROM INDIVIDUAL_FOODIMAL_CREATURES ifc JOIN FOODIMALS_SPECIES fs ON ifc.Species_Id = fs.Species_Id JOIN ISLAND_REGIONS r ON ifc.Location_Id = r.Region_Id GROUP BY r.Region_Name, r.Region_Id, fs.Species_Name, fs.Species_Id ORDER BY r.Region_Name, Number_of_Units DESC"
+            results = self.query_result_sets('mw_foodimal_defensive_readiness')[0]
             
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
-            
-            if not results:
-                print("\n✗ No foodimal creature data found.")
-                print("="*80)
-                return
+            self.render_foodimal_defensive_readiness(results)
             
-            # Group results by region for better display
-            regions_data = {}
-            for row in results:
-                region_name = row['Region_Name']
-                if region_name not in regions_data:
-                    regions_data[region_name] = {
-                        'region_id': row['Region_Id'],
-                        'species': [],
-                        'total_units': 0
-                    }
-                regions_data[region_name]['species'].append({
-                    'species_name': row['Species_Name'],
-                    'species_id': row['Species_Id'],
-                    'count': row['Number_of_Units']
-                })
-                regions_data[region_name]['total_units'] += row['Number_of_Units']
-            
-            # Display summary table
-            print("\n" + "-"*80)
-            print(f"{'Region':<25}{'Species Count':<20}{'Total Units':<15}")
+        except Error as e:
+            print(f"\n✗ Error generating report: {e}")
+            print("="*80)
+
+    def render_foodimal_defensive_readiness(self, results: List[Dict]):
+        """Print the defensive readiness report from per region/species unit counts"""
+        if not results:
+            print("\n✗ No foodimal creature data found.")
+            print("="*80)
+            return
+        
+        # Group results by region for better display
+        regions_data = {}
+        for row in results:
+            region_name = row['Region_Name']
+            if region_name not in regions_data:
+                regions_data[region_name] = {
+                    'region_id': row['Region_Id'],
+                    'species': [],
+                    'total_units': 0
+                }
+            regions_data[region_name]['species'].append({
+                'species_name': row['Species_Name'],
+                'species_id': row['Species_Id'],
+                'count': row['Number_of_Units']
+            })
+            regions_data[region_name]['total_units'] += row['Number_of_Units']
+        
+        # Display summary table
+        print("\n" + "-"*80)
+        print(f"{'Region':<25}{'Species Count':<20}{'Total Units':<15}")
+        print("-"*80)
+        
+        for region_name in sorted(regions_data.keys()):
+            region_info = regions_data[region_name]
+            species_count = len(region_info['species'])
+            total_units = region_info['total_units']
+            print(f"{region_name:<25}{species_count:<20}{total_units:<15}")
+        
+        print("-"*80)
+        print(f"\nTotal Regions: {len(regions_data)}")
+        print(f"Total Foodimal Units: {sum(r['total_units'] for r in regions_data.values())}")
+        
+        # Display detailed breakdown by region
+        print("\n" + "="*80)
+        print("DETAILED BREAKDOWN BY REGION")
+        print("="*80)
+        
+        for region_name in sorted(regions_data.keys()):
+            region_info = regions_data[region_name]
+            print(f"\n{'='*80}")
+            print(f"REGION: {region_name} (ID: {region_info['region_id']})")
+            print(f"{'='*80}")
+            print(f"{'Species Name':<30}{'Species ID':<15}{'Unit Count':<15}")
             print("-"*80)
             
-            for region_name in sorted(regions_data.keys()):
-                region_info = regions_data[region_name]
-                species_count = len(region_info['species'])
-                total_units = region_info['total_units']
-                print(f"{region_name:<25}{species_count:<20}{total_units:<15}")
+            for species in region_info['species']:
+                print(f"{species['species_name']:<30}{species['species_id']:<15}{species['count']:<15}")
             
             print("-"*80)
-            print(f"\nTotal Regions: {len(regions_data)}")
-            print(f"Total Foodimal Units: {sum(r['total_units'] for r in regions_data.values())}")
-            
-            # Display detailed breakdown by region
-            print("\n" + "="*80)
-            print("DETAILED BREAKDOWN BY REGION")
-            print("="*80)
-            
-            for region_name in sorted(regions_data.keys()):
-                region_info = regions_data[region_name]
-                print(f"\n{'='*80}")
-                print(f"REGION: {region_name} (ID: {region_info['region_id']})")
-                print(f"{'='*80}")
-                print(f"{'Species Name':<30}{'Species ID':<15}{'Unit Count':<15}")
-                print("-"*80)
+            print(f"Region Total: {region_info['total_units']} units across {len(region_info['species'])} species")
+        
+        print("\n" + "="*80)
+
+    @plan_samples(where=('i.User_Id > %s', 'ifc.Creature_Id > %s'))
+    def watch_report_specs(self) -> Dict[str, Dict]:
+        """Row queries and change-log tables for the reports that support watch mode"""
+        return {
+            '1': {
+                'title': 'INTRUDER THREAT ASSESSMENT BY REGION',
+                'key': 'User_Id',
+                'key_expr': 'i.User_Id',
+                'rows': "SELECT i.User_Id, i.Name, i.Gender, i.Height, i.Weight, i.Intelligence, i.Time_Of_Entry, r.Region_Name, r.Region_Id, (i.Intelligence * i.Intelligence + i.Height - i.Weight / i.Height) AS Threat_Level FROM INTRUDERS i JOIN ISLAND_REGIONS r ON i.Location_Id = r.Region_Id WHERE {where}",
+                'table': 'INTRUDERS',
+                'references': ('ISLAND_REGIONS',),
+                'render': self.render_watched_threat_assessment
+            },
+            '2': {
+                'title': 'FOODIMAL DEFENSIVE READINESS REPORT',
+                'key': 'Creature_Id',
+                'key_expr': 'ifc.Creature_Id',
+                'rows': "SELECT ifc.Creature_Id, r.Region_Name, r.Region_Id, fs.Species_Name, fs.Species_Id FROM INDIVIDUAL_FOODIMAL_CREATURES ifc JOIN FOODIMALS_SPECIES fs ON ifc.Species_Id = fs.Species_Id JOIN ISLAND_REGIONS r ON ifc.Location_Id = r.Region_Id WHERE {where}",
+                'table': 'INDIVIDUAL_FOODIMAL_CREATURES',
+                'references': ('ISLAND_REGIONS', 'FOODIMALS_SPECIES', 'POPULATORY_SPECIES'),
+                'render': self.render_watched_defensive_readiness
+            }
+        }
+
+    def render_watched_threat_assessment(self, state: Dict):
+        """Render the threat assessment from the watched intruder rows"""
+        results = sorted(state['rows'].values(), key=lambda row: row['Threat_Level'], reverse=True)
+        self.render_intruder_threat_assessment(results)
+
+    def render_watched_defensive_readiness(self, state: Dict):
+        """Render defensive readiness from the incrementally maintained region/species unit counts"""
+        results = [
+            {'Region_Name': region_name, 'Region_Id': region_id, 'Species_Name': species_name,
+             'Species_Id': species_id, 'Number_of_Units': count}
+            for (region_id, region_name, species_id, species_name), count in state['aggregates'].items() if count > 0
+        ]
+        results.sort(key=lambda row: (row['Region_Name'], -row['Number_of_Units']))
+        self.render_foodimal_defensive_readiness(results)
+
+    def apply_watch_rows(self, state: Dict, spec: Dict, rows: List[Dict], sign: int):
+        """Add (sign=1) or remove (sign=-1) rows from the watched row set and its aggregates"""
+        key = spec['key']
+        for row in rows:
+            if sign > 0:
+                state['rows'][row[key]] = row
+            else:
+                state['rows'].pop(row[key], None)
+            if 'Species_Id' in row and 'Creature_Id' in row:
+                group = (row['Region_Id'], row['Region_Name'], row['Species_Id'], row['Species_Name'])
+                state['aggregates'][group] = state['aggregates'].get(group, 0) + sign
+
+    # Seconds a skipped AUTO_INCREMENT id (Change_Id, Event_Seq) is waited for, and the longest run of skipped ids
+    # that is tracked; longer runs come from rolled-back bulk writes
+    SEQUENCE_GAP_TTL = 600
+    SEQUENCE_MAX_GAP = 1000
+
+    def track_sequence_gaps(self, pending: Dict[int, float], seen: Iterable[int], runs: Iterable[tuple]):
+        """Update the skipped ids of a sequence: drop the ones now seen, add the ids between each (previous, next) run, expire old ones"""
+        now = time.monotonic()
+        for value in seen:
+            pending.pop(value, None)
+        for previous, following in runs:
+            if following - previous - 1 <= self.SEQUENCE_MAX_GAP:
+                for value in range(previous + 1, following):
+                    pending[value] = now
+        
+        # A transaction older than this is assumed rolled back
+        for value in [value for value, since in pending.items() if now - since > self.SEQUENCE_GAP_TTL]:
+            del pending[value]
+
+    def read_row_changes(self, state: Dict) -> List[Dict]:
+        """Change-log entries committed since the last refresh, remembering Change_Id gaps left by open transactions.
+        
+        Returns None when the last read was longer ago than row_change_retention, since entries the reader has not
+        seen may have been pruned; the caller then has to reload everything.
+        """
+        now = time.monotonic()
+        if now - state['log_read_at'] > self.row_change_retention:
+            return None
+        state['log_read_at'] = now
+        pending = list(state['log_pending'])
+        # Query to fetch new change-log entries plus any that were still uncommitted at the last refresh
+        if pending:
+            self.cursor.execute(f"SELECT Change_Id, Table_Name, Row_Id FROM ROW_CHANGES WHERE Change_Id > %s OR Change_Id IN ({', '.join(['%s'] * len(pending))})",
+                                [state['log_high']] + pending)
+        else:
+            self.cursor.execute("SELECT Change_Id, Table_Name, Row_Id FROM ROW_CHANGES WHERE Change_Id > %s", (state['log_high'],))
+        changes = self.cursor.fetchall()
+        
+        new_ids = sorted(change['Change_Id'] for change in changes if change['Change_Id'] > state['log_high'])
+        self.track_sequence_gaps(state['log_pending'], [change['Change_Id'] for change in changes], zip([state['log_high']] + new_ids, new_ids))
+        if new_ids:
+            state['log_high'] = new_ids[-1]
+        return changes
+
+    def prune_row_changes(self, cursor) -> int:
+        """Delete change-log entries older than row_change_retention in short batches and return how many were deleted"""
+        pruned = 0
+        while True:
+            cursor.execute("DELETE FROM ROW_CHANGES WHERE Changed_At < NOW() - INTERVAL %s SECOND LIMIT 5000", (int(self.row_change_retention),))
+            self.connection.commit()
+            pruned += cursor.rowcount
+            if cursor.rowcount < 5000:
+                return pruned
+
+    def refresh_watch_state(self, state: Dict, spec: Dict, bucket_size: int) -> Dict:
+        """Fetch rows beyond the high-water mark and re-fetch only buckets the change log marks dirty"""
+        stats = {'new_rows': 0, 'changed_buckets': 0, 'refetched_rows': 0}
+        
+        if state['high_water'] is not None:
+            changes = self.read_row_changes(state)
+            if changes is None or any(change['Table_Name'] in spec['references'] for change in changes):
+                # Region and species edits cascade without firing row triggers, and an idle watcher may have
+                # missed pruned entries, so reload every row
+                state.update({'rows': {}, 'aggregates': {}, 'high_water': None})
+                stats['changed_buckets'] = 'all'
+        
+        # Updates/deletes below the high-water mark, located through the trigger-maintained change log
+        if state['high_water'] is not None:
+            changed = sorted({change['Row_Id'] // bucket_size for change in changes
+                              if change['Table_Name'] == spec['table'] and change['Row_Id'] is not None
+                              and change['Row_Id'] <= state['high_water']})
+            
+            for bucket in changed:
+                low, high = bucket * bucket_size, (bucket + 1) * bucket_size
+                stale = [row for row in state['rows'].values() if low <= row[spec['key']] < high]
+                self.apply_watch_rows(state, spec, stale, -1)
+                self.cursor.execute(spec['rows'].format(where=f"{spec['key_expr']} >= %s AND {spec['key_expr']} < %s AND {spec['key_expr']} <= %s"),
+                                    (low, high, state['high_water']))
+                fresh = self.cursor.fetchall()
+                self.apply_watch_rows(state, spec, fresh, 1)
+                stats['refetched_rows'] += len(fresh)
+            stats['changed_buckets'] = len(changed)
+        
+        # New rows beyond the AUTO_INCREMENT high-water mark
+        if state['high_water'] is None:
+            # Start reading the change log from here; the full load below sees everything logged so far
+            self.cursor.execute("SELECT COALESCE(MAX(Change_Id), 0) AS Log_High FROM ROW_CHANGES")
+            state['log_high'] = self.cursor.fetchone()['Log_High']
+            state['log_pending'] = {}
+            state['log_read_at'] = time.monotonic()
+            self.cursor.execute(spec['rows'].format(where="1 = 1"))
+        else:
+            self.cursor.execute(spec['rows'].format(where=f"{spec['key_expr']} > %s"), (state['high_water'],))
+        new_rows = self.cursor.fetchall()
+        self.apply_watch_rows(state, spec, new_rows, 1)
+        stats['new_rows'] = len(new_rows)
+        
+        if new_rows:
+            first_load = state['high_water'] is None
+            state['high_water'] = max([row[spec['key']] for row in new_rows] + ([] if first_load else [state['high_water']]))
+        
+        return stats
+
+    def watch_report(self):
+        """Refresh a report every N seconds, merging only the changed rows into the in-memory aggregates"""
+        print("\n" + "="*80)
+        print("WATCH MODE")
+        print("="*80)
+        print("1. Intruder Threat Assessment by Region")
+        print("2. Foodimal Defensive Readiness Report")
+        
+        specs = self.watch_report_specs()
+        choice = input("\nSelect report to watch (1-2): ").strip()
+        if choice not in specs:
+            print("✗ Invalid choice! Please enter 1 or 2.")
+            return
+        interval = self.prompt_number("Refresh interval in seconds", 5.0)
+        if interval is None or interval <= 0:
+            return
+        
+        spec = specs[choice]
+        bucket_size = 1000
+        state = {'rows': {}, 'aggregates': {}, 'high_water': None, 'log_high': 0, 'log_pending': {}, 'log_read_at': 0.0}
+        refresh_count = 0
+        
+        print("\nPress Ctrl-C to stop watching.")
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    stats = self.refresh_watch_state(state, spec, bucket_size)
+                    # Each refresh is its own snapshot, so end the read transaction
+                    self.connection.commit()
+                    self.prune_row_changes(self.cursor)
+                except Error as e:
+                    print(f"\n✗ Error refreshing report: {e}")
+                    break
+                elapsed = time.perf_counter() - start
+                refresh_count += 1
                 
-                for species in region_info['species']:
-                    print(f"{species['species_name']:<30}{species['species_id']:<15}{species['count']:<15}")
+                print("\n" + "="*80)
+                print(f"{spec['title']} [WATCH refresh #{refresh_count} at {time.strftime('%H:%M:%S')}]")
+                print("="*80)
+                spec['render'](state)
+                print(f"Refresh: {stats['new_rows']} new row(s), {stats['changed_buckets']} changed bucket(s) "
+                      f"({stats['refetched_rows']} row(s) re-fetched) in {elapsed * 1000:.1f} ms | "
+                      f"high-water {spec['key']}={state['high_water']}")
                 
-                print("-"*80)
-                print(f"Region Total: {region_info['total_units']} units across {len(region_info['species'])} species")
-            
-            print("\n" + "="*80)
-            
-        except Error as e:
-            print(f"\n✗ Error generating report: {e}")
-            print("="*80)
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("\n✓ Stopped watching.")
 
     def combat_effectiveness_analysis(self):
         """Display Combat Effectiveness Analysis Report"""
@@ -568,80 +2410,108 @@ class DatabaseCLI:
         print("COMBAT EFFECTIVENESS ANALYSIS")
         print("="*80)
         
+        since, until = self.report_since, self.report_until
+        # Precomputed reports cover the whole history, so a --since/--until window is always computed live
+        stored = self.load_stored_report('combat_effectiveness_analysis') if since is None and until is None else None
+        if stored is not None:
+            self.render_combat_effectiveness_analysis(stored)
+            return
+        
         try:
             # Query to analyze combat events and invention usage
-            query = "SELECT i.Name AS Intruder_Name, i.User_Id, inv.Item_Name AS Invention_Used, inv.Item_Owner, COUNT(*) AS Frequency_of_Use FROM COMBAT_EVENT ce JOIN INTRUDERS i ON ce.Intruder_Id = i.User_Id JOIN INVENTIONS inv ON ce.Item_Owner_Id = inv.Item_Owner AND ce.Item_Name = inv.Item_Name GROUP BY i.Name, i.User_Id, inv.Item_Name, inv.Item_Owner ORDER BY Frequency_of_Use DESC"
-            
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
+            top_inventions = None
+            if since is None and until is None:
+                result_sets = self.query_result_sets('mw_combat_effectiveness_analysis')
+                results = result_sets[0]
+                top_inventions = result_sets[1] if len(result_sets) > 1 else None
+            else:
+                query = self.analysis_report_queries()['combat_effectiveness_analysis']
+                condition, params = self.event_time_filter('ce', since, until)
+                query = query.replace(" GROUP BY ", f" WHERE {condition} GROUP BY ", 1)
+                print(f"\nWindow: {self.describe_report_window(since, until)}")
+                print(f"Partitions scanned: {self.scanned_partitions(query, params)}")
+                
+                self.cursor.execute(query, params)
+                results = self.cursor.fetchall()
             
-            if not results:
-                print("\n✗ No combat event data found.")
-                print("="*80)
-                return
+            self.render_combat_effectiveness_analysis(results, top_inventions)
             
-            # Display summary table
-            print("\n" + "-"*80)
-            print(f"{'Intruder Name':<25}{'Invention Used':<30}{'Frequency':<15}")
+        except Error as e:
+            print(f"\n✗ Error generating report: {e}")
+            print("="*80)
+
+    def render_combat_effectiveness_analysis(self, results: List[Dict], top_inventions: Optional[List[Dict]] = None):
+        """Print the combat effectiveness analysis from per intruder/invention usage counts (and the top 5, if precomputed)"""
+        if not results:
+            print("\n✗ No combat event data found.")
+            print("="*80)
+            return
+        
+        # Display summary table
+        print("\n" + "-"*80)
+        print(f"{'Intruder Name':<25}{'Invention Used':<30}{'Frequency':<15}")
+        print("-"*80)
+        
+        for row in results:
+            intruder_name = row['Intruder_Name'][:24]
+            invention = row['Invention_Used'][:29]
+            frequency = row['Frequency_of_Use']
+            print(f"{intruder_name:<25}{invention:<30}{frequency:<15}")
+        
+        print("-"*80)
+        print(f"\nTotal Combat Events Analyzed: {sum(r['Frequency_of_Use'] for r in results)}")
+        print(f"Unique Intruder-Invention Combinations: {len(results)}")
+        
+        # Group by intruder for detailed analysis
+        intruders_data = {}
+        for row in results:
+            intruder_name = row['Intruder_Name']
+            if intruder_name not in intruders_data:
+                intruders_data[intruder_name] = {
+                    'user_id': row['User_Id'],
+                    'inventions': [],
+                    'total_events': 0
+                }
+            intruders_data[intruder_name]['inventions'].append({
+                'item_name': row['Invention_Used'],
+                'item_owner': row['Item_Owner'],
+                'frequency': row['Frequency_of_Use']
+            })
+            intruders_data[intruder_name]['total_events'] += row['Frequency_of_Use']
+        
+        # Display detailed breakdown by intruder
+        print("\n" + "="*80)
+        print("DETAILED BREAKDOWN BY INTRUDER")
+        print("="*80)
+        
+        for intruder_name in sorted(intruders_data.keys(), key=lambda x: intruders_data[x]['total_events'], reverse=True):
+            intruder_info = intruders_data[intruder_name]
+            print(f"\n{'='*80}")
+            print(f"INTRUDER: {intruder_name} (ID: {intruder_info['user_id']})")
+            print(f"{'='*80}")
+            print(f"{'Invention Name':<35}{'Owner ID':<15}{'Usage Count':<15}{'% of Total':<15}")
             print("-"*80)
             
-            for row in results:
-                intruder_name = row['Intruder_Name'][:24]
-                invention = row['Invention_Used'][:29]
-                frequency = row['Frequency_of_Use']
-                print(f"{intruder_name:<25}{invention:<30}{frequency:<15}")
+            for inv in intruder_info['inventions']:
+                percentage = (inv['frequency'] / intruder_info['total_events']) * 100
+                print(f"{inv['item_name']:<35}{inv['item_owner']:<15}{inv['frequency']:<15}{percentage:.1f}%")
             
             print("-"*80)
-            print(f"\nTotal Combat Events Analyzed: {sum(r['Frequency_of_Use'] for r in results)}")
-            print(f"Unique Intruder-Invention Combinations: {len(results)}")
-            
-            # Group by intruder for detailed analysis
-            intruders_data = {}
-            for row in results:
-                intruder_name = row['Intruder_Name']
-                if intruder_name not in intruders_data:
-                    intruders_data[intruder_name] = {
-                        'user_id': row['User_Id'],
-                        'inventions': [],
-                        'total_events': 0
-                    }
-                intruders_data[intruder_name]['inventions'].append({
-                    'item_name': row['Invention_Used'],
-                    'item_owner': row['Item_Owner'],
-                    'frequency': row['Frequency_of_Use']
-                })
-                intruders_data[intruder_name]['total_events'] += row['Frequency_of_Use']
-            
-            # Display detailed breakdown by intruder
-            print("\n" + "="*80)
-            print("DETAILED BREAKDOWN BY INTRUDER")
-            print("="*80)
-            
-            for intruder_name in sorted(intruders_data.keys(), key=lambda x: intruders_data[x]['total_events'], reverse=True):
-                intruder_info = intruders_data[intruder_name]
-                print(f"\n{'='*80}")
-                print(f"INTRUDER: {intruder_name} (ID: {intruder_info['user_id']})")
-                print(f"{'='*80}")
-                print(f"{'Invention Name':<35}{'Owner ID':<15}{'Usage Count':<15}{'% of Total':<15}")
-                print("-"*80)
-                
-                for inv in intruder_info['inventions']:
-                    percentage = (inv['frequency'] / intruder_info['total_events']) * 100
-                    print(f"{inv['item_name']:<35}{inv['item_owner']:<15}{inv['frequency']:<15}{percentage:.1f}%")
-                
-                print("-"*80)
-                print(f"Total Combat Events: {intruder_info['total_events']}")
-                print(f"Unique Inventions Used: {len(intruder_info['inventions'])}")
-                
-                # Find most used invention for this intruder
-                most_used = max(intruder_info['inventions'], key=lambda x: x['frequency'])
-                print(f"Most Frequently Used: {most_used['item_name']} ({most_used['frequency']} times)")
-            
-            # Display top 5 most used inventions overall
-            print("\n" + "="*80)
-            print("TOP 5 MOST USED INVENTIONS (ACROSS ALL INTRUDERS)")
-            print("="*80)
+            print(f"Total Combat Events: {intruder_info['total_events']}")
+            print(f"Unique Inventions Used: {len(intruder_info['inventions'])}")
             
+            # Find most used invention for this intruder
+            most_used = max(intruder_info['inventions'], key=lambda x: x['frequency'])
+            print(f"Most Frequently Used: {most_used['item_name']} ({most_used['frequency']} times)")
+        
+        # Display top 5 most used inventions overall
+        print("\n" + "="*80)
+        print("TOP 5 MOST USED INVENTIONS (ACROSS ALL INTRUDERS)")
+        print("="*80)
+        
+        if top_inventions is not None:
+            top_inventions = [((row['Invention_Used'], row['Item_Owner']), row['Total_Uses']) for row in top_inventions]
+        else:
             invention_totals = {}
             for row in results:
                 inv_key = (row['Invention_Used'], row['Item_Owner'])
@@ -650,40 +2520,836 @@ class DatabaseCLI:
                 invention_totals[inv_key] += row['Frequency_of_Use']
             
             top_inventions = sorted(invention_totals.items(), key=lambda x: x[1], reverse=True)[:5]
-            
-            print(f"\n{'Rank':<8}{'Invention Name':<35}{'Owner ID':<15}{'Total Uses':<15}")
-            print("-"*80)
-            for idx, ((inv_name, owner_id), total) in enumerate(top_inventions, 1):
-                print(f"{idx:<8}{inv_name:<35}{owner_id:<15}{total:<15}")
-            
-            print("\n" + "="*80)
-            
-        except Error as e:
-            print(f"\n✗ Error generating report: {e}")
-            print("="*80)
+        
+        print(f"\n{'Rank':<8}{'Invention Name':<35}{'Owner ID':<15}{'Total Uses':<15}")
+        print("-"*80)
+        for idx, ((inv_name, owner_id), total) in enumerate(top_inventions, 1):
+            print(f"{idx:<8}{inv_name:<35}{owner_id:<15}{total:<15}")
+        
+        print("\n" + "="*80)
 
-    def find_species_by_food_item(self):
-        """Search for Foodimal Species by Food Item name"""
+    def parse_report_time(self, value: str) -> Optional[datetime]:
+        """Parse a YYYY-MM-DD[ HH:MM[:SS]] report window bound, or None if empty"""
+        value = value.strip()
+        if not value:
+            return None
+        return datetime.fromisoformat(value)
+
+    def event_time_filter(self, alias: str, since: Optional[datetime], until: Optional[datetime]) -> tuple:
+        """SQL condition and parameters restricting alias.Event_Time to [since, until), so partitions are pruned"""
+        conditions, params = [], []
+        if since is not None:
+            conditions.append(f"{alias}.Event_Time >= %s")
+            params.append(since)
+        if until is not None:
+            conditions.append(f"{alias}.Event_Time < %s")
+            params.append(until)
+        return ' AND '.join(conditions), params
+
+    def scanned_partitions(self, query: str, params) -> str:
+        """Partitions MySQL will read for a query, from EXPLAIN's partitions column"""
+        try:
+            self.cursor.execute(f"EXPLAIN {query}", params)
+            partitions = [row['partitions'] for row in self.cursor.fetchall() if row.get('partitions')]
+        except Error:
+            return "unknown"
+        return '; '.join(partitions) if partitions else "n/a"
+
+    def describe_report_window(self, since: Optional[datetime], until: Optional[datetime]) -> str:
+        """Human-readable description of a report time window"""
+        return f"{since or 'beginning'} to {until or 'now'}"
+
+    @plan_samples(condition='ce.Event_Time >= %s AND ce.Event_Time < %s')
+    def region_invention_activity(self):
+        """Invention usage per region over a time window, reading only the matching COMBAT_EVENT partitions"""
         print("\n" + "="*80)
-        print("FIND SPECIES BY FOOD ITEM")
+        print("REGION / INVENTION ACTIVITY BY TIME WINDOW")
         print("="*80)
         
-        food_item_keyword = input("\nEnter food item keyword to search (e.g., 'taco', 'pizza'): ").strip()
-        
-        if not food_item_keyword:
-            print("✗ Search keyword cannot be empty.")
+        default_since = self.report_since or (datetime.now() - timedelta(days=30)).replace(microsecond=0)
+        try:
+            since = self.parse_report_time(input(f"\nSince (YYYY-MM-DD[ HH:MM], default: {default_since}): ")) or default_since
+            until = self.parse_report_time(input(f"Until (exclusive, default: {self.report_until or 'now'}): ")) or self.report_until
+        except ValueError as e:
+            print(f"✗ Invalid date: {e}")
             return
         
         try:
-            # Query to find species that have food items containing the keyword
-            query = "SELECT DISTINCT fs.Species_Id, fs.Species_Name, fi.Name AS Food_Item_Name FROM FOODIMALS_SPECIES fs JOIN FOOD_ITEM fi ON fs.Species_Id = fi.Species_Id WHERE fi.Name LIKE %s ORDER BY fs.Species_Name"
-            search_pattern = f"%{food_item_keyword}%"
+            # Query to count invention uses per region within the window
+            condition, params = self.event_time_filter('ce', since, until)
+            query = f"SELECT r.Region_Name, r.Region_Id, ce.Item_Name, ce.Item_Owner_Id, COUNT(*) AS Uses, COUNT(DISTINCT ce.Intruder_Id) AS Intruders, MIN(ce.Event_Time) AS First_Use, MAX(ce.Event_Time) AS Last_Use FROM COMBAT_EVENT ce JOIN ISLAND_REGIONS r ON ce.Region_Id = r.Region_Id WHERE {condition} GROUP BY r.Region_Name, r.Region_Id, ce.Item_Name, ce.Item_Owner_Id ORDER BY r.Region_Name, Uses DESC"
             
-            self.cursor.execute(query, (search_pattern,))
+            partitions = self.scanned_partitions(query, params)
+            self.cursor.execute(query, params)
             results = self.cursor.fetchall()
             
+            print(f"\nWindow: {self.describe_report_window(since, until)}")
+            print(f"Partitions scanned: {partitions}")
+            
             if not results:
-                print(f"\n✗ No species found with food item containing '{food_item_keyword}'.")
+                print("\n✗ No combat events in this window.")
+                print("="*80)
+                return
+            
+            print("\n" + "-"*80)
+            print(f"{'Region':<20}{'Invention':<25}{'Uses':<8}{'Intruders':<11}{'Last Use':<20}")
+            print("-"*80)
+            
+            current_region = None
+            region_total = 0
+            for row in results:
+                if current_region is not None and row['Region_Name'] != current_region:
+                    print(f"{'':<20}{'Region total':<25}{region_total:<8}")
+                    print("-"*80)
+                    region_total = 0
+                region = row['Region_Name'][:19] if row['Region_Name'] != current_region else ''
+                current_region = row['Region_Name']
+                region_total += row['Uses']
+                print(f"{region:<20}{row['Item_Name'][:24]:<25}{row['Uses']:<8}{row['Intruders']:<11}{str(row['Last_Use']):<20}")
+            print(f"{'':<20}{'Region total':<25}{region_total:<8}")
+            print("-"*80)
+            
+            print(f"\nTotal Uses: {sum(row['Uses'] for row in results)}")
+            print("="*80)
+            
+        except Error as e:
+            print(f"\n✗ Error generating report: {e}")
+            print("="*80)
+
+    def prompt_number(self, prompt: str, default, cast=float):
+        """Prompt for a number, returning the default on empty input and None on invalid input"""
+        raw = input(f"{prompt} (default: {default}): ").strip()
+        if not raw:
+            return default
+        try:
+            return cast(raw)
+        except ValueError:
+            print(f"✗ Invalid value '{raw}'. Please enter a number.")
+            return None
+
+    def population_projection(self):
+        """Project populatory foodimal populations per region under many birth-rate and culling scenarios"""
+        print("\n" + "="*80)
+        print("POPULATORY SPECIES POPULATION PROJECTION")
+        print("="*80)
+        
+        try:
+            import numpy as np
+        except ImportError:
+            print("\n✗ NumPy is required for population projections (pip install numpy).")
+            print("="*80)
+            return
+        
+        try:
+            # Load current populatory creature counts per region and species in one query
+            query = "SELECT r.Region_Id, r.Region_Name, ps.Species_Id, fs.Species_Name, ps.Spawn_Per_Birth, COUNT(ifc.Creature_Id) AS Current_Units FROM INDIVIDUAL_FOODIMAL_CREATURES ifc JOIN POPULATORY_SPECIES ps ON ifc.Populatory_Species_Id = ps.Species_Id JOIN FOODIMALS_SPECIES fs ON ps.Species_Id = fs.Species_Id JOIN ISLAND_REGIONS r ON ifc.Location_Id = r.Region_Id GROUP BY r.Region_Id, r.Region_Name, ps.Species_Id, fs.Species_Name, ps.Spawn_Per_Birth"
+            
+            load_start = time.perf_counter()
+            self.cursor.execute(query)
+            results = self.cursor.fetchall()
+            load_time = time.perf_counter() - load_start
+            
+        except Error as e:
+            print(f"\n✗ Error loading population data: {e}")
+            print("="*80)
+            return
+        
+        if not results:
+            print("\n✗ No populatory foodimal creatures found.")
+            print("="*80)
+            return
+        
+        print("\nScenario grid: every birth rate is combined with every cull rate.")
+        print("Birth rate = fraction of units giving birth per generation (each birth adds Spawn_Per_Birth units).")
+        print("Cull rate = fraction of the population removed per generation.")
+        generations = self.prompt_number("Number of generations", 5, int)
+        birth_min = self.prompt_number("Minimum birth rate", 0.0)
+        birth_max = self.prompt_number("Maximum birth rate", 0.5)
+        birth_steps = self.prompt_number("Birth rate steps", 50, int)
+        cull_min = self.prompt_number("Minimum cull rate", 0.0)
+        cull_max = self.prompt_number("Maximum cull rate", 0.9)
+        cull_steps = self.prompt_number("Cull rate steps", 50, int)
+        
+        inputs = [generations, birth_min, birth_max, birth_steps, cull_min, cull_max, cull_steps]
+        if any(value is None for value in inputs):
+            return
+        if generations < 1 or birth_steps < 1 or cull_steps < 1:
+            print("✗ Generations and step counts must be at least 1.")
+            return
+        if not (0 <= birth_min <= birth_max) or not (0 <= cull_min <= cull_max <= 1):
+            print("✗ Rates must satisfy 0 <= min <= max (cull rates at most 1).")
+            return
+        
+        # Dense region x species matrix of current counts
+        region_ids = sorted({row['Region_Id'] for row in results})
+        species_ids = sorted({row['Species_Id'] for row in results})
+        region_index = {region_id: idx for idx, region_id in enumerate(region_ids)}
+        species_index = {species_id: idx for idx, species_id in enumerate(species_ids)}
+        region_names = {row['Region_Id']: row['Region_Name'] for row in results}
+        species_names = {row['Species_Id']: row['Species_Name'] for row in results}
+        
+        counts = np.zeros((len(region_ids), len(species_ids)), dtype=np.float64)
+        spawn = np.zeros(len(species_ids), dtype=np.float64)
+        for row in results:
+            counts[region_index[row['Region_Id']], species_index[row['Species_Id']]] = row['Current_Units']
+            spawn[species_index[row['Species_Id']]] = row['Spawn_Per_Birth']
+        
+        sim_start = time.perf_counter()
+        
+        # Scenario axis: the full birth x cull grid, flattened
+        birth_rates, cull_rates = np.meshgrid(np.linspace(birth_min, birth_max, birth_steps),
+                                              np.linspace(cull_min, cull_max, cull_steps), indexing='ij')
+        birth_rates = birth_rates.ravel()
+        cull_rates = cull_rates.ravel()
+        
+        # Per-generation growth factor for every scenario x species, applied to a scenario x region x species array
+        growth = (1.0 + birth_rates[:, None] * spawn[None, :]) * (1.0 - cull_rates[:, None])
+        population = np.broadcast_to(counts, (len(birth_rates),) + counts.shape).copy()
+        for _ in range(generations):
+            population *= growth[:, None, :]
+        
+        region_totals = population.sum(axis=2)
+        sim_time = time.perf_counter() - sim_start
+        
+        current_totals = counts.sum(axis=1)
+        baseline = int(np.argmin(np.abs(birth_rates - (birth_min + birth_max) / 2) + np.abs(cull_rates - (cull_min + cull_max) / 2)))
+        
+        # Display projected totals per region across all scenarios
+        print(f"\nProjected totals after {generations} generation(s) across {len(birth_rates)} scenarios:")
+        print("-"*80)
+        print(f"{'Region':<25}{'Current':<10}{'Min':<11}{'Median':<11}{'Max':<11}{'Mid Scenario':<12}")
+        print("-"*80)
+        
+        for region_id in region_ids:
+            idx = region_index[region_id]
+            totals = region_totals[:, idx]
+            print(f"{region_names[region_id][:24]:<25}{current_totals[idx]:<10.0f}{totals.min():<11.1f}"
+                  f"{np.median(totals):<11.1f}{totals.max():<11.1f}{totals[baseline]:<12.1f}")
+        
+        print("-"*80)
+        
+        overall = region_totals.sum(axis=1)
+        stable = int((overall <= current_totals.sum()).sum())
+        print(f"\nMid scenario: birth rate {birth_rates[baseline]:.3f}, cull rate {cull_rates[baseline]:.3f}")
+        print(f"Scenarios where the total population does not grow: {stable} of {len(birth_rates)}")
+        
+        # Display species breakdown for the mid scenario
+        print("\n" + "="*80)
+        print("MID SCENARIO BREAKDOWN BY REGION AND SPECIES")
+        print("="*80)
+        print(f"{'Region':<25}{'Species':<25}{'Spawn/Birth':<13}{'Current':<10}{'Projected':<12}")
+        print("-"*80)
+        for row in sorted(results, key=lambda x: (x['Region_Name'], x['Species_Name'])):
+            r_idx = region_index[row['Region_Id']]
+            s_idx = species_index[row['Species_Id']]
+            print(f"{row['Region_Name'][:24]:<25}{row['Species_Name'][:24]:<25}{row['Spawn_Per_Birth']:<13}"
+                  f"{row['Current_Units']:<10}{population[baseline, r_idx, s_idx]:<12.1f}")
+        print("-"*80)
+        
+        print(f"\nData load time: {load_time * 1000:.1f} ms")
+        print(f"Simulation time: {sim_time * 1000:.1f} ms "
+              f"({len(birth_rates)} scenarios x {len(region_ids)} regions x {len(species_ids)} species x {generations} generations)")
+        print("="*80)
+
+    def load_threat_model_data(self):
+        """Load intruder attributes joined with their region's threat into NumPy arrays"""
+        import numpy as np
+        
+        query = "SELECT i.User_Id, i.Name, i.Height, i.Weight, i.Intelligence, i.Location_Id, r.Threat_To_Intruders FROM INTRUDERS i JOIN ISLAND_REGIONS r ON i.Location_Id = r.Region_Id ORDER BY i.User_Id"
+        
+        start = time.perf_counter()
+        self.cursor.execute(query)
+        results = self.cursor.fetchall()
+        
+        height = np.array([row['Height'] for row in results], dtype=np.float64)
+        weight = np.array([row['Weight'] for row in results], dtype=np.float64)
+        intelligence = np.array([row['Intelligence'] for row in results], dtype=np.float64)
+        region = np.array([row['Threat_To_Intruders'] for row in results], dtype=np.float64)
+        
+        # Feature matrix columns follow the order of self.threat_features
+        features = np.column_stack([intelligence, intelligence ** 2, height, weight, weight / height, region]) if results else np.zeros((0, len(self.threat_features)))
+        
+        self.threat_model_data = {
+            'user_ids': [row['User_Id'] for row in results],
+            'names': [row['Name'] for row in results],
+            'location_ids': np.array([row['Location_Id'] for row in results], dtype=np.int64),
+            'features': features,
+            'load_time': time.perf_counter() - start
+        }
+        return self.threat_model_data
+
+    def parse_threat_formula(self, text: str) -> Optional[Dict[str, float]]:
+        """Parse 'feature=weight, feature=weight' into a weight dict"""
+        weights = {}
+        for term in text.split(','):
+            term = term.strip()
+            if not term:
+                continue
+            match = re.fullmatch(r'(\w+)\s*=\s*([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)', term)
+            if not match or match.group(1) not in self.threat_features:
+                print(f"✗ Invalid term '{term}'. Use feature=weight with features: {', '.join(self.threat_features)}")
+                return None
+            weights[match.group(1)] = weights.get(match.group(1), 0.0) + float(match.group(2))
+        if not weights:
+            print("✗ A formula needs at least one feature=weight term.")
+            return None
+        return weights
+
+    def format_threat_formula(self, weights: Dict[str, float]) -> str:
+        """Render a weight dict as a readable formula"""
+        return ' '.join(f"{'+' if weight >= 0 else '-'} {abs(weight):g}*{feature}" for feature, weight in weights.items()).lstrip('+ ')
+
+    def evaluate_threat_formulas(self, formulas: List[Dict], top_n: int):
+        """Score every intruder under every formula in one matrix product and compare rankings"""
+        import numpy as np
+        
+        data = self.threat_model_data
+        features = data['features']
+        feature_names = list(self.threat_features)
+        
+        start = time.perf_counter()
+        # Formula x feature weight matrix; scores is intruder x formula
+        weight_matrix = np.array([[formula['weights'].get(name, 0.0) for name in feature_names] for formula in formulas])
+        scores = features @ weight_matrix.T
+        # Rank 1 = highest threat under that formula
+        order = np.argsort(-scores, axis=0, kind='stable')
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(1, len(features) + 1)[:, None], axis=0)
+        thresholds = np.array([formula['threshold'] if formula['threshold'] is not None else np.inf for formula in formulas])
+        above = (scores > thresholds[None, :]).sum(axis=0)
+        eval_time = time.perf_counter() - start
+        
+        for f_idx, formula in enumerate(formulas):
+            print(f"\n{'='*80}")
+            print(f"FORMULA: {formula['name']}")
+            print(f"{'='*80}")
+            print(f"Threat = {self.format_threat_formula(formula['weights'])}")
+            if formula['threshold'] is not None:
+                print(f"Intruders above threshold {formula['threshold']:g}: {above[f_idx]}")
+            print(f"\n{'Rank':<8}{'User ID':<10}{'Name':<25}{'Score':<18}{'vs ' + formulas[0]['name'][:12]:<17}")
+            print("-"*80)
+            for idx in order[:top_n, f_idx]:
+                change = ranks[idx, 0] - ranks[idx, f_idx]
+                change_text = f"{'+' if change > 0 else ''}{change}" if change else "="
+                print(f"{ranks[idx, f_idx]:<8}{data['user_ids'][idx]:<10}{data['names'][idx][:24]:<25}{scores[idx, f_idx]:<18.2f}{change_text:<17}")
+            print("-"*80)
+            
+            if f_idx > 0:
+                moves = ranks[:, 0] - ranks[:, f_idx]
+                moved = int((moves != 0).sum())
+                print(f"Intruders whose rank changed vs {formulas[0]['name']}: {moved}")
+                if moved:
+                    biggest = int(np.argmax(np.abs(moves)))
+                    print(f"Largest move: {data['names'][biggest]} ({ranks[biggest, 0]} -> {ranks[biggest, f_idx]})")
+        
+        print(f"\nEvaluated {len(formulas)} formula(s) over {len(features)} intruders in {eval_time * 1000:.2f} ms (no extra queries)")
+
+    def threat_modeling(self):
+        """What-if threat re-scoring with user-defined formulas evaluated locally"""
+        print("\n" + "="*80)
+        print("WHAT-IF THREAT MODELING")
+        print("="*80)
+        
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            print("\n✗ NumPy is required for threat modeling (pip install numpy).")
+            print("="*80)
+            return
+        
+        try:
+            if self.threat_model_data is None:
+                self.load_threat_model_data()
+        except Error as e:
+            print(f"\n✗ Error loading intruder data: {e}")
+            print("="*80)
+            return
+        
+        print(f"\nLoaded {len(self.threat_model_data['user_ids'])} intruders in {self.threat_model_data['load_time'] * 1000:.1f} ms")
+        
+        # The first formula is the one hard-coded in the SQL reports and is used as the ranking baseline
+        formulas = [{'name': 'baseline', 'weights': {'int2': 1.0, 'height': 1.0, 'wph': -1.0}, 'threshold': None}]
+        
+        while True:
+            print("\n" + "="*60)
+            print("THREAT MODELING")
+            print("="*60)
+            for idx, formula in enumerate(formulas, 1):
+                threshold = f" (threshold {formula['threshold']:g})" if formula['threshold'] is not None else ""
+                print(f"  [{idx}] {formula['name']}: {self.format_threat_formula(formula['weights'])}{threshold}")
+            print("-"*60)
+            print("1. Add formula")
+            print("2. Remove formula")
+            print("3. Evaluate all formulas")
+            print("4. Reload intruder data")
+            print("5. Back")
+            print("="*60)
+            
+            choice = input("\nEnter your choice (1-5): ").strip()
+            
+            if choice == '1':
+                print("\nAvailable features:")
+                for name, description in self.threat_features.items():
+                    print(f"  {name:<8} {description}")
+                name = input("\nFormula name: ").strip() or f"formula_{len(formulas) + 1}"
+                weights = self.parse_threat_formula(input("Weights (e.g. int2=1, height=1, wph=-1, region=500): "))
+                if weights is None:
+                    continue
+                threshold_input = input("Threat threshold (optional): ").strip()
+                try:
+                    threshold = float(threshold_input) if threshold_input else None
+                except ValueError:
+                    print("✗ Invalid threshold value. Please enter a number.")
+                    continue
+                formulas.append({'name': name, 'weights': weights, 'threshold': threshold})
+                print(f"✓ Formula '{name}' added.")
+            elif choice == '2':
+                try:
+                    idx = int(input("Formula number to remove: ").strip())
+                except ValueError:
+                    print("✗ Please enter a valid number!")
+                    continue
+                if idx == 1:
+                    print("✗ The baseline formula cannot be removed.")
+                elif 1 < idx <= len(formulas):
+                    print(f"✓ Formula '{formulas.pop(idx - 1)['name']}' removed.")
+                else:
+                    print("✗ Invalid formula number!")
+            elif choice == '3':
+                if not self.threat_model_data['user_ids']:
+                    print("\n✗ No intruder data found.")
+                    continue
+                top_n = self.prompt_number("Show top N intruders per formula", 10, int)
+                if top_n is None or top_n < 1:
+                    continue
+                self.evaluate_threat_formulas(formulas, top_n)
+            elif choice == '4':
+                try:
+                    self.load_threat_model_data()
+                    print(f"✓ Reloaded {len(self.threat_model_data['user_ids'])} intruders.")
+                except Error as e:
+                    print(f"\n✗ Error loading intruder data: {e}")
+            elif choice == '5':
+                break
+            else:
+                print("✗ Invalid choice! Please enter a number between 1 and 5.")
+
+    def load_region_species_crosstab(self):
+        """Build the dense region x species count matrix from a single aggregate query"""
+        import numpy as np
+        
+        # Populatory creatures have no Species_Id and are counted under their Populatory_Species_Id
+        query = "SELECT r.Region_Id, r.Region_Name, fs.Species_Id, fs.Species_Name, COALESCE(c.Units, 0) AS Units FROM ISLAND_REGIONS r CROSS JOIN FOODIMALS_SPECIES fs LEFT JOIN (SELECT Location_Id, COALESCE(Species_Id, Populatory_Species_Id) AS Species_Id, COUNT(*) AS Units FROM INDIVIDUAL_FOODIMAL_CREATURES GROUP BY Location_Id, COALESCE(Species_Id, Populatory_Species_Id)) c ON c.Location_Id = r.Region_Id AND c.Species_Id = fs.Species_Id ORDER BY r.Region_Name, r.Region_Id, fs.Species_Name, fs.Species_Id"
+        
+        start = time.perf_counter()
+        self.cursor.execute(query)
+        results = self.cursor.fetchall()
+        
+        regions = {}
+        species = {}
+        for row in results:
+            regions.setdefault(row['Region_Id'], row['Region_Name'])
+            species.setdefault(row['Species_Id'], row['Species_Name'])
+        region_ids = list(regions)
+        species_ids = list(species)
+        region_index = {region_id: idx for idx, region_id in enumerate(region_ids)}
+        species_index = {species_id: idx for idx, species_id in enumerate(species_ids)}
+        
+        matrix = np.zeros((len(region_ids), len(species_ids)), dtype=np.int64)
+        for row in results:
+            matrix[region_index[row['Region_Id']], species_index[row['Species_Id']]] = row['Units']
+        
+        self.crosstab_cache = {
+            'region_ids': region_ids,
+            'region_names': [regions[region_id] for region_id in region_ids],
+            'species_ids': species_ids,
+            'species_names': [species[species_id] for species_id in species_ids],
+            'matrix': matrix,
+            'region_totals': matrix.sum(axis=1),
+            'species_totals': matrix.sum(axis=0),
+            'load_time': time.perf_counter() - start,
+            'loaded_at': time.strftime('%Y-%m-%d %H:%M:%S')
+        }
+        return self.crosstab_cache
+
+    def find_crosstab_label(self, ids: List, names: List[str], label: str) -> Optional[int]:
+        """Resolve a region/species id or name to its row/column index in the cached matrix"""
+        value = input(f"Enter {label} name or ID: ").strip()
+        if not value:
+            print(f"✗ {label.capitalize()} cannot be empty.")
+            return None
+        for idx, (item_id, name) in enumerate(zip(ids, names)):
+            if value == str(item_id) or value.casefold() == name.casefold():
+                return idx
+        print(f"✗ No {label} found matching '{value}'.")
+        return None
+
+    def display_crosstab_matrix(self, crosstab: Dict):
+        """Print the matrix with row and column totals"""
+        matrix = crosstab['matrix']
+        species_names = [name[:10] for name in crosstab['species_names']]
+        
+        print("\n" + "-"*80)
+        print(f"{'Region':<22}" + ''.join(f"{name:>11}" for name in species_names) + f"{'Total':>9}")
+        print("-"*80)
+        for r_idx, region_name in enumerate(crosstab['region_names']):
+            cells = ''.join(f"{count:>11}" for count in matrix[r_idx])
+            print(f"{region_name[:21]:<22}{cells}{crosstab['region_totals'][r_idx]:>9}")
+        print("-"*80)
+        print(f"{'Total':<22}" + ''.join(f"{count:>11}" for count in crosstab['species_totals']) + f"{int(matrix.sum()):>9}")
+        print("-"*80)
+
+    def export_crosstab_csv(self, crosstab: Dict):
+        """Write the matrix with totals to a CSV file"""
+        filename = input("CSV file name (default: region_species_crosstab.csv): ").strip() or "region_species_crosstab.csv"
+        try:
+            with open(filename, 'w', newline='') as csv_file:
+                writer = csv.writer(csv_file)
+                writer.writerow(['Region_Id', 'Region_Name'] + crosstab['species_names'] + ['Total'])
+                for r_idx, (region_id, region_name) in enumerate(zip(crosstab['region_ids'], crosstab['region_names'])):
+                    writer.writerow([region_id, region_name] + [int(count) for count in crosstab['matrix'][r_idx]] + [int(crosstab['region_totals'][r_idx])])
+                writer.writerow(['', 'Total'] + [int(count) for count in crosstab['species_totals']] + [int(crosstab['matrix'].sum())])
+            print(f"✓ Cross-tab exported to {filename}")
+        except OSError as e:
+            print(f"✗ Error writing CSV file: {e}")
+
+    def region_species_crosstab(self):
+        """Region x species foodimal count matrix answered from one cached aggregate query"""
+        print("\n" + "="*80)
+        print("REGION x SPECIES CROSS-TAB")
+        print("="*80)
+        
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            print("\n✗ NumPy is required for the cross-tab report (pip install numpy).")
+            print("="*80)
+            return
+        
+        while True:
+            try:
+                if self.crosstab_cache is None:
+                    self.load_region_species_crosstab()
+            except Error as e:
+                print(f"\n✗ Error generating cross-tab: {e}")
+                print("="*80)
+                return
+            
+            crosstab = self.crosstab_cache
+            
+            print("\n" + "="*60)
+            print(f"CROSS-TAB (loaded {crosstab['loaded_at']} in {crosstab['load_time'] * 1000:.1f} ms)")
+            print("="*60)
+            print("1. Show full matrix")
+            print("2. Look up a single cell")
+            print("3. Region total")
+            print("4. Species total")
+            print("5. Export to CSV")
+            print("6. Refresh from database")
+            print("7. Back")
+            print("="*60)
+            
+            choice = input("\nEnter your choice (1-7): ").strip()
+            
+            if choice == '1':
+                self.display_crosstab_matrix(crosstab)
+                print(f"\nRegions: {len(crosstab['region_ids'])} | Species: {len(crosstab['species_ids'])} | Total Units: {int(crosstab['matrix'].sum())}")
+            elif choice == '2':
+                r_idx = self.find_crosstab_label(crosstab['region_ids'], crosstab['region_names'], 'region')
+                if r_idx is None:
+                    continue
+                s_idx = self.find_crosstab_label(crosstab['species_ids'], crosstab['species_names'], 'species')
+                if s_idx is None:
+                    continue
+                print(f"\n{crosstab['species_names'][s_idx]} in {crosstab['region_names'][r_idx]}: {crosstab['matrix'][r_idx, s_idx]} unit(s)")
+            elif choice == '3':
+                r_idx = self.find_crosstab_label(crosstab['region_ids'], crosstab['region_names'], 'region')
+                if r_idx is not None:
+                    present = int((crosstab['matrix'][r_idx] > 0).sum())
+                    print(f"\n{crosstab['region_names'][r_idx]}: {crosstab['region_totals'][r_idx]} unit(s) across {present} species")
+            elif choice == '4':
+                s_idx = self.find_crosstab_label(crosstab['species_ids'], crosstab['species_names'], 'species')
+                if s_idx is not None:
+                    present = int((crosstab['matrix'][:, s_idx] > 0).sum())
+                    print(f"\n{crosstab['species_names'][s_idx]}: {crosstab['species_totals'][s_idx]} unit(s) across {present} region(s)")
+            elif choice == '5':
+                self.export_crosstab_csv(crosstab)
+            elif choice == '6':
+                self.crosstab_cache = None
+            elif choice == '7':
+                break
+            else:
+                print("✗ Invalid choice! Please enter a number between 1 and 7.")
+
+    # Combat cube dimensions in ROLLUP order, and the key value of a rolled-up dimension
+    CUBE_DIMENSIONS = ('region', 'invention', 'intruder', 'species')
+    CUBE_ALL = '*'
+
+    @plan_samples(scope='ce.Event_Seq > %s AND ce.Event_Seq <= %s')
+    def load_combat_cube(self, cube: Optional[Dict] = None) -> Dict:
+        """Aggregate COMBAT_EVENT into the cube in one ROLLUP pass, or add the events that arrived since the last pass"""
+        start = time.perf_counter()
+        if not self.service_url:
+            # One snapshot for the whole pass, so the check, the new events and the sequence gaps agree
+            self.cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY")
+        try:
+            if cube is not None and not self.combat_cube_consistent(cube):
+                print("\n⚠ Combat events were deleted or archived since the last pass; rebuilding the cube")
+                cube = None
+            if cube is None:
+                cube = {'cells': {}, 'labels': {dimension: {} for dimension in self.CUBE_DIMENSIONS},
+                        'high_water': 0, 'pending': {}, 'refreshes': 0, 'loaded_at': time.strftime('%Y-%m-%d %H:%M:%S')}
+            
+            # Event_Seq is assigned on arrival, unlike Event_Time, which can be typed in or stamped before a late commit
+            self.cursor.execute("SELECT COALESCE(MAX(Event_Seq), 0) AS High_Water FROM COMBAT_EVENT")
+            high_water = self.cursor.fetchone()['High_Water']
+            
+            # Events past the last high-water mark, plus gaps below it whose inserts had not committed yet
+            pending = sorted(cube['pending'])
+            scope = "ce.Event_Seq > %s AND ce.Event_Seq <= %s"
+            scope_params = [cube['high_water'], high_water]
+            if pending:
+                scope = f"({scope} OR ce.Event_Seq IN ({', '.join(['%s'] * len(pending))}))"
+                scope_params += pending
+            
+            # Query to count events per region, invention, intruder and target species, with every ROLLUP subtotal
+            query = f"SELECT Region_Id, Item_Owner_Id, Item_Name, Intruder_Id, Species_Id, COUNT(*) AS Events, GROUPING(Region_Id, Item_Owner_Id, Item_Name, Intruder_Id, Species_Id) AS Rollup_Mask FROM (SELECT ce.Region_Id, ce.Item_Owner_Id, ce.Item_Name, ce.Intruder_Id, COALESCE(ifc.Species_Id, ifc.Populatory_Species_Id) AS Species_Id FROM COMBAT_EVENT ce LEFT JOIN INDIVIDUAL_FOODIMAL_CREATURES ifc ON ce.Creature_Id = ifc.Creature_Id WHERE {scope}) e GROUP BY Region_Id, Item_Owner_Id, Item_Name, Intruder_Id, Species_Id WITH ROLLUP"
+            self.cursor.execute(query, scope_params)
+            rows = self.cursor.fetchall()
+            self.track_combat_cube_gaps(cube, high_water, pending)
+        except Error:
+            if not self.service_url:
+                self.connection.rollback()
+            raise
+        if not self.service_url:
+            self.connection.commit()
+        
+        cells = cube['cells']
+        for row in rows:
+            mask = row['Rollup_Mask']
+            if mask == 0b00111:
+                # Region + invention owner without the item name is not a level of its own
+                continue
+            key = (self.CUBE_ALL if mask & 0b10000 else row['Region_Id'],
+                   self.CUBE_ALL if mask & 0b00100 else (row['Item_Owner_Id'], row['Item_Name']),
+                   self.CUBE_ALL if mask & 0b00010 else row['Intruder_Id'],
+                   self.CUBE_ALL if mask & 0b00001 else row['Species_Id'])
+            cells[key] = cells.get(key, 0) + row['Events']
+        
+        # Labels for members seen for the first time
+        labels = cube['labels']
+        new_members = [set() for _ in self.CUBE_DIMENSIONS]
+        for key in cells:
+            for idx, member in enumerate(key):
+                if member != self.CUBE_ALL and member not in labels[self.CUBE_DIMENSIONS[idx]]:
+                    new_members[idx].add(member)
+        for region_id in new_members[0]:
+            labels['region'][region_id] = self.dictionary_name('regions', region_id) or f"Region {region_id}"
+        for owner_id, item_name in new_members[1]:
+            labels['invention'][(owner_id, item_name)] = f"{item_name} (#{owner_id})"
+        if new_members[2]:
+            intruder_ids = list(new_members[2])
+            self.cursor.execute(f"SELECT User_Id, Name FROM INTRUDERS WHERE User_Id IN ({', '.join(['%s'] * len(intruder_ids))})", intruder_ids)
+            names = {row['User_Id']: row['Name'] for row in self.cursor.fetchall()}
+            for intruder_id in intruder_ids:
+                labels['intruder'][intruder_id] = names.get(intruder_id, f"Intruder {intruder_id}")
+        for species_id in new_members[3]:
+            labels['species'][species_id] = (self.dictionary_name('species', species_id) if species_id is not None else None) or 'Unknown'
+        
+        cube['new_events'] = sum(row['Events'] for row in rows if row['Rollup_Mask'] == 0b11111)
+        cube['high_water'] = high_water
+        cube['refresh_time'] = time.perf_counter() - start
+        cube['refreshes'] += 1
+        self.combat_cube_cache = cube
+        return cube
+
+    def combat_cube_consistent(self, cube: Dict) -> bool:
+        """Whether COMBAT_EVENT still holds exactly the events the cube has counted (deletes and archived partitions lower it)"""
+        pending = sorted(cube['pending'])
+        query = "SELECT COUNT(*) AS Events FROM COMBAT_EVENT WHERE Event_Seq <= %s"
+        if pending:
+            query += f" AND Event_Seq NOT IN ({', '.join(['%s'] * len(pending))})"
+        self.cursor.execute(query, [cube['high_water']] + pending)
+        return self.cursor.fetchone()['Events'] == cube['cells'].get((self.CUBE_ALL,) * 4, 0)
+
+    def track_combat_cube_gaps(self, cube: Dict, high_water: int, pending: List[int]):
+        """Remember Event_Seq values missing below the new high-water mark, which may belong to uncommitted inserts"""
+        seen = []
+        if pending:
+            self.cursor.execute(f"SELECT Event_Seq FROM COMBAT_EVENT WHERE Event_Seq IN ({', '.join(['%s'] * len(pending))})", pending)
+            seen = [row['Event_Seq'] for row in self.cursor.fetchall()]
+        
+        # Query to find runs of unused sequence numbers between the old and the new high-water mark
+        self.cursor.execute("SELECT Previous, Event_Seq FROM (SELECT Event_Seq, LAG(Event_Seq, 1, %s) OVER (ORDER BY Event_Seq) AS Previous FROM COMBAT_EVENT WHERE Event_Seq > %s AND Event_Seq <= %s) s WHERE Event_Seq > Previous + 1",
+                            (cube['high_water'], cube['high_water'], high_water))
+        # Inserts that commit after their gap was dropped (too long or too old) are caught by the count check
+        self.track_sequence_gaps(cube['pending'], seen, [(row['Previous'], row['Event_Seq']) for row in self.cursor.fetchall()])
+
+    def combat_cube_slice(self, cube: Dict, fixed: Dict[int, Any], group_dim: int) -> Dict[Any, int]:
+        """Event counts per member of one dimension with other dimensions fixed, summed from the leaf cells"""
+        totals: Dict[Any, int] = {}
+        for key, events in cube['cells'].items():
+            if self.CUBE_ALL in key or any(key[dim] != member for dim, member in fixed.items()):
+                continue
+            totals[key[group_dim]] = totals.get(key[group_dim], 0) + events
+        return totals
+
+    def print_cube_members(self, cube: Dict, dimension: int, totals: Dict[Any, int], parent_total: int) -> List:
+        """Print numbered members of a dimension by descending event count and return them in that order"""
+        labels = cube['labels'][self.CUBE_DIMENSIONS[dimension]]
+        members = sorted(totals, key=lambda member: (-totals[member], labels.get(member, '')))
+        print("-"*80)
+        print(f"{'#':<6}{self.CUBE_DIMENSIONS[dimension].capitalize():<48}{'Events':>12}{'Share':>12}")
+        print("-"*80)
+        for idx, member in enumerate(members, 1):
+            share = totals[member] / parent_total * 100 if parent_total else 0
+            print(f"{idx:<6}{labels.get(member, str(member))[:47]:<48}{totals[member]:>12}{share:>11.1f}%")
+        print("-"*80)
+        return members
+
+    def pick_cube_member(self, members: List, prompt: str):
+        """Ask for a member by its number in the last printed list; None when the user just presses Enter"""
+        value = input(prompt).strip()
+        if not value:
+            return None
+        if value.isdigit() and 1 <= int(value) <= len(members):
+            return members[int(value) - 1]
+        print(f"✗ Please enter a number between 1 and {len(members)}.")
+        return None
+
+    def drill_down_combat_cube(self, cube: Dict):
+        """Walk region -> invention -> intruder -> target species using the ROLLUP subtotals"""
+        cells = cube['cells']
+        path = []
+        while True:
+            level = len(path)
+            parent_key = tuple(path) + (self.CUBE_ALL,) * (4 - level)
+            parent_total = cells.get(parent_key, 0)
+            # Children of the current path are the cells one level deeper in the rollup hierarchy
+            totals = {key[level]: events for key, events in cells.items()
+                      if key[:level] == tuple(path) and key[level] != self.CUBE_ALL
+                      and all(member == self.CUBE_ALL for member in key[level + 1:])}
+            
+            breadcrumb = ' > '.join(cube['labels'][self.CUBE_DIMENSIONS[idx]].get(member, str(member)) for idx, member in enumerate(path))
+            print(f"\n{breadcrumb or 'All combat events'}: {parent_total} event(s)")
+            members = self.print_cube_members(cube, level, totals, parent_total)
+            
+            if level == 3:
+                input("Press Enter to go back up...")
+                path.pop()
+                continue
+            member = self.pick_cube_member(members, f"Drill into {self.CUBE_DIMENSIONS[level]} # (Enter to go {'back' if not path else 'up'}): ")
+            if member is None:
+                if not path:
+                    return
+                path.pop()
+            else:
+                path.append(member)
+
+    def slice_combat_cube(self, cube: Dict):
+        """Fix any dimension to one member and break the events down along another, from the cached cells"""
+        dimension_names = ', '.join(f"{idx + 1}. {name}" for idx, name in enumerate(self.CUBE_DIMENSIONS))
+        fixed: Dict[int, Any] = {}
+        while True:
+            print(f"\nDimensions: {dimension_names}")
+            if fixed:
+                print("Fixed: " + ', '.join(f"{self.CUBE_DIMENSIONS[dim]} = {cube['labels'][self.CUBE_DIMENSIONS[dim]].get(member, member)}"
+                                            for dim, member in fixed.items()))
+            value = input("Fix a dimension (1-4, Enter when done): ").strip()
+            if not value:
+                break
+            if value not in ('1', '2', '3', '4'):
+                print("✗ Please enter a number between 1 and 4.")
+                continue
+            dim = int(value) - 1
+            totals = self.combat_cube_slice(cube, {d: m for d, m in fixed.items() if d != dim}, dim)
+            members = self.print_cube_members(cube, dim, totals, sum(totals.values()))
+            member = self.pick_cube_member(members, f"Fix {self.CUBE_DIMENSIONS[dim]} to # (Enter for all): ")
+            if member is None:
+                fixed.pop(dim, None)
+            else:
+                fixed[dim] = member
+        
+        value = input("Break down by dimension (1-4): ").strip()
+        if value not in ('1', '2', '3', '4'):
+            print("✗ Please enter a number between 1 and 4.")
+            return
+        group_dim = int(value) - 1
+        start = time.perf_counter()
+        totals = self.combat_cube_slice(cube, fixed, group_dim)
+        elapsed = time.perf_counter() - start
+        self.print_cube_members(cube, group_dim, totals, sum(totals.values()))
+        print(f"{sum(totals.values())} event(s) across {len(totals)} {self.CUBE_DIMENSIONS[group_dim]} member(s), "
+              f"computed in memory in {elapsed * 1000:.2f} ms")
+
+    def combat_cube(self):
+        """Region x invention x intruder x target species combat cube with drill-down and slicing from memory"""
+        print("\n" + "="*80)
+        print("COMBAT CUBE: REGION x INVENTION x INTRUDER x TARGET SPECIES")
+        print("="*80)
+        
+        try:
+            # A cached cube only needs the events that arrived since its last pass
+            cube = self.load_combat_cube(self.combat_cube_cache)
+        except Error as e:
+            print(f"\n✗ Error building combat cube: {e}")
+            print("="*80)
+            return
+        
+        while True:
+            total = cube['cells'].get((self.CUBE_ALL,) * 4, 0)
+            leaves = sum(1 for key in cube['cells'] if self.CUBE_ALL not in key)
+            
+            print("\n" + "="*60)
+            print(f"COMBAT CUBE (built {cube['loaded_at']}, {cube['refreshes']} pass(es), events up to #{cube['high_water']})")
+            print(f"{total} event(s), {leaves} leaf cell(s), {len(cube['cells'])} cell(s) with subtotals")
+            print(f"Last pass: {cube['new_events']} new event(s) in {cube['refresh_time'] * 1000:.1f} ms")
+            print("="*60)
+            print("1. Drill down (region > invention > intruder > species)")
+            print("2. Slice and break down by any dimension")
+            print("3. Refresh with new combat events")
+            print("4. Rebuild from scratch")
+            print("5. Back")
+            print("="*60)
+            
+            choice = input("\nEnter your choice (1-5): ").strip()
+            
+            try:
+                if choice == '1':
+                    self.drill_down_combat_cube(cube)
+                elif choice == '2':
+                    self.slice_combat_cube(cube)
+                elif choice == '3':
+                    cube = self.load_combat_cube(cube)
+                elif choice == '4':
+                    cube = self.load_combat_cube()
+                elif choice == '5':
+                    break
+                else:
+                    print("✗ Invalid choice! Please enter a number between 1 and 5.")
+            except Error as e:
+                print(f"\n✗ Error refreshing combat cube: {e}")
+
+    def find_species_by_food_item(self):
+        """Search for Foodimal Species by Food Item name"""
+        print("\n" + "="*80)
+        print("FIND SPECIES BY FOOD ITEM")
+        print("="*80)
+        
+        food_item_keyword = input("\nEnter food item keyword to search (e.g., 'taco', 'pizza'): ").strip()
+        
+        if not food_item_keyword:
+            print("✗ Search keyword cannot be empty.")
+            return
+        
+        try:
+            # Query to find species that have food items containing the keyword
+            search_pattern = f"%{food_item_keyword}%"
+            
+            results = self.query_result_sets('mw_species_by_food_item', (search_pattern,))[0]
+            
+            if not results:
+                print(f"\n✗ No species found with food item containing '{food_item_keyword}'.")
                 print("="*80)
                 return
             
@@ -721,11 +3387,9 @@ class DatabaseCLI:
         
         try:
             # Query to find inventions with descriptions containing the keyword (case-insensitive)
-            query = "SELECT inv.Item_Owner, inv.Item_Name, d.Description, i.Name AS Owner_Name FROM INVENTIONS inv JOIN DESCRIPTIONS d ON inv.Item_Owner = d.Item_Owner_Id AND inv.Item_Name = d.Item_Name JOIN INTRUDERS i ON inv.Item_Owner = i.User_Id WHERE LOWER(d.Description) LIKE LOWER(%s) ORDER BY inv.Item_Name"
             search_pattern = f"%{description_keyword}%"
             
-            self.cursor.execute(query, (search_pattern,))
-            results = self.cursor.fetchall()
+            results = self.query_result_sets('mw_search_invention_descriptions', (search_pattern,))[0]
             
             if not results:
                 print(f"\n✗ No inventions found with description containing '{description_keyword}'.")
@@ -781,20 +3445,17 @@ class DatabaseCLI:
             return
         
         try:
-            # Query to count foodimals of the specified species
-            query = "SELECT fs.Species_Id, fs.Species_Name, COUNT(ifc.Creature_Id) AS Total_Count FROM FOODIMALS_SPECIES fs LEFT JOIN INDIVIDUAL_FOODIMAL_CREATURES ifc ON fs.Species_Id = ifc.Species_Id WHERE fs.Species_Name = %s GROUP BY fs.Species_Id, fs.Species_Name"
-            
-            self.cursor.execute(query, (species_name,))
-            result = self.cursor.fetchone()
-            
-            if not result:
-                print(f"\n✗ No species found with the name '{species_name}'.")
+            species_id = self.resolve_name('species', species_name, 'species')
+            if species_id is None:
                 print("="*80)
                 return
             
+            # Query to count foodimals of the species by its id
+            result = self.query_result_sets('mw_count_foodimals_by_species', (species_id,))[0][0]
+            
             # Display result
-            print(f"\nSpecies: {result['Species_Name']}")
-            print(f"Species ID: {result['Species_Id']}")
+            print(f"\nSpecies: {self.dictionary_name('species', species_id)}")
+            print(f"Species ID: {species_id}")
             print("-"*80)
             print(f"Total Living Instances: {result['Total_Count']}")
             print("="*80)
@@ -811,9 +3472,7 @@ class DatabaseCLI:
         
         try:
             # First, show available colonies
-            query_colonies = "SELECT c.Colony_Id, r.Region_Name FROM LIVECORP_COLONY c JOIN ISLAND_REGIONS r ON c.Region_Id = r.Region_Id ORDER BY c.Colony_Id"
-            self.cursor.execute(query_colonies)
-            colonies = self.cursor.fetchall()
+            colonies = self.name_dictionary('colonies')['by_id']
             
             if not colonies:
                 print("\n✗ No colonies found in the database.")
@@ -822,8 +3481,8 @@ class DatabaseCLI:
             
             print("\nAvailable Colonies:")
             print("-"*80)
-            for colony in colonies:
-                print(f"Colony ID: {colony['Colony_Id']} - Region: {colony['Region_Name']}")
+            for colony_id, region_id in sorted(colonies.items()):
+                print(f"Colony ID: {colony_id} - Region: {self.dictionary_name('regions', region_id)}")
             print("-"*80)
             
         except Error as e:
@@ -831,27 +3490,29 @@ class DatabaseCLI:
             print("="*80)
             return
         
-        colony_id = input("\nEnter Colony ID: ").strip()
+        colony_id = input("\nEnter Colony ID (or 'all' for every colony): ").strip()
         
         if not colony_id:
             print("✗ Colony ID cannot be empty.")
             return
         
+        if colony_id.lower() == 'all':
+            self.all_colonies_intelligence()
+            return
+        
         try:
-            # Query to calculate average intelligence of intruders associated with the colony
-            query = "SELECT c.Colony_Id, r.Region_Name, AVG(i.Intelligence) AS Average_Intelligence, COUNT(DISTINCT i.User_Id) AS Total_Intruders FROM LIVECORP_COLONY c JOIN ISLAND_REGIONS r ON c.Region_Id = r.Region_Id LEFT JOIN SUSPIOUS_ACTIVITIES sa ON c.Colony_Id = sa.Colony_Id LEFT JOIN INTRUDERS i ON sa.Intruder_Id = i.User_Id WHERE c.Colony_Id = %s GROUP BY c.Colony_Id, r.Region_Name"
-            
-            self.cursor.execute(query, (colony_id,))
-            result = self.cursor.fetchone()
-            
-            if not result:
+            region_id = self.dictionary_name('colonies', int(colony_id)) if colony_id.isdigit() else None
+            if region_id is None:
                 print(f"\n✗ No colony found with ID '{colony_id}'.")
                 print("="*80)
                 return
             
+            # Query to calculate average intelligence of intruders associated with the colony
+            result = self.query_result_sets('mw_colony_intelligence', (int(colony_id),))[0][0]
+            
             # Display result
-            print(f"\nColony ID: {result['Colony_Id']}")
-            print(f"Region: {result['Region_Name']}")
+            print(f"\nColony ID: {colony_id}")
+            print(f"Region: {self.dictionary_name('regions', region_id)}")
             print("-"*80)
             print(f"Total Intruders Associated: {result['Total_Intruders']}")
             
@@ -866,6 +3527,75 @@ class DatabaseCLI:
             print(f"\n✗ Error calculating average intelligence: {e}")
             print("="*80)
 
+    def percentile(self, sorted_values: List[float], fraction: float) -> Optional[float]:
+        """Linearly interpolated percentile of an already sorted list"""
+        if not sorted_values:
+            return None
+        position = (len(sorted_values) - 1) * fraction
+        lower = int(position)
+        upper = min(lower + 1, len(sorted_values) - 1)
+        return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+    def all_colonies_intelligence(self):
+        """Intelligence statistics for every colony from a single grouped query, with sorting and top-N"""
+        sort_options = {'avg': 'Average', 'min': 'Minimum', 'max': 'Maximum', 'median': 'Median',
+                        'p90': 'P90', 'intruders': 'Total_Intruders', 'colony': 'Colony_Id'}
+        sort_by = input(f"\nSort by ({'/'.join(sort_options)}) [avg]: ").strip().lower() or 'avg'
+        if sort_by not in sort_options:
+            print(f"✗ Invalid sort option '{sort_by}'.")
+            return
+        top_n = self.prompt_number("Show top N colonies (0 for all)", 0, cast=int)
+        if top_n is None:
+            return
+        
+        try:
+            # Intelligence values are concatenated per colony for the percentiles; raise the default 1 KB limit
+            self.cursor.execute("SET SESSION group_concat_max_len = 16777216")
+            
+            # Query to aggregate every colony in one pass; the derived table counts each intruder once per colony
+            # and is read from the (Colony_Id, Intruder_Id) index
+            query = "SELECT c.Colony_Id, r.Region_Name, COUNT(i.User_Id) AS Total_Intruders, AVG(i.Intelligence) AS Average, MIN(i.Intelligence) AS Minimum, MAX(i.Intelligence) AS Maximum, GROUP_CONCAT(i.Intelligence ORDER BY i.Intelligence) AS Intelligence_Values FROM LIVECORP_COLONY c JOIN ISLAND_REGIONS r ON c.Region_Id = r.Region_Id LEFT JOIN (SELECT DISTINCT Colony_Id, Intruder_Id FROM SUSPIOUS_ACTIVITIES) sa ON c.Colony_Id = sa.Colony_Id LEFT JOIN INTRUDERS i ON sa.Intruder_Id = i.User_Id GROUP BY c.Colony_Id, r.Region_Name"
+            
+            self.cursor.execute(query)
+            results = self.cursor.fetchall()
+            
+            if not results:
+                print("\n✗ No colonies found in the database.")
+                print("="*80)
+                return
+            
+            for row in results:
+                values = [float(value) for value in row['Intelligence_Values'].split(',')] if row['Intelligence_Values'] else []
+                row['Median'] = self.percentile(values, 0.5)
+                row['P90'] = self.percentile(values, 0.9)
+            
+            # Colonies without intruders sort last; colony ids sort ascending, statistics descending
+            key = sort_options[sort_by]
+            if sort_by == 'colony':
+                results.sort(key=lambda row: row['Colony_Id'])
+            else:
+                results.sort(key=lambda row: (row[key] is None, -(row[key] or 0), row['Colony_Id']))
+            shown = results[:top_n] if top_n > 0 else results
+            
+            def fmt(value):
+                return f"{value:.2f}" if value is not None else "N/A"
+            
+            print("\n" + "-"*80)
+            print(f"{'Colony':<8}{'Region':<20}{'Intruders':<11}{'Average':<10}{'Min':<8}{'Median':<9}{'P90':<9}{'Max':<8}")
+            print("-"*80)
+            for row in shown:
+                region = row['Region_Name'][:18]
+                print(f"{row['Colony_Id']:<8}{region:<20}{row['Total_Intruders']:<11}{fmt(row['Average']):<10}"
+                      f"{row['Minimum'] if row['Minimum'] is not None else 'N/A':<8}{fmt(row['Median']):<9}{fmt(row['P90']):<9}"
+                      f"{row['Maximum'] if row['Maximum'] is not None else 'N/A':<8}")
+            print("-"*80)
+            print(f"\nShowing {len(shown)} of {len(results)} colonies, sorted by {sort_by}")
+            print("="*80)
+            
+        except Error as e:
+            print(f"\n✗ Error calculating colony intelligence: {e}")
+            print("="*80)
+
     def display_intruder_threat_profiles(self):
         """Display Name, Intelligence, and Threat Status of all intruders"""
         print("\n" + "="*80)
@@ -874,10 +3604,7 @@ class DatabaseCLI:
         
         try:
             # Query to get Name, Intelligence, and Threat Status (calculated)
-            query = "SELECT Name, Intelligence, (Intelligence * Intelligence + Height - Weight / Height) AS Threat_Status FROM INTRUDERS ORDER BY Threat_Status DESC"
-            
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
+            results = self.query_result_sets('mw_intruder_threat_profiles')[0]
             
             if not results:
                 print("\n✗ No intruder data found.")
@@ -911,44 +3638,57 @@ class DatabaseCLI:
         print("="*80)
         
         try:
-            # Query to get species with their animal and food item components
-            query = "SELECT fs.Species_Name, a.Name AS Animal_Component, fi.Name AS Food_Component FROM FOODIMALS_SPECIES fs LEFT JOIN ANIMAL a ON fs.Species_Id = a.Species_Id LEFT JOIN FOOD_ITEM fi ON fs.Species_Id = fi.Species_Id ORDER BY fs.Species_Name"
-            
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
+            # Walk species in pages (keyset on name, id) and fetch each page's animals and food items
+            # separately, so the rows fetched grow with the recipe data rather than animals x food items
+            species_recipes = []
+            last_key = None
+            while True:
+                if last_key is None:
+                    self.cursor.execute("SELECT Species_Id, Species_Name FROM FOODIMALS_SPECIES ORDER BY Species_Name, Species_Id LIMIT %s", (self.recipe_page_size,))
+                else:
+                    self.cursor.execute("SELECT Species_Id, Species_Name FROM FOODIMALS_SPECIES WHERE (Species_Name, Species_Id) > (%s, %s) ORDER BY Species_Name, Species_Id LIMIT %s", last_key + (self.recipe_page_size,))
+                page = self.cursor.fetchall()
+                if not page:
+                    break
+                
+                recipes = {row['Species_Id']: {'name': row['Species_Name'], 'animals': [], 'foods': []} for row in page}
+                placeholders = ', '.join(['%s'] * len(page))
+                
+                # Query to get the animal components of this page of species
+                self.cursor.execute(f"SELECT Species_Id, Name FROM ANIMAL WHERE Species_Id IN ({placeholders}) ORDER BY Species_Id, Name", list(recipes))
+                for row in self.cursor.fetchall():
+                    recipes[row['Species_Id']]['animals'].append(row['Name'])
+                
+                # Query to get the food item components of this page of species
+                self.cursor.execute(f"SELECT Species_Id, Name FROM FOOD_ITEM WHERE Species_Id IN ({placeholders}) ORDER BY Species_Id, Name", list(recipes))
+                for row in self.cursor.fetchall():
+                    recipes[row['Species_Id']]['foods'].append(row['Name'])
+                
+                species_recipes.extend(recipes[row['Species_Id']] for row in page)
+                last_key = (page[-1]['Species_Name'], page[-1]['Species_Id'])
+                if len(page) < self.recipe_page_size:
+                    break
             
-            if not results:
+            if not species_recipes:
                 print("\n✗ No species data found.")
                 print("="*80)
                 return
             
-            # Group results by species to combine multiple animals/food items
-            species_recipes = {}
-            for row in results:
-                species = row['Species_Name']
-                if species not in species_recipes:
-                    species_recipes[species] = {'animals': set(), 'foods': set()}
-                
-                if row['Animal_Component']:
-                    species_recipes[species]['animals'].add(row['Animal_Component'])
-                if row['Food_Component']:
-                    species_recipes[species]['foods'].add(row['Food_Component'])
-            
             # Display results
             print("\n" + "-"*80)
             print(f"{'Species Name':<30}{'Recipe (Animal + Food)':<50}")
             print("-"*80)
             
-            for species in sorted(species_recipes.keys()):
-                animals = ', '.join(sorted(species_recipes[species]['animals'])) if species_recipes[species]['animals'] else 'N/A'
-                foods = ', '.join(sorted(species_recipes[species]['foods'])) if species_recipes[species]['foods'] else 'N/A'
+            for recipe_data in species_recipes:
+                animals = ', '.join(recipe_data['animals']) if recipe_data['animals'] else 'N/A'
+                foods = ', '.join(recipe_data['foods']) if recipe_data['foods'] else 'N/A'
                 recipe = f"{animals} + {foods}"
                 
                 # Handle long recipes with wrapping
                 if len(recipe) > 48:
                     recipe = recipe[:45] + "..."
                 
-                print(f"{species:<30}{recipe:<50}")
+                print(f"{recipe_data['name']:<30}{recipe:<50}")
             
             print("-"*80)
             print(f"\nTotal Species: {len(species_recipes)}")
@@ -958,10 +3698,10 @@ class DatabaseCLI:
             print("DETAILED RECIPE BREAKDOWN")
             print("="*80)
             
-            for species in sorted(species_recipes.keys()):
-                print(f"\n{species}:")
-                print(f"  Animal Components: {', '.join(sorted(species_recipes[species]['animals'])) if species_recipes[species]['animals'] else 'None'}")
-                print(f"  Food Components: {', '.join(sorted(species_recipes[species]['foods'])) if species_recipes[species]['foods'] else 'None'}")
+            for recipe_data in species_recipes:
+                print(f"\n{recipe_data['name']}:")
+                print(f"  Animal Components: {', '.join(recipe_data['animals']) if recipe_data['animals'] else 'None'}")
+                print(f"  Food Components: {', '.join(recipe_data['foods']) if recipe_data['foods'] else 'None'}")
             
             print("\n" + "="*80)
             
@@ -989,10 +3729,7 @@ class DatabaseCLI:
         
         try:
             # Query to get all intruders with threat status above threshold
-            query = "SELECT User_Id, Name, Gender, Height, Weight, Intelligence, Time_Of_Entry, Location_Id, (Intelligence * Intelligence + Height - Weight / Height) AS Threat_Status FROM INTRUDERS HAVING Threat_Status > %s ORDER BY Threat_Status DESC"
-            
-            self.cursor.execute(query, (threshold,))
-            results = self.cursor.fetchall()
+            results = self.query_result_sets('mw_high_threat_intruders', (threshold,))[0]
             
             if not results:
                 print(f"\n✗ No intruders found with threat status above {threshold}.")
@@ -1046,9 +3783,7 @@ class DatabaseCLI:
         
         try:
             # First, show available regions
-            query_regions = "SELECT Region_Id, Region_Name FROM ISLAND_REGIONS ORDER BY Region_Name"
-            self.cursor.execute(query_regions)
-            regions = self.cursor.fetchall()
+            regions = self.name_dictionary('regions')['by_id']
             
             if not regions:
                 print("\n✗ No regions found in the database.")
@@ -1057,8 +3792,8 @@ class DatabaseCLI:
             
             print("\nAvailable Regions:")
             print("-"*80)
-            for region in regions:
-                print(f"  {region['Region_Id']}: {region['Region_Name']}")
+            for region_id, name in sorted(regions.items(), key=lambda item: (self.normalize_key_value(item[1]), item[0])):
+                print(f"  {region_id}: {name}")
             print("-"*80)
             
         except Error as e:
@@ -1066,277 +3801,2080 @@ class DatabaseCLI:
             print("="*80)
             return
         
-        region_name = input("\nEnter region name (e.g., 'The Rock Candy Mountains'): ").strip()
+        region_name = input("\nEnter region name (e.g., 'The Rock Candy Mountains'): ").strip()
+        
+        if not region_name:
+            print("✗ Region name cannot be empty.")
+            return
+        
+        try:
+            region_id = self.resolve_name('regions', region_name, 'region')
+            if region_id is None:
+                print("="*80)
+                return
+            region_name = self.dictionary_name('regions', region_id)
+            
+            # Query to find all foodimals in the region by its id
+            result_sets = self.query_result_sets('mw_region_foodimals', (region_id,))
+            results = result_sets[0]
+            
+            if not results:
+                print(f"\n✗ No foodimals found in region '{region_name}'.")
+                print("="*80)
+                return
+            
+            if 'Species_Name' not in results[0]:
+                # Inline query: species names come from the species dictionary
+                for row in results:
+                    row['Species_Name'] = self.dictionary_name('species', row['Species_Id']) or ''
+                results.sort(key=lambda row: (self.normalize_key_value(row['Species_Name']), row['Creature_Id']))
+            
+            # Display results in formatted table
+            print(f"\nFoodimals in '{region_name}':")
+            print("-"*80)
+            print(f"{'Creature ID':<15}{'Species Name':<30}{'Species ID':<15}{'Pop. Species ID':<20}")
+            print("-"*80)
+            
+            for row in results:
+                creature_id = row['Creature_Id']
+                species_name = row['Species_Name'][:29]
+                species_id = row['Species_Id']
+                pop_species_id = row['Populatory_Species_Id'] if row['Populatory_Species_Id'] else 'N/A'
+                print(f"{creature_id:<15}{species_name:<30}{species_id:<15}{str(pop_species_id):<20}")
+            
+            print("-"*80)
+            print(f"\nTotal Foodimals in Region: {len(results)}")
+            
+            # Display species distribution (aggregated by the procedure, or counted here for the inline query)
+            if len(result_sets) > 1:
+                species_count = {row['Species_Name']: row['Count'] for row in result_sets[1]}
+            else:
+                species_count = {}
+                for row in results:
+                    species = row['Species_Name']
+                    species_count[species] = species_count.get(species, 0) + 1
+            
+            print("\n" + "="*80)
+            print("SPECIES DISTRIBUTION IN REGION")
+            print("="*80)
+            print(f"\n{'Species Name':<40}{'Count':<10}")
+            print("-"*80)
+            
+            for species, count in sorted(species_count.items(), key=lambda x: x[1], reverse=True):
+                print(f"{species:<40}{count:<10}")
+            
+            print("\n" + "="*80)
+            
+        except Error as e:
+            print(f"\n✗ Error retrieving foodimals: {e}")
+            print("="*80)
+
+    def list_inventions_against_species(self):
+        """List all inventions effective against a specific foodimal species"""
+        print("\n" + "="*80)
+        print("LIST INVENTIONS EFFECTIVE AGAINST A SPECIES")
+        print("="*80)
+        
+        try:
+            # First, show available species
+            species_list = self.name_dictionary('species')['by_id']
+            
+            if not species_list:
+                print("\n✗ No species found in the database.")
+                print("="*80)
+                return
+            
+            print("\nAvailable Foodimal Species:")
+            print("-"*80)
+            for species_id, name in sorted(species_list.items(), key=lambda item: (self.normalize_key_value(item[1]), item[0])):
+                print(f"  {species_id}: {name}")
+            print("-"*80)
+            
+        except Error as e:
+            print(f"\n✗ Error fetching species: {e}")
+            print("="*80)
+            return
+        
+        species_name = input("\nEnter species name (e.g., 'Cheespider'): ").strip()
+        
+        if not species_name:
+            print("✗ Species name cannot be empty.")
+            return
+        
+        try:
+            species_id = self.resolve_name('species', species_name, 'species')
+            if species_id is None:
+                print("="*80)
+                return
+            species_name = self.dictionary_name('species', species_id)
+            
+            # Query to find all inventions that are weaknesses for the species, by its id
+            results = self.query_result_sets('mw_species_inventions', (species_id,))[0]
+            
+            if not results:
+                print(f"\n✗ No inventions found that are effective against '{species_name}'.")
+                print("="*80)
+                return
+            
+            # Display results in formatted table
+            print(f"\nInventions Effective Against '{species_name}':")
+            print("-"*80)
+            print(f"{'Item Name':<35}{'Owner Name':<25}{'Owner ID':<15}")
+            print("-"*80)
+            
+            for row in results:
+                item_name = row['Item_Name'][:34]
+                owner_name = row['Owner_Name'][:24]
+                owner_id = row['Item_Owner']
+                print(f"{item_name:<35}{owner_name:<25}{owner_id:<15}")
+            
+            print("-"*80)
+            print(f"\nTotal Effective Inventions: {len(results)}")
+            
+            # Display detailed breakdown
+            print("\n" + "="*80)
+            print("DETAILED INVENTORY")
+            print("="*80)
+            
+            for row in results:
+                print(f"\nInvention: {row['Item_Name']}")
+                print(f"  Owner: {row['Owner_Name']} (ID: {row['Item_Owner']})")
+                print(f"  Effective Against: {species_name} (Species ID: {species_id})")
+            
+            print("\n" + "="*80)
+            
+        except Error as e:
+            print(f"\n✗ Error retrieving inventions: {e}")
+            print("="*80)
+
+    def find_most_dangerous_region(self):
+        """Find the island region with the highest threat to intruders"""
+        print("\n" + "="*80)
+        print("FIND THE MOST DANGEROUS REGION")
+        print("="*80)
+        
+        try:
+            # Query to find the region with maximum threat value
+            results = self.query_result_sets('mw_most_dangerous_region')[0]
+            
+            if not results:
+                print("\n✗ No regions found in the database.")
+                print("="*80)
+                return
+            
+            # Display results
+            print("\nMost Dangerous Region(s):")
+            print("-"*80)
+            print(f"{'Region ID':<15}{'Region Name':<30}{'Threat Level':<15}")
+            print("-"*80)
+            
+            for row in results:
+                region_id = row['Region_Id']
+                region_name = row['Region_Name'][:29]
+                threat_level = row['Threat_To_Intruders']
+                print(f"{region_id:<15}{region_name:<30}{threat_level:<15}")
+            
+            print("-"*80)
+            
+            if len(results) > 1:
+                print(f"\nNote: {len(results)} regions share the highest threat level.")
+            
+            print("\nInterpretation: Higher threat values indicate greater danger to intruders.")
+            print("="*80)
+            
+        except Error as e:
+            print(f"\n✗ Error finding most dangerous region: {e}")
+            print("="*80)
+
+    def build_adjacency(self, num_sources: int, edges: List[tuple]) -> tuple:
+        """Pack (source_index, target_index) edges into CSR offset/target arrays"""
+        counts = [0] * (num_sources + 1)
+        for source, _ in edges:
+            counts[source + 1] += 1
+        offsets = array('l', counts)
+        for idx in range(1, len(offsets)):
+            offsets[idx] += offsets[idx - 1]
+        targets = array('l', [0] * len(edges))
+        fill = array('l', offsets[:-1]) if num_sources else array('l')
+        for source, target in sorted(edges):
+            targets[fill[source]] = target
+            fill[source] += 1
+        return offsets, targets
+
+    def graph_neighbors(self, adjacency: tuple, index: int):
+        """Return the target indexes of one node in a CSR adjacency"""
+        offsets, targets = adjacency
+        return targets[offsets[index]:offsets[index + 1]]
+
+    def refresh_relationship_graph(self) -> List[str]:
+        """Build the relationship graph, rebuilding only the parts whose source tables changed"""
+        # component -> tables it is built from
+        components = {
+            'regions': ('ISLAND_REGIONS',),
+            'species': ('FOODIMALS_SPECIES',),
+            'intruders': ('INTRUDERS',),
+            'inventions': ('INVENTIONS', 'INTRUDERS'),
+            'region_species': ('INDIVIDUAL_FOODIMAL_CREATURES', 'ISLAND_REGIONS', 'FOODIMALS_SPECIES'),
+            'species_inventions': ('WEAKNESS', 'FOODIMALS_SPECIES', 'INVENTIONS'),
+            'intruder_inventions': ('COMBAT_EVENT', 'INTRUDERS', 'INVENTIONS')
+        }
+        graph = self.relationship_graph
+        # Advance a copy of the log position, so a failed rebuild is retried on the next visit
+        log = {'log_high': graph['log_high'], 'log_pending': dict(graph['log_pending']), 'log_read_at': graph['log_read_at']} if graph else None
+        changes = self.read_row_changes(log) if log else None
+        if changes is None:
+            # First build, or idle for longer than the change log is kept: read the log from here and rebuild everything
+            self.cursor.execute("SELECT COALESCE(MAX(Change_Id), 0) AS Log_High FROM ROW_CHANGES")
+            log = {'log_high': self.cursor.fetchone()['Log_High'], 'log_pending': {}, 'log_read_at': time.monotonic()}
+            graph = self.relationship_graph = {'event_seq': None}
+            changes = []
+        # Cascaded FK deletes and key updates do not fire the child tables' triggers, so a change also marks its dependents
+        changed = set().union(*(self.dependent_tables(change['Table_Name']) for change in changes))
+        # New events are not logged; COMBAT_EVENT's arrival sequence (which also catches back-dated rows) marks them
+        self.cursor.execute("SELECT MAX(Event_Seq) AS Event_Seq FROM COMBAT_EVENT")
+        event_seq = self.cursor.fetchone()['Event_Seq']
+        if event_seq != graph['event_seq']:
+            changed.add('COMBAT_EVENT')
+        rebuild = [name for name, tables in components.items() if name not in graph or changed.intersection(tables)]
+        
+        if 'regions' in rebuild:
+            self.cursor.execute("SELECT Region_Id, Region_Name FROM ISLAND_REGIONS ORDER BY Region_Id")
+            rows = self.cursor.fetchall()
+            graph['regions'] = {'ids': [row['Region_Id'] for row in rows], 'names': [row['Region_Name'] for row in rows]}
+            graph['regions']['index'] = {region_id: idx for idx, region_id in enumerate(graph['regions']['ids'])}
+        if 'species' in rebuild:
+            self.cursor.execute("SELECT Species_Id, Species_Name FROM FOODIMALS_SPECIES ORDER BY Species_Id")
+            rows = self.cursor.fetchall()
+            graph['species'] = {'ids': [row['Species_Id'] for row in rows], 'names': [row['Species_Name'] for row in rows]}
+            graph['species']['index'] = {species_id: idx for idx, species_id in enumerate(graph['species']['ids'])}
+        if 'intruders' in rebuild:
+            self.cursor.execute("SELECT User_Id, Name FROM INTRUDERS ORDER BY User_Id")
+            rows = self.cursor.fetchall()
+            graph['intruders'] = {'ids': [row['User_Id'] for row in rows], 'names': [row['Name'] for row in rows]}
+            graph['intruders']['index'] = {user_id: idx for idx, user_id in enumerate(graph['intruders']['ids'])}
+        if 'inventions' in rebuild:
+            self.cursor.execute("SELECT Item_Owner, Item_Name FROM INVENTIONS ORDER BY Item_Owner, Item_Name")
+            rows = self.cursor.fetchall()
+            keys = [(row['Item_Owner'], row['Item_Name']) for row in rows]
+            graph['inventions'] = {
+                'keys': keys,
+                'index': {(owner, self.normalize_key_value(name)): idx for idx, (owner, name) in enumerate(keys)},
+                # Owner of each invention as an intruder index
+                'owner': array('l', [graph['intruders']['index'].get(owner, -1) for owner, _ in keys])
+            }
+        
+        def invention_index(owner, name):
+            return graph['inventions']['index'].get((owner, self.normalize_key_value(name)))
+        
+        if 'region_species' in rebuild:
+            query = "SELECT Location_Id, COALESCE(Species_Id, Populatory_Species_Id) AS Species_Id, COUNT(*) AS Units FROM INDIVIDUAL_FOODIMAL_CREATURES GROUP BY Location_Id, COALESCE(Species_Id, Populatory_Species_Id)"
+            self.cursor.execute(query)
+            edges = []
+            units = {}
+            for row in self.cursor.fetchall():
+                r_idx = graph['regions']['index'].get(row['Location_Id'])
+                s_idx = graph['species']['index'].get(row['Species_Id'])
+                if r_idx is not None and s_idx is not None:
+                    edges.append((r_idx, s_idx))
+                    units[(r_idx, s_idx)] = row['Units']
+            graph['region_species'] = self.build_adjacency(len(graph['regions']['ids']), edges)
+            graph['region_species_units'] = units
+        if 'species_inventions' in rebuild:
+            self.cursor.execute("SELECT Species_Id, Item_Inventor_Id, Item_Name FROM WEAKNESS")
+            edges = []
+            for row in self.cursor.fetchall():
+                s_idx = graph['species']['index'].get(row['Species_Id'])
+                i_idx = invention_index(row['Item_Inventor_Id'], row['Item_Name'])
+                if s_idx is not None and i_idx is not None:
+                    edges.append((s_idx, i_idx))
+            graph['species_inventions'] = self.build_adjacency(len(graph['species']['ids']), edges)
+            graph['invention_species'] = self.build_adjacency(len(graph['inventions']['keys']), [(i, s) for s, i in edges])
+        if 'intruder_inventions' in rebuild:
+            self.cursor.execute("SELECT Intruder_Id, Item_Owner_Id, Item_Name, COUNT(*) AS Uses FROM COMBAT_EVENT GROUP BY Intruder_Id, Item_Owner_Id, Item_Name")
+            edges = []
+            uses = {}
+            for row in self.cursor.fetchall():
+                u_idx = graph['intruders']['index'].get(row['Intruder_Id'])
+                i_idx = invention_index(row['Item_Owner_Id'], row['Item_Name'])
+                if u_idx is not None and i_idx is not None:
+                    edges.append((u_idx, i_idx))
+                    uses[(u_idx, i_idx)] = row['Uses']
+            graph['intruder_inventions'] = self.build_adjacency(len(graph['intruders']['ids']), edges)
+            graph['intruder_invention_uses'] = uses
+        
+        graph.update(log, event_seq=event_seq)
+        return rebuild
+
+    def find_graph_node(self, nodes: Dict, label: str) -> Optional[int]:
+        """Resolve a name or id to a node index"""
+        value = input(f"Enter {label} name or ID: ").strip()
+        if not value:
+            print(f"✗ {label.capitalize()} cannot be empty.")
+            return None
+        matches = [idx for idx, (node_id, name) in enumerate(zip(nodes['ids'], nodes['names']))
+                   if value == str(node_id) or value.casefold() == name.casefold()]
+        if not matches:
+            print(f"✗ No {label} found matching '{value}'.")
+            return None
+        if len(matches) > 1:
+            print(f"✗ '{value}' matches several {label}s ({', '.join(str(nodes['ids'][idx]) for idx in matches)}); use the ID.")
+            return None
+        return matches[0]
+
+    def counter_strategy_for_region(self):
+        """Region -> species present -> countering inventions -> owners"""
+        graph = self.relationship_graph
+        r_idx = self.find_graph_node(graph['regions'], 'region')
+        if r_idx is None:
+            return
+        
+        start = time.perf_counter()
+        rows = []
+        for s_idx in self.graph_neighbors(graph['region_species'], r_idx):
+            counters = self.graph_neighbors(graph['species_inventions'], s_idx)
+            if not counters:
+                rows.append((s_idx, None))
+            for i_idx in counters:
+                rows.append((s_idx, i_idx))
+        elapsed = time.perf_counter() - start
+        
+        print(f"\nCounter-Strategy for '{graph['regions']['names'][r_idx]}':")
+        print("-"*80)
+        print(f"{'Species':<22}{'Units':<8}{'Countering Invention':<28}{'Owner':<22}")
+        print("-"*80)
+        for s_idx, i_idx in rows:
+            species = graph['species']['names'][s_idx][:21]
+            units = graph['region_species_units'].get((r_idx, s_idx), 0)
+            if i_idx is None:
+                print(f"{species:<22}{units:<8}{'(no known counter)':<28}{'':<22}")
+                continue
+            owner_id, item_name = graph['inventions']['keys'][i_idx]
+            o_idx = graph['inventions']['owner'][i_idx]
+            owner = graph['intruders']['names'][o_idx] if o_idx >= 0 else str(owner_id)
+            print(f"{species:<22}{units:<8}{item_name[:27]:<28}{owner[:21]:<22}")
+        print("-"*80)
+        
+        if not rows:
+            print("No foodimals present in this region.")
+        uncovered = sum(1 for _, i_idx in rows if i_idx is None)
+        print(f"\nSpecies present: {len({s_idx for s_idx, _ in rows})} | Without a counter: {uncovered}")
+        print(f"Traversal time: {elapsed * 1e6:.1f} µs")
+
+    def counter_strategy_for_intruder(self):
+        """Intruder -> inventions used in combat -> species those inventions counter"""
+        graph = self.relationship_graph
+        u_idx = self.find_graph_node(graph['intruders'], 'intruder')
+        if u_idx is None:
+            return
+        
+        start = time.perf_counter()
+        rows = []
+        for i_idx in self.graph_neighbors(graph['intruder_inventions'], u_idx):
+            countered = self.graph_neighbors(graph['invention_species'], i_idx)
+            rows.append((i_idx, list(countered)))
+        elapsed = time.perf_counter() - start
+        
+        print(f"\nInventions Used by '{graph['intruders']['names'][u_idx]}' and the Species They Counter:")
+        print("-"*80)
+        print(f"{'Invention':<28}{'Owner ID':<10}{'Uses':<8}{'Counters':<34}")
+        print("-"*80)
+        for i_idx, countered in rows:
+            owner_id, item_name = graph['inventions']['keys'][i_idx]
+            uses = graph['intruder_invention_uses'].get((u_idx, i_idx), 0)
+            species = ', '.join(graph['species']['names'][s_idx] for s_idx in countered) or 'None'
+            print(f"{item_name[:27]:<28}{owner_id:<10}{uses:<8}{species[:34]:<34}")
+        print("-"*80)
+        
+        if not rows:
+            print("This intruder has not used any inventions in combat.")
+        print(f"\nTraversal time: {elapsed * 1e6:.1f} µs")
+
+    def relationship_graph_queries(self):
+        """Multi-hop counter-strategy questions answered from an in-memory relationship graph"""
+        print("\n" + "="*80)
+        print("COUNTER-STRATEGY GRAPH QUERIES")
+        print("="*80)
+        
+        while True:
+            try:
+                start = time.perf_counter()
+                rebuilt = self.refresh_relationship_graph()
+                elapsed = time.perf_counter() - start
+            except Error as e:
+                print(f"\n✗ Error building relationship graph: {e}")
+                print("="*80)
+                return
+            
+            graph = self.relationship_graph
+            status = f"rebuilt {', '.join(rebuilt)}" if rebuilt else "up to date"
+            
+            print("\n" + "="*60)
+            print("COUNTER-STRATEGY GRAPH")
+            print("="*60)
+            print(f"Graph {status} ({elapsed * 1000:.1f} ms): {len(graph['regions']['ids'])} regions, "
+                  f"{len(graph['species']['ids'])} species, {len(graph['inventions']['keys'])} inventions, "
+                  f"{len(graph['intruders']['ids'])} intruders")
+            print("-"*60)
+            print("1. Region -> species -> countering inventions -> owners")
+            print("2. Intruder -> used inventions -> species countered")
+            print("3. Back")
+            print("="*60)
+            
+            choice = input("\nEnter your choice (1-3): ").strip()
+            
+            if choice == '1':
+                self.counter_strategy_for_region()
+            elif choice == '2':
+                self.counter_strategy_for_intruder()
+            elif choice == '3':
+                break
+            else:
+                print("✗ Invalid choice! Please enter a number between 1 and 3.")
+
+    def retrieval_operations(self):
+        """Handle retrieval operations submenu"""
+        while True:
+            self.display_retrieval_operations_menu()
+            
+            try:
+                choice = input("\nEnter your choice (1-12): ").strip()
+                
+                if choice == '12':
+                    break
+                
+                with self.read_route():
+                    if choice == '1':
+                        self.run_operation(self.find_species_by_food_item)
+                    elif choice == '2':
+                        self.run_operation(self.search_invention_descriptions)
+                    elif choice == '3':
+                        self.run_operation(self.count_foodimals_by_species)
+                    elif choice == '4':
+                        self.run_operation(self.calculate_average_intruder_intelligence)
+                    elif choice == '5':
+                        self.run_operation(self.find_most_dangerous_region)
+                    elif choice == '6':
+                        self.run_operation(self.display_intruder_threat_profiles)
+                    elif choice == '7':
+                        self.run_operation(self.list_foodimal_species_recipes)
+                    elif choice == '8':
+                        self.run_operation(self.identify_high_threat_intruders)
+                    elif choice == '9':
+                        self.run_operation(self.find_foodimals_in_region)
+                    elif choice == '10':
+                        self.run_operation(self.list_inventions_against_species)
+                    elif choice == '11':
+                        self.run_operation(self.relationship_graph_queries)
+                    else:
+                        print("✗ Invalid choice! Please enter a number between 1 and 12.")
+                    
+            except ValueError:
+                print("✗ Please enter a valid number!")
+
+    def analysis_reports(self):
+        """Handle analysis reports submenu"""
+        while True:
+            self.display_analysis_reports_menu()
+            
+            try:
+                choice = input("\nEnter your choice (1-10): ").strip()
+                
+                if choice == '10':
+                    break
+                
+                with self.read_route():
+                    if choice == '1':
+                        self.run_operation(self.intruder_threat_assessment)
+                    elif choice == '2':
+                        self.run_operation(self.foodimal_defensive_readiness)
+                    elif choice == '3':
+                        self.run_operation(self.combat_effectiveness_analysis)
+                    elif choice == '4':
+                        self.run_operation(self.population_projection)
+                    elif choice == '5':
+                        self.run_operation(self.threat_modeling)
+                    elif choice == '6':
+                        self.run_operation(self.region_species_crosstab)
+                    elif choice == '7':
+                        self.run_operation(self.watch_report)
+                    elif choice == '8':
+                        self.run_operation(self.region_invention_activity)
+                    elif choice == '9':
+                        self.run_operation(self.combat_cube)
+                    else:
+                        print("✗ Invalid choice! Please enter a number between 1 and 10.")
+                    
+            except ValueError:
+                print("✗ Please enter a valid number!")
+
+    # EXPLAIN access types from best to worst, used to detect plan regressions
+    ACCESS_TYPE_RANK = ['system', 'const', 'eq_ref', 'ref', 'fulltext', 'ref_or_null', 'index_merge',
+                        'unique_subquery', 'index_subquery', 'range', 'index', 'ALL']
+
+    # Rows a database needs before its plans are snapshotted or checked; on smaller tables the optimizer
+    # picks full scans it would not use at production size (load a scaled dataset with --bulk-load first)
+    PLAN_MIN_ROWS = {'INTRUDERS': 10000, 'INDIVIDUAL_FOODIMAL_CREATURES': 10000, 'INVENTIONS': 5000,
+                     'SUSPIOUS_ACTIVITIES': 100000, 'COMBAT_EVENT': 100000}
+    # Tables that only exist while an operation runs, so queries on them cannot be explained
+    PLAN_RUNTIME_TABLES = ('bulk_update_changes',)
+
+    @plan_samples(table='INTRUDERS', minimum='10000')
+    def short_plan_tables(self) -> List[str]:
+        """Tables with fewer rows than PLAN_MIN_ROWS, described for the user"""
+        short = []
+        for table, minimum in self.PLAN_MIN_ROWS.items():
+            # Counting stops at the minimum, so large tables are not read in full
+            self.cursor.execute(f"SELECT COUNT(*) AS Row_Count FROM (SELECT 1 FROM {table} LIMIT {minimum}) s")
+            count = self.cursor.fetchone()['Row_Count']
+            if count < minimum:
+                short.append(f"{table} has {count} rows, needs at least {minimum}")
+        return short
+
+    def extract_cli_queries(self, source_path: str) -> Dict[str, str]:
+        """Collect every SELECT, UPDATE and DELETE statement in the CLI source, keyed by <method>:<n>.
+        
+        Fields inside dynamic SQL take their values from the method's @plan_samples; a sample no query uses
+        raises ValueError, so samples cannot silently drift from the code.
+        """
+        with open(source_path) as source_file:
+            tree = ast.parse(source_file.read())
+        
+        # Nested functions (transaction bodies) belong to the method that defines them
+        methods = [node for parent in [tree] + [node for node in tree.body if isinstance(node, ast.ClassDef)]
+                   for node in parent.body if isinstance(node, ast.FunctionDef)]
+        queries = {}
+        unused = []
+        for method in methods:
+            samples = getattr(getattr(DatabaseCLI, method.name, None) or globals().get(method.name), 'plan_samples', {})
+            occurrences = {}
+            
+            def sample(field):
+                # Placeholder lists such as ', '.join(['%s'] * len(ids)) bind a single value
+                if "'%s'" in field or field == 'placeholders':
+                    return '%s'
+                value = samples.get(field)
+                occurrences[field] = occurrences.get(field, 0) + 1
+                if isinstance(value, tuple):
+                    value = value[min(occurrences[field], len(value)) - 1]
+                # An unknown field is left in place, so the query is reported as not explainable
+                return '{' + field + '}' if value is None else value
+            
+            # Pieces of f-strings are only SQL as part of the whole f-string
+            fragments = {id(part) for child in ast.walk(method) if isinstance(child, ast.JoinedStr) for part in child.values}
+            found = []
+            for child in ast.walk(method):
+                if isinstance(child, ast.Constant) and isinstance(child.value, str) and id(child) not in fragments:
+                    text = child.value
+                    if re.match(r'\s*(SELECT|WITH)\b', text, re.I) and '{' in text:
+                        # str.format() templates such as "... WHERE {where}"
+                        text = re.sub(r'\{(\w+)\}', lambda match: sample(match.group(1)), text)
+                elif isinstance(child, ast.JoinedStr):
+                    text = ''.join(part.value if isinstance(part, ast.Constant) else sample(ast.unparse(part.value))
+                                   for part in child.values)
+                else:
+                    continue
+                sql = ' '.join(text.split())
+                if not (re.match(r'(SELECT|WITH)\b.*\bFROM\b', sql, re.I) or re.match(r'UPDATE\b.*\bSET\b', sql, re.I)
+                        or re.match(r'DELETE\b.*\bWHERE\b', sql, re.I)):
+                    continue
+                if any(re.search(rf'\b{table}\b', sql) for table in self.PLAN_RUNTIME_TABLES):
+                    continue
+                found.append((child.lineno, child.col_offset, sql))
+            for n, (_, _, sql) in enumerate(sorted(found), 1):
+                queries[f"{method.name}:{n}"] = sql
+            unused.extend(f"{method.name}: {field}" for field in samples if field not in occurrences)
+        if unused:
+            raise ValueError(f"@plan_samples fields not used by any query: {', '.join(unused)}")
+        return queries
+
+    def normalize_plan(self, plan: Dict) -> Dict:
+        """Reduce an EXPLAIN FORMAT=JSON plan to access type, key and row estimate per table plus filesort/temporary flags"""
+        tables = []
+        flags = {'filesort': False, 'temporary': False}
+        
+        def walk(node):
+            if isinstance(node, dict):
+                table = node.get('table')
+                if isinstance(table, dict) and 'table_name' in table:
+                    tables.append({'table': table['table_name'],
+                                   'access_type': table.get('access_type'),
+                                   'key': table.get('key'),
+                                   'rows': int(table.get('rows_examined_per_scan', 0))})
+                if node.get('using_filesort'):
+                    flags['filesort'] = True
+                if node.get('using_temporary_table'):
+                    flags['temporary'] = True
+                for value in node.values():
+                    walk(value)
+            elif isinstance(node, list):
+                for value in node:
+                    walk(value)
+        
+        walk(plan)
+        return {'tables': tables, **flags}
+
+    def explain_query(self, sql: str) -> Dict:
+        """EXPLAIN a CLI query with LIMIT/OFFSET placeholders bound to 1 and every other %s to '1'"""
+        bound = re.sub(r'\b(LIMIT|OFFSET)\s+%s(\s*,\s*%s)?', lambda match: f"{match.group(1)} 1" + (", 1" if match.group(2) else ""), sql, flags=re.I)
+        bound = bound.replace('%s', "'1'").replace('%%', '%')
+        self.cursor.execute(f"EXPLAIN FORMAT=JSON {bound}")
+        row = self.cursor.fetchone()
+        return self.normalize_plan(json.loads(list(row.values())[0]))
+
+    def compare_plans(self, old: Dict, new: Dict) -> tuple:
+        """Return (regressions, notes) between a stored plan and the current one"""
+        regressions, notes = [], []
+        rank = {access_type: i for i, access_type in enumerate(self.ACCESS_TYPE_RANK)}
+        
+        old_tables = {}
+        for entry in old['tables']:
+            old_tables.setdefault(entry['table'], []).append(entry)
+        for entry in new['tables']:
+            previous = old_tables.get(entry['table'])
+            if not previous:
+                notes.append(f"new table access {entry['table']} ({entry['access_type']})")
+                continue
+            before = previous.pop(0)
+            table = entry['table']
+            if rank.get(entry['access_type'], len(rank)) > rank.get(before['access_type'], len(rank)):
+                regressions.append(f"{table}: access {before['access_type']} -> {entry['access_type']}")
+            elif entry['access_type'] != before['access_type']:
+                notes.append(f"{table}: access {before['access_type']} -> {entry['access_type']}")
+            if before['key'] and not entry['key']:
+                regressions.append(f"{table}: no longer uses key {before['key']}")
+            elif entry['key'] != before['key']:
+                notes.append(f"{table}: key {before['key']} -> {entry['key']}")
+            if entry['rows'] > max(2 * before['rows'], before['rows'] + 1000):
+                regressions.append(f"{table}: rows estimate {before['rows']} -> {entry['rows']}")
+        
+        for flag, label in (('filesort', 'filesort'), ('temporary', 'temporary table')):
+            if new[flag] and not old[flag]:
+                regressions.append(f"now uses {label}")
+            elif old[flag] and not new[flag]:
+                notes.append(f"no longer uses {label}")
+        return regressions, notes
+
+    def plan_snapshot(self, snapshot_path: str, check: bool) -> bool:
+        """Write (or check against) normalized EXPLAIN plans for every query in the CLI"""
+        print("\n" + "="*80)
+        print("QUERY PLAN CHECK" if check else "QUERY PLAN SNAPSHOT")
+        print("="*80)
+        
+        try:
+            queries = self.extract_cli_queries(os.path.abspath(__file__))
+            short = self.short_plan_tables()
+        except (OSError, ValueError, Error) as e:
+            print(f"✗ {e}")
+            return False
+        if short:
+            print("✗ The database is too small for representative plans:")
+            for problem in short:
+                print(f"  {problem}")
+            print("Load a scaled dataset first, e.g. with --bulk-load (see README).")
+            return False
+        
+        snapshot = {}
+        if check:
+            try:
+                with open(snapshot_path) as snapshot_file:
+                    snapshot = json.load(snapshot_file)
+            except (OSError, ValueError) as e:
+                print(f"✗ Could not read snapshot {snapshot_path}: {e}")
+                return False
+        
+        plans = {}
+        degraded = 0
+        for name, sql in sorted(queries.items()):
+            try:
+                plan = self.explain_query(sql)
+            except Error as e:
+                plan = {'error': str(e)}
+            plans[name] = {'sql': sql, 'plan': plan}
+            
+            if not check:
+                status = f"⚠ not explainable: {plan['error']}" if 'error' in plan else f"{len(plan['tables'])} table(s)"
+                print(f"  {name:<45} {status}")
+                continue
+            
+            stored = snapshot.get(name)
+            if stored is None:
+                print(f"  ⚠ {name}: not in snapshot")
+                continue
+            if stored['sql'] != sql:
+                # The stored plan says nothing about the new text, so it must be reviewed and re-snapshotted
+                degraded += 1
+                print(f"  ✗ {name}: query text changed; review its plan and re-run --plan-snapshot")
+                continue
+            if 'error' in plan:
+                if 'error' not in stored['plan']:
+                    degraded += 1
+                    print(f"  ✗ {name}: EXPLAIN failed: {plan['error']}")
+                continue
+            if 'error' in stored['plan']:
+                print(f"  ⚠ {name}: now explainable, re-run --plan-snapshot")
+                continue
+            
+            regressions, notes = self.compare_plans(stored['plan'], plan)
+            if regressions:
+                degraded += 1
+                print(f"  ✗ {name}: " + '; '.join(regressions))
+            else:
+                print(f"  ✓ {name}" + (f" ({'; '.join(notes)})" if notes else ""))
+        
+        if check:
+            for name in sorted(set(snapshot) - set(queries)):
+                print(f"  ⚠ {name}: in snapshot but no longer in the CLI")
+            print("="*80)
+            if degraded:
+                print(f"✗ {degraded} of {len(queries)} query plans degraded")
+                return False
+            print(f"✓ No plan regressions in {len(queries)} queries")
+            return True
+        
+        try:
+            with open(snapshot_path, 'w') as snapshot_file:
+                json.dump(plans, snapshot_file, indent=2, sort_keys=True)
+                snapshot_file.write('\n')
+        except OSError as e:
+            print(f"✗ Could not write snapshot {snapshot_path}: {e}")
+            return False
+        print("="*80)
+        print(f"✓ Stored plans for {len(queries)} queries in {snapshot_path}")
+        return True
+
+    def parse_schema_foreign_keys(self, schema_path: str) -> Dict[str, set]:
+        """Parse schema.sql into table -> referenced tables, including the deferred ALTER TABLE foreign keys"""
+        with open(schema_path) as schema_file:
+            sql = re.sub(r'--[^\n]*', '', schema_file.read())
+        
+        dependencies = {}
+        for match in re.finditer(r'CREATE\s+TABLE\s+(\w+)\s*\((.*?)\)\s*;', sql, re.IGNORECASE | re.DOTALL):
+            table = match.group(1).upper()
+            dependencies[table] = {ref.upper() for ref in re.findall(r'REFERENCES\s+(\w+)', match.group(2), re.IGNORECASE)}
+        for table, ref in re.findall(r'ALTER\s+TABLE\s+(\w+)\s+ADD\s+(?:CONSTRAINT\s+\w+\s+)?FOREIGN\s+KEY\s*\([^)]*\)\s*REFERENCES\s+(\w+)', sql, re.IGNORECASE):
+            dependencies.setdefault(table.upper(), set()).add(ref.upper())
+        
+        for table in dependencies:
+            dependencies[table].discard(table)
+        return dependencies
+
+    def topological_levels(self, dependencies: Dict[str, set]) -> List[List[str]]:
+        """Group tables into levels; every table only references tables in earlier levels"""
+        remaining = {table: set(refs) & set(dependencies) for table, refs in dependencies.items()}
+        levels = []
+        while remaining:
+            ready = sorted(table for table, refs in remaining.items() if not refs)
+            if not ready:
+                raise ValueError(f"foreign key cycle between {', '.join(sorted(remaining))}")
+            levels.append(ready)
+            for table in ready:
+                del remaining[table]
+            for refs in remaining.values():
+                refs.difference_update(ready)
+        return levels
+
+    def split_sql_statements(self, sql_path: str) -> List[str]:
+        """Split a .sql file into statements, dropping comments and following mysql client DELIMITER lines"""
+        with open(sql_path) as sql_file:
+            sql = re.sub(r'--[^\n]*', '', sql_file.read())
+        # Alternates statement text and the delimiter that applies to the text after it
+        parts = re.split(r'^[ \t]*DELIMITER[ \t]+(\S+)[ \t]*$', sql, flags=re.IGNORECASE | re.MULTILINE)
+        statements = []
+        for idx in range(0, len(parts), 2):
+            delimiter = parts[idx - 1] if idx else ';'
+            statements.extend(statement.strip() for statement in parts[idx].split(delimiter) if statement.strip())
+        return statements
+
+    @plan_samples(table='INTRUDERS')
+    def export_data(self, data_dir: str):
+        """Dump every table to DATA_DIR/<TABLE>.csv in the format read by --bulk-load"""
+        os.makedirs(data_dir, exist_ok=True)
+        cursor = self.connection.cursor()
+        
+        print(f"\n{'Table':<32}{'Rows':<12}{'Seconds':<10}")
+        print("-"*60)
+        for table in self.tables:
+            start = time.perf_counter()
+            cursor.execute(f"SELECT * FROM {table}")
+            rows = self.write_csv_export(cursor, os.path.join(data_dir, f"{table}.csv"))
+            print(f"{table:<32}{rows:<12}{time.perf_counter() - start:<10.2f}")
+        cursor.close()
+        print("-"*60)
+        print(f"\n✓ Exported {len(self.tables)} tables to {data_dir}")
+
+    def bulk_load_table(self, pool, table: str, csv_path: str, batch_size: int) -> Dict:
+        """Load one table with FK/unique checks disabled, using LOAD DATA or batched multi-row INSERTs"""
+        start = time.perf_counter()
+        connection = pool.get_connection()
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SET SESSION foreign_key_checks = 0")
+            cursor.execute("SET SESSION unique_checks = 0")
+            
+            with open(csv_path, newline='') as csv_file:
+                columns = next(csv.reader(csv_file))
+            column_list = ', '.join(columns)
+            
+            try:
+                cursor.execute(
+                    f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+                    "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '\\\\' "
+                    f"LINES TERMINATED BY '\\n' IGNORE 1 LINES ({column_list})",
+                    (os.path.abspath(csv_path),)
+                )
+                rows = cursor.rowcount
+                method = 'LOAD DATA'
+            except Error:
+                # local_infile disabled on the client or server: fall back to multi-row INSERTs
+                connection.rollback()
+                rows = 0
+                method = 'INSERT'
+                row_placeholder = '(' + ', '.join(['%s'] * len(columns)) + ')'
+                with open(csv_path, newline='') as csv_file:
+                    reader = csv.reader(csv_file)
+                    next(reader)
+                    batch = []
+                    for record in reader:
+                        batch.append([None if value == '\\N' else value.replace('\\\\', '\\') for value in record])
+                        if len(batch) >= batch_size:
+                            cursor.execute(f"INSERT INTO {table} ({column_list}) VALUES " + ', '.join([row_placeholder] * len(batch)),
+                                           [value for row in batch for value in row])
+                            rows += len(batch)
+                            batch = []
+                    if batch:
+                        cursor.execute(f"INSERT INTO {table} ({column_list}) VALUES " + ', '.join([row_placeholder] * len(batch)),
+                                       [value for row in batch for value in row])
+                        rows += len(batch)
+            
+            connection.commit()
+            return {'table': table, 'rows': rows, 'seconds': time.perf_counter() - start, 'method': method, 'error': None}
+        except (Error, OSError) as e:
+            connection.rollback()
+            return {'table': table, 'rows': 0, 'seconds': time.perf_counter() - start, 'method': '-', 'error': str(e)}
+        finally:
+            cursor.close()
+            connection.close()
+
+    @plan_samples(table='INVENTIONS', ref_table='INTRUDERS', join='c.Item_Owner = p.User_Id', not_null='c.Item_Owner IS NOT NULL', ref_key='User_Id')
+    def validate_loaded_foreign_keys(self, cursor) -> List[str]:
+        """Re-validate every inline foreign key with an anti-join after a load with checks disabled"""
+        problems = []
+        for table, fks in self.table_foreign_keys.items():
+            for fk_cols, ref_table, ref_cols in fks:
+                join = ' AND '.join(f"c.{col} = p.{ref_col}" for col, ref_col in zip(fk_cols, ref_cols))
+                not_null = ' AND '.join(f"c.{col} IS NOT NULL" for col in fk_cols)
+                ref_key = ref_cols[0]
+                cursor.execute(f"SELECT COUNT(*) FROM {table} c LEFT JOIN {ref_table} p ON {join} WHERE {not_null} AND p.{ref_key} IS NULL")
+                orphans = cursor.fetchone()[0]
+                if orphans:
+                    problems.append(f"{table}({', '.join(fk_cols)}) -> {ref_table}: {orphans} orphan row(s)")
+        return problems
+
+    def bulk_load(self, data_dir: str, schema_path: str, workers: int, batch_size: int, assume_yes: bool = False):
+        """Rebuild the database from schema.sql and per-table CSV files, loading independent tables in parallel"""
+        from concurrent.futures import ThreadPoolExecutor
+        load_mysql_connector()
+        from mysql.connector import pooling
+        
+        print("\n" + "="*80)
+        print("PARALLEL BULK LOAD")
+        print("="*80)
+        
+        try:
+            levels = self.topological_levels(self.parse_schema_foreign_keys(schema_path))
+            statements = self.split_sql_statements(schema_path)
+        except (OSError, ValueError) as e:
+            print(f"\n✗ Error reading schema: {e}")
+            return False
+        
+        print("\nLoad order (tables in the same level load concurrently):")
+        for idx, level in enumerate(levels):
+            print(f"  Level {idx}: {', '.join(level)}")
+        
+        # Foreign keys added with ALTER TABLE are applied after the load, which also validates them
+        deferred = [statement for statement in statements if re.match(r'ALTER\s+TABLE\s+\w+\s+ADD\s+(CONSTRAINT\s+\w+\s+)?FOREIGN\s+KEY', statement, re.IGNORECASE)]
+        # Change-log triggers are created last too, so the load itself does not log every row
+        triggers = [statement for statement in statements if re.match(r'CREATE\s+TRIGGER', statement, re.IGNORECASE)]
+        
+        # schema.sql names mini_world_db; build the configured database instead, which is the one the pool loads into
+        settings = self.connection_settings
+        database = f"`{settings['database'].replace('`', '``')}`"
+        create = [re.sub(r'^(DROP\s+DATABASE\s+IF\s+EXISTS|CREATE\s+DATABASE|USE)\s+`?\w+`?', lambda match: f"{match.group(1)} {database}",
+                         statement, flags=re.IGNORECASE)
+                  for statement in statements if statement not in deferred and statement not in triggers]
+        
+        print(f"\n⚠ This drops database {database} on {settings['host']} and rebuilds it from {schema_path} and {data_dir}.")
+        if not assume_yes and input("Continue? (yes/no): ").strip().lower() != 'yes':
+            print("✗ Bulk load cancelled.")
+            return False
+        
+        total_start = time.perf_counter()
+        try:
+            admin = load_mysql_connector().connect(host=settings['host'], user=settings['user'], password=settings['password'])
+            admin_cursor = admin.cursor()
+            for statement in create:
+                admin_cursor.execute(statement)
+            admin_cursor.execute(f"USE {database}")
+        except Error as e:
+            print(f"\n✗ Error creating schema: {e}")
+            return False
+        
+        try:
+            pool = pooling.MySQLConnectionPool(pool_name="bulk_load", pool_size=max(1, min(workers, 32)),
+                                               allow_local_infile=True, **settings)
+        except Error as e:
+            print(f"\n✗ Error creating connection pool: {e}")
+            admin.close()
+            return False
+        
+        results = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for level in levels:
+                futures = []
+                for table in level:
+                    csv_path = os.path.join(data_dir, f"{table}.csv")
+                    if os.path.exists(csv_path):
+                        futures.append(executor.submit(self.bulk_load_table, pool, table, csv_path, batch_size))
+                    else:
+                        results.append({'table': table, 'rows': 0, 'seconds': 0.0, 'method': 'skipped', 'error': None})
+                results.extend(future.result() for future in futures)
+        load_time = time.perf_counter() - total_start
+        
+        # Rebuild index statistics, then apply deferred FKs and re-validate the inline ones
+        problems = []
+        try:
+            finish_start = time.perf_counter()
+            admin_cursor.execute(f"ANALYZE TABLE {', '.join(self.tables)}")
+            admin_cursor.fetchall()
+            admin_cursor.execute("SET SESSION foreign_key_checks = 1")
+            for statement in deferred:
+                try:
+                    admin_cursor.execute(statement)
+                except Error as e:
+                    problems.append(f"{statement.split(' ADD ')[0]}: {e}")
+            problems.extend(self.validate_loaded_foreign_keys(admin_cursor))
+            for statement in triggers:
+                admin_cursor.execute(statement)
+            # Same horizon as --maintain-partitions, in case schema.sql ran in an earlier month than the load finished
+            self.ensure_future_partitions(admin_cursor)
+            finish_time = time.perf_counter() - finish_start
+        except Error as e:
+            print(f"\n✗ Error finalizing load: {e}")
+            return False
+        finally:
+            admin.close()
+        
+        print("\n" + "-"*80)
+        print(f"{'Table':<32}{'Method':<12}{'Rows':<12}{'Seconds':<10}{'Rows/sec':<14}")
+        print("-"*80)
+        for result in results:
+            rate = result['rows'] / result['seconds'] if result['seconds'] > 0 else 0
+            print(f"{result['table']:<32}{result['method']:<12}{result['rows']:<12}{result['seconds']:<10.2f}{rate:<14.0f}")
+            if result['error']:
+                print(f"  ✗ {result['error']}")
+        print("-"*80)
+        
+        total_rows = sum(result['rows'] for result in results)
+        print(f"\nTotal rows loaded: {total_rows} in {load_time:.2f}s ({total_rows / load_time if load_time else 0:.0f} rows/sec)")
+        print(f"Index rebuild and constraint validation: {finish_time:.2f}s")
+        
+        failed = [result for result in results if result['error']]
+        if problems or failed:
+            print("\n✗ Load finished with problems:")
+            for problem in problems:
+                print(f"  {problem}")
+            for result in failed:
+                print(f"  {result['table']}: load failed")
+            return False
+        
+        print("\n✓ All constraints validated successfully!")
+        return True
+
+    def bulk_update(self, table: str, csv_path: str, batch_size: int, rollback_path: Optional[str] = None) -> bool:
+        """Apply a CSV of (primary key, new values) rows through a temporary table, one joined UPDATE per chunk.
+        
+        The previous values of every changed row are written to a rollback CSV with the same columns, which
+        can itself be applied with --bulk-update to undo the change.
+        """
+        table = table.upper()
+        if table not in self.table_columns:
+            print(f"\n✗ Unknown table {table}")
+            return False
+        if table not in self.primary_keys:
+            print(f"\n✗ {table} has no primary key in schema.sql, so its rows cannot be matched for a bulk update")
+            return False
+        
+        key_columns = list(self.primary_keys[table])
+        try:
+            with open(csv_path, newline='') as csv_file:
+                header = next(csv.reader(csv_file))
+        except (OSError, StopIteration) as e:
+            print(f"\n✗ Could not read a header from {csv_path}: {e}")
+            return False
+        unknown = [col for col in header if col not in self.table_columns[table]]
+        missing = [col for col in key_columns if col not in header]
+        set_columns = [col for col in header if col not in key_columns]
+        if unknown or missing or not set_columns or len(set(header)) != len(header):
+            print(f"\n✗ {csv_path} must have one column per primary key column of {table} ({', '.join(key_columns)}) "
+                  f"and at least one other column of the table")
+            if unknown:
+                print(f"  Unknown columns: {', '.join(unknown)}")
+            if missing:
+                print(f"  Missing key columns: {', '.join(missing)}")
+            return False
+        
+        rollback_path = rollback_path or os.path.splitext(csv_path)[0] + '.rollback.csv'
+        columns = key_columns + set_columns
+        column_list = ', '.join(columns)
+        key_join = ' AND '.join(f"t.{col} = c.{col}" for col in key_columns)
+        unchanged = ' AND '.join(f"t.{col} <=> c.{col}" for col in set_columns)
+        cursor = self.connection.cursor()
+        start = time.perf_counter()
+        matched = changed = 0
+        
+        print("\n" + "="*80)
+        print(f"BULK UPDATE {table} FROM {csv_path}")
+        print("="*80)
+        print(f"Key: {', '.join(key_columns)}    Columns updated: {', '.join(set_columns)}")
+        
+        try:
+            # Staging table typed like the target columns, keyed like the target so duplicate keys are rejected
+            cursor.execute("SELECT COLUMN_NAME, COLUMN_TYPE FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s", (table,))
+            column_types = dict(cursor.fetchall())
+            definitions = ', '.join(f"{col} {column_types[col]}" for col in columns)
+            cursor.execute("DROP TEMPORARY TABLE IF EXISTS bulk_update_changes")
+            cursor.execute(f"CREATE TEMPORARY TABLE bulk_update_changes (Chunk_No INT NOT NULL, {definitions}, "
+                           f"PRIMARY KEY ({', '.join(key_columns)}), INDEX (Chunk_No))")
+            
+            # Load the change file in batches, validating the new values before they are staged
+            row_placeholder = '(' + ', '.join(['%s'] * (len(columns) + 1)) + ')'
+            staged = 0
+            with open(csv_path, newline='') as csv_file:
+                reader = csv.reader(csv_file)
+                next(reader)
+                while True:
+                    batch = [[None if value == '\\N' else value.replace('\\\\', '\\') for value in record]
+                             for record in itertools.islice(reader, batch_size)]
+                    if not batch:
+                        break
+                    short = [staged + idx + 2 for idx, record in enumerate(batch) if len(record) != len(header)]
+                    if short:
+                        print(f"\n✗ Line(s) {', '.join(map(str, short[:10]))} of {csv_path} do not have {len(header)} fields")
+                        return False
+                    rows = [[row[header.index(col)] for col in columns] for row in batch]
+                    errors = self.validate_rows(table, set_columns, [row[len(key_columns):] for row in rows], partial=True)
+                    if errors:
+                        self.report_validation_errors(errors, [f"line {staged + idx + 2}" for idx in range(len(rows))])
+                        return False
+                    chunk_no = staged // batch_size
+                    cursor.execute(f"INSERT INTO bulk_update_changes (Chunk_No, {column_list}) VALUES " + ', '.join([row_placeholder] * len(rows)),
+                                   [value for row in rows for value in [chunk_no] + row])
+                    staged += len(rows)
+            self.connection.commit()
+            print(f"✓ Staged {staged} change(s) in {time.perf_counter() - start:.2f}s")
+            
+            with open(rollback_path, 'w', newline='') as rollback_file:
+                writer = csv.writer(rollback_file, lineterminator='\n')
+                writer.writerow(columns)
+                for chunk_no in range((staged + batch_size - 1) // batch_size):
+                    def work():
+                        # Lock the chunk's target rows and keep the values they had before the update
+                        cursor.execute(f"SELECT {', '.join('t.' + col for col in columns)}, {unchanged} AS Unchanged "
+                                       f"FROM {table} t JOIN bulk_update_changes c ON {key_join} WHERE c.Chunk_No = %s FOR UPDATE", (chunk_no,))
+                        previous = cursor.fetchall()
+                        cursor.execute(f"UPDATE {table} t JOIN bulk_update_changes c ON {key_join} "
+                                       f"SET {', '.join(f't.{col} = c.{col}' for col in set_columns)} "
+                                       f"WHERE c.Chunk_No = %s AND NOT ({unchanged})", (chunk_no,))
+                        return previous
+                    
+                    previous = self.run_transaction(work)
+                    changed_rows = [row[:-1] for row in previous if not row[-1]]
+                    writer.writerows(self.csv_export_row(row) for row in changed_rows)
+                    rollback_file.flush()
+                    matched += len(previous)
+                    changed += len(changed_rows)
+                    print(f"  Chunk {chunk_no + 1}: {len(previous)} matched, {len(changed_rows)} changed")
+            
+            cursor.execute(f"SELECT {', '.join('c.' + col for col in key_columns)} FROM bulk_update_changes c "
+                           f"LEFT JOIN {table} t ON {key_join} WHERE t.{key_columns[0]} IS NULL LIMIT 5")
+            unmatched_examples = cursor.fetchall()
+            cursor.execute("DROP TEMPORARY TABLE bulk_update_changes")
+        except Error as e:
+            self.connection.rollback()
+            if getattr(e, 'errno', None) == 1062:
+                print(f"\n✗ The change file lists the same {table} key more than once: {e}")
+            else:
+                print(f"\n✗ Error applying bulk update: {e}")
+            if changed:
+                print(f"⚠ Earlier chunks changed {changed} row(s); their previous values are in {rollback_path}")
+            return False
+        except OSError as e:
+            self.connection.rollback()
+            print(f"\n✗ Error reading or writing change files: {e}")
+            return False
+        finally:
+            cursor.close()
+        
+        self.invalidate_key_cache(table)
+        self.invalidate_report_caches(table)
+        
+        print("-"*80)
+        print(f"Rows in change file: {staged}")
+        print(f"Matched rows:        {matched}")
+        print(f"Changed rows:        {changed}")
+        print(f"Unchanged rows:      {matched - changed}")
+        print(f"Unmatched keys:      {staged - matched}")
+        for row in unmatched_examples:
+            print(f"  e.g. {', '.join(f'{col}={value}' for col, value in zip(key_columns, row))}")
+        print(f"\n✓ Bulk update finished in {time.perf_counter() - start:.2f}s")
+        print(f"✓ Previous values of the {changed} changed row(s) written to {rollback_path}")
+        return True
+
+    def load_named_sections(self, kind: str) -> List[tuple]:
+        """Read [<kind> <name>] sections from the config file; missing keys default to the [client] section"""
+        config = configparser.ConfigParser()
+        if os.path.exists(self.config_path):
+            try:
+                config.read(self.config_path)
+            except configparser.Error as e:
+                print(f"✗ Could not read {self.config_path}: {e}")
+                return []
+        
+        defaults = self.load_connection_config() or {'host': 'localhost', 'user': '', 'password': '', 'database': 'mini_world_db'}
+        sections = []
+        prefix = f"{kind} "
+        for section in config.sections():
+            if section.lower().startswith(prefix):
+                settings = {key: config.get(section, key, fallback=defaults[key]) for key in ('host', 'user', 'password', 'database')}
+                sections.append((section[len(prefix):].strip(), settings))
+        return sections
+
+    def load_shard_configs(self) -> List[tuple]:
+        """Read the [shard <name>] sections used by scatter-gather reports"""
+        return self.load_named_sections('shard')
+
+    def load_routing_config(self):
+        """Read [replica <name>] sections and [routing] options for read/write splitting"""
+        config = configparser.ConfigParser()
+        if os.path.exists(self.config_path):
+            try:
+                config.read(self.config_path)
+            except configparser.Error as e:
+                print(f"✗ Could not read {self.config_path}: {e}")
+                return
+        
+        self.replicas = [{'name': name, 'settings': settings, 'connection': None, 'cursor': None,
+                          'down_until': 0.0, 'lag': None, 'lag_checked_at': 0.0}
+                         for name, settings in self.load_named_sections('replica')]
+        if config.has_section('routing'):
+            try:
+                self.read_your_writes_window = config.getfloat('routing', 'read_your_writes_window', fallback=self.read_your_writes_window)
+                self.max_replica_lag = config.getfloat('routing', 'max_replica_lag', fallback=self.max_replica_lag)
+            except ValueError as e:
+                print(f"✗ Invalid [routing] option in {self.config_path}: {e}")
+
+    def note_session_write(self):
+        """Remember when this session last wrote, and the primary's GTID set, for read-your-writes routing"""
+        if not self.replicas or self.connection is None:
+            return
+        self.last_write_at = time.monotonic()
+        try:
+            self.cursor.execute("SELECT @@GLOBAL.gtid_executed AS Gtid_Executed")
+            row = self.cursor.fetchone()
+            self.last_write_gtid = row['Gtid_Executed'] or None
+        except Error:
+            self.last_write_gtid = None
+
+    def replica_lag(self, replica: Dict) -> Optional[float]:
+        """Seconds the replica is behind its source (None when replication is not running); cached briefly"""
+        now = time.monotonic()
+        if now - replica['lag_checked_at'] < 2.0:
+            return replica['lag']
+        cursor = replica['cursor']
+        try:
+            cursor.execute("SHOW REPLICA STATUS")
+            rows = cursor.fetchall()
+            column = 'Seconds_Behind_Source'
+        except Error:
+            # MySQL before 8.0.22
+            cursor.execute("SHOW SLAVE STATUS")
+            rows = cursor.fetchall()
+            column = 'Seconds_Behind_Master'
+        replica['lag'] = rows[0].get(column) if rows else None
+        replica['lag_checked_at'] = now
+        return replica['lag']
+
+    def choose_read_replica(self) -> tuple:
+        """Pick a healthy, caught-up replica for a read-only operation, or explain why the primary is used"""
+        if not self.replicas:
+            return None, None
+        
+        now = time.monotonic()
+        in_window = self.last_write_at is not None and now - self.last_write_at < self.read_your_writes_window
+        reasons = []
+        
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(self.next_replica + offset) % len(self.replicas)]
+            if replica['down_until'] > now:
+                reasons.append(f"{replica['name']} down")
+                continue
+            try:
+                if replica['connection'] is None or not replica['connection'].is_connected():
+                    replica['connection'], replica['cursor'] = self.open_connection(dict(replica['settings'], connection_timeout=5))
+                
+                if in_window:
+                    # Read-your-writes: only use the replica once it has applied this session's writes
+                    if not self.last_write_gtid:
+                        reasons.append("recent write")
+                        continue
+                    replica['cursor'].execute("SELECT WAIT_FOR_EXECUTED_GTID_SET(%s, %s) AS Timed_Out", (self.last_write_gtid, 1))
+                    if replica['cursor'].fetchone()['Timed_Out'] != 0:
+                        reasons.append(f"{replica['name']} has not applied recent write")
+                        continue
+                else:
+                    lag = self.replica_lag(replica)
+                    if lag is None:
+                        reasons.append(f"{replica['name']} not replicating")
+                        continue
+                    if lag > self.max_replica_lag:
+                        reasons.append(f"{replica['name']} lagging {lag}s")
+                        continue
+                
+                self.next_replica = (self.next_replica + offset + 1) % len(self.replicas)
+                return replica, None
+            except Error as e:
+                replica['down_until'] = now + 30
+                replica['connection'] = None
+                reasons.append(f"{replica['name']} unreachable ({e})")
+        
+        return None, '; '.join(reasons)
+
+    @contextmanager
+    def read_route(self):
+        """Run a read-only operation on a replica when one is usable, otherwise on the primary"""
+        replica, reason = self.choose_read_replica()
+        if replica is None:
+            if reason:
+                print(f"\n↪ Reading from primary ({reason})")
+            yield
+            return
+        
+        print(f"\n↪ Reading from replica {replica['name']}")
+        primary = (self.connection, self.cursor, self.connection_settings)
+        self.connection, self.cursor = replica['connection'], replica['cursor']
+        self.connection_settings = replica['settings']
+        try:
+            yield
+        finally:
+            # A cancelled operation may have given the replica a fresh cursor
+            replica['cursor'] = self.cursor
+            # End the read's transaction, otherwise later reads keep seeing its REPEATABLE READ snapshot
+            try:
+                self.connection.rollback()
+            except Error:
+                pass
+            self.connection, self.cursor, self.connection_settings = primary
+
+    def service_report_endpoints(self) -> Dict[str, tuple]:
+        """JSON report endpoints of the query service: slug -> (title, query, parameter transform or None)"""
+        endpoints = {}
+        for name, query in self.analysis_report_queries().items():
+            endpoints[name.replace('_', '-')] = (name.replace('_', ' ').title(), query, None)
+        for spec in self.scatter_gather_specs():
+            slug = re.sub(r'[^a-z0-9]+', '-', spec['title'].lower()).strip('-')
+            endpoints[slug] = (spec['title'], spec['query'], spec['prompt'][1] if spec['prompt'] else None)
+        return endpoints
+
+    def service_execute(self, pool, sql: str, params: List, session: Dict[str, int]) -> Dict:
+        """Run one read-only statement on a pooled connection (called on an executor thread)"""
+        connection = pool.get_connection()
+        try:
+            cursor = connection.cursor(dictionary=True)
+            for variable, value in session.items():
+                cursor.execute(f"SET SESSION {variable} = %s", (value,))
+            # A read-only transaction makes the server reject anything that would write
+            cursor.execute("START TRANSACTION READ ONLY")
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+            columns = [description[0] for description in cursor.description or ()]
+            connection.commit()
+            cursor.close()
+            return {'columns': columns, 'rows': rows}
+        finally:
+            connection.close()
+
+    def serve(self, host: str, port: int, pool_size: int, cache_ttl: float):
+        """Serve retrieval and analysis queries as JSON over HTTP from one asyncio loop and a shared pool"""
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        from urllib.parse import urlsplit, parse_qs
+        load_mysql_connector()
+        from mysql.connector import pooling
+        
+        settings = self.load_connection_config() or self.prompt_connection_settings()
+        try:
+            pool = pooling.MySQLConnectionPool(pool_name="mini_world_service", pool_size=pool_size, **settings)
+        except Error as e:
+            print(f"\n✗ Error creating connection pool: {e}")
+            return False
+        executor = ThreadPoolExecutor(max_workers=pool_size)
+        endpoints = self.service_report_endpoints()
+        allowed_session = {'group_concat_max_len', 'max_execution_time'}
+        # Clauses that write or take locks even inside a SELECT; checked with string literals blanked out
+        locking_clause = re.compile(r'\bINTO\b|\bFOR\s+(UPDATE|SHARE)\b|\bLOCK\s+IN\s+SHARE\s+MODE\b', re.IGNORECASE)
+        
+        # Shared result cache (key -> (expires_at, result)) and in-flight queries that identical requests join
+        cache: Dict[tuple, tuple] = {}
+        in_flight: Dict[tuple, Any] = {}
+        stats = {'requests': 0, 'cache_hits': 0, 'coalesced': 0, 'queries': 0, 'errors': 0}
+        
+        async def fetch(sql: str, params: List, session: Dict[str, int]) -> tuple:
+            key = (sql, json.dumps(params, default=json_default), tuple(sorted(session.items())))
+            cached = cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                stats['cache_hits'] += 1
+                return cached[1], 'cache'
+            if key in in_flight:
+                stats['coalesced'] += 1
+                return await asyncio.shield(in_flight[key]), 'coalesced'
+            
+            future = asyncio.get_running_loop().run_in_executor(executor, self.service_execute, pool, sql, params, session)
+            in_flight[key] = future
+            stats['queries'] += 1
+            try:
+                result = await future
+                # Encode once so every consumer of the cached entry gets plain JSON values
+                result = json.loads(json.dumps(result, default=json_default))
+                cache[key] = (time.monotonic() + cache_ttl, result)
+                return result, 'query'
+            finally:
+                del in_flight[key]
+        
+        async def route(method: str, target: str, body: bytes) -> tuple:
+            url = urlsplit(target)
+            if method == 'GET' and url.path == '/stats':
+                return 200, dict(stats, cached_results=len(cache), in_flight=len(in_flight)), 'stats'
+            if method == 'GET' and url.path == '/reports':
+                return 200, {'reports': {slug: {'title': title, 'parameter': transform is not None}
+                                         for slug, (title, _, transform) in endpoints.items()}}, 'list'
+            if method == 'GET' and url.path.startswith('/reports/'):
+                slug = url.path[len('/reports/'):]
+                if slug not in endpoints:
+                    return 404, {'error': f"unknown report '{slug}'"}, 'error'
+                title, query, transform = endpoints[slug]
+                params = []
+                if transform is not None:
+                    value = parse_qs(url.query).get('value', [''])[0]
+                    try:
+                        params = list(transform(value)) if value else None
+                    except ValueError:
+                        params = None
+                    if params is None:
+                        return 400, {'error': f"report '{slug}' needs a valid ?value= parameter"}, 'error'
+                result, source = await fetch(query, params, {})
+                return 200, dict(result, report=slug, title=title), source
+            if method == 'POST' and url.path == '/query':
+                request = json.loads(body or b'{}')
+                if not isinstance(request, dict):
+                    return 400, {'error': "request body must be a JSON object"}, 'error'
+                sql, params, session = request.get('sql', ''), request.get('params', []), request.get('session', {})
+                if not isinstance(sql, str) or not isinstance(params, list) or not isinstance(session, dict):
+                    return 400, {'error': "'sql' must be a string, 'params' a list and 'session' an object"}, 'error'
+                session = {name: int(value) for name, value in session.items() if name in allowed_session}
+                unquoted = re.sub(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"", "''", sql)
+                if (not re.match(r'\s*(SELECT|WITH|EXPLAIN)\b', sql, re.IGNORECASE) or ';' in sql.rstrip().rstrip(';')
+                        or locking_clause.search(unquoted)):
+                    return 403, {'error': "only single read-only SELECT statements are served"}, 'error'
+                result, source = await fetch(sql, params, session)
+                return 200, result, source
+            return 404, {'error': f"no route for {method} {url.path}"}, 'error'
+        
+        async def handle(reader, writer):
+            start = time.perf_counter()
+            status, method, target, source = 500, '-', '-', 'error'
+            try:
+                request_line = (await reader.readline()).decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode('latin-1').strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                if len(request_line) < 2:
+                    return
+                method, target = request_line[0], request_line[1]
+                stats['requests'] += 1
+                try:
+                    body = await reader.readexactly(int(headers.get('content-length', 0)))
+                    status, payload, source = await route(method, target, body)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Error as e:
+                    status, payload = 500, {'error': str(e)}
+                except (ValueError, TypeError) as e:
+                    status, payload = 400, {'error': f"bad request: {e}"}
+                except Exception as e:
+                    # Any other failure still gets a JSON reply instead of a dropped connection
+                    status, payload = 500, {'error': f"internal error: {e}"}
+                if status >= 400:
+                    stats['errors'] += 1
+                data = json.dumps(payload, default=json_default).encode()
+                writer.write(f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode() + data)
+                await writer.drain()
+            except (ConnectionError, asyncio.IncompleteReadError):
+                pass
+            finally:
+                writer.close()
+                print(f"{time.strftime('%H:%M:%S')}  {method:<5}{target[:50]:<52}{status:<5}{source:<10}{(time.perf_counter() - start)*1000:>8.1f} ms")
+        
+        async def main_loop():
+            server = await asyncio.start_server(handle, host, port)
+            print("\n" + "="*80)
+            print(f"MINI WORLD QUERY SERVICE on http://{host}:{port}")
+            print("="*80)
+            print(f"Pool: {pool_size} connections to {settings['database']} on {settings['host']}    Cache TTL: {cache_ttl:g}s")
+            print("Endpoints: GET /reports, GET /reports/<name>[?value=...], GET /stats, POST /query")
+            async with server:
+                await server.serve_forever()
+        
+        try:
+            asyncio.run(main_loop())
+        except KeyboardInterrupt:
+            print("\n✓ Query service stopped.")
+        finally:
+            executor.shutdown(wait=False)
+        return True
+
+    def load_test_reference_data(self, cursor) -> Dict[str, List]:
+        """Sample existing keys and names used to randomize load-test parameters"""
+        queries = {
+            'intruders': "SELECT User_Id FROM INTRUDERS",
+            'creatures': "SELECT Creature_Id, Species_Id FROM INDIVIDUAL_FOODIMAL_CREATURES WHERE Species_Id IS NOT NULL",
+            'inventions': "SELECT Item_Owner, Item_Name FROM INVENTIONS",
+            'regions': "SELECT Region_Id, Region_Name FROM ISLAND_REGIONS",
+            'species': "SELECT Species_Id, Species_Name FROM FOODIMALS_SPECIES",
+            'cells': "SELECT Cell_Id, Colony_Id FROM LIVECORP_CELLS",
+            'food_items': "SELECT Name FROM FOOD_ITEM",
+        }
+        reference = {}
+        for name, query in queries.items():
+            cursor.execute(query)
+            reference[name] = cursor.fetchall()
+        return reference
+
+    def load_test_operations(self, reference: Dict[str, List], created: List[int], created_lock) -> Dict[str, tuple]:
+        """Load-test operations: name -> (category, function(cursor, rng)) issuing the CLI's SQL with random parameters"""
+        operations = {}
+        
+        def fixed(query):
+            return lambda cursor, rng: cursor.execute(query)
+        for name, query in self.analysis_report_queries().items():
+            operations[name] = ('report', fixed(query))
+        
+        # Retrieval queries with parameters drawn from existing data
+        def keyword(rows, column):
+            return lambda rng: (f"%{str(rng.choice(rows)[column])[:4]}%",)
+        samplers = {
+            'Find Species by Food Item': keyword(reference['food_items'], 0),
+            'Search Invention Descriptions': keyword(reference['inventions'], 1),
+            'Count Foodimals of a Specific Species': lambda rng: (rng.choice(reference['species'])[1],),
+            'Display Intruder Threat Profiles (Top N)': lambda rng: (rng.randint(5, 50),),
+            'Identify High-Threat Intruders': lambda rng: (float(rng.randint(2500, 25000)),),
+            'Find Foodimals in a Specific Region': lambda rng: (rng.choice(reference['regions'])[1],),
+        }
+        for spec in self.scatter_gather_specs():
+            slug = re.sub(r'[^a-z0-9]+', '_', spec['title'].lower()).strip('_')
+            sampler = samplers.get(spec['title'])
+            if spec['prompt'] is None:
+                operations[slug] = ('retrieval', fixed(spec['query']))
+            elif sampler and all(reference[key] for key in ('food_items', 'inventions', 'species', 'regions')):
+                operations[slug] = ('retrieval', lambda cursor, rng, query=spec['query'], sampler=sampler: cursor.execute(query, sampler(rng)))
         
-        if not region_name:
-            print("✗ Region name cannot be empty.")
-            return
+        def insert_combat_event(cursor, rng):
+            owner, item = rng.choice(reference['inventions'])
+            cursor.execute("INSERT INTO COMBAT_EVENT (Intruder_Id, Creature_Id, Item_Owner_Id, Region_Id, Item_Name, Event_Time) VALUES (%s, %s, %s, %s, %s, NOW() - INTERVAL %s SECOND)",
+                           (rng.choice(reference['intruders'])[0], rng.choice(reference['creatures'])[0], owner,
+                            rng.choice(reference['regions'])[0], item, rng.randint(0, 30 * 86400)))
+        
+        def insert_suspicious_activity(cursor, rng):
+            cell, colony = rng.choice(reference['cells'])
+            cursor.execute("INSERT INTO SUSPIOUS_ACTIVITIES (Intruder_Id, Creature_Id, Colony_Id, Cell_Id, Event_Time) VALUES (%s, %s, %s, %s, NOW() - INTERVAL %s SECOND)",
+                           (rng.choice(reference['intruders'])[0], rng.choice(reference['creatures'])[0], colony, cell, rng.randint(0, 30 * 86400)))
+        
+        def insert_creature(cursor, rng):
+            _, species = rng.choice(reference['creatures'])
+            cursor.execute("INSERT INTO INDIVIDUAL_FOODIMAL_CREATURES (Species_Id, Location_Id) VALUES (%s, %s)",
+                           (species, rng.choice(reference['regions'])[0]))
+            with created_lock:
+                created.append(cursor.lastrowid)
+        
+        def update_intruder(cursor, rng):
+            cursor.execute("UPDATE INTRUDERS SET Intelligence = %s WHERE User_Id = %s",
+                           (rng.randint(50, 170), rng.choice(reference['intruders'])[0]))
         
+        def delete_creature_cascade(cursor, rng):
+            # Only creatures created by this load test are deleted; their event rows go with them
+            with created_lock:
+                if not created:
+                    return
+                creature = created.pop(rng.randrange(len(created)))
+            # The schema triggers remove the creature's event rows
+            cursor.execute("DELETE FROM INDIVIDUAL_FOODIMAL_CREATURES WHERE Creature_Id = %s", (creature,))
+        
+        def delete_old_combat_event(cursor, rng):
+            cursor.execute("DELETE FROM COMBAT_EVENT WHERE Intruder_Id = %s ORDER BY Event_Time LIMIT 1",
+                           (rng.choice(reference['intruders'])[0],))
+        
+        if all(reference[key] for key in ('intruders', 'creatures', 'inventions', 'regions')):
+            operations['insert_combat_event'] = ('insert', insert_combat_event)
+            operations['insert_creature'] = ('insert', insert_creature)
+            operations['update_intruder'] = ('update', update_intruder)
+            operations['delete_creature_cascade'] = ('delete', delete_creature_cascade)
+            operations['delete_old_combat_event'] = ('delete', delete_old_combat_event)
+            if reference['cells']:
+                operations['insert_suspicious_activity'] = ('insert', insert_suspicious_activity)
+        return operations
+
+    def load_test_user(self, settings: Dict, operations: Dict[str, tuple], mix: Dict[str, float],
+                       stop: threading.Event, samples: List, seed: int):
+        """One virtual user: pick operations by the category mix until stopped, recording (time, op, latency, errno)"""
+        import random
+        rng = random.Random(seed)
+        by_category = {}
+        for name, (category, _) in operations.items():
+            by_category.setdefault(category, []).append(name)
+        categories = [category for category in mix if category in by_category]
+        weights = [mix[category] for category in categories]
+        
+        connection = load_mysql_connector().connect(**settings)
+        cursor = connection.cursor()
         try:
-            # Query to find all foodimals in the specified region
-            query = "SELECT ifc.Creature_Id, ifc.Species_Id, fs.Species_Name, ifc.Location_Id, r.Region_Name, ifc.Populatory_Species_Id FROM INDIVIDUAL_FOODIMAL_CREATURES ifc JOIN FOODIMALS_SPECIES fs ON ifc.Species_Id = fs.Species_Id JOIN ISLAND_REGIONS r ON ifc.Location_Id = r.Region_Id WHERE r.Region_Name = %s ORDER BY fs.Species_Name, ifc.Creature_Id"
-            
-            self.cursor.execute(query, (region_name,))
-            results = self.cursor.fetchall()
-            
-            if not results:
-                print(f"\n✗ No foodimals found in region '{region_name}'.")
-                print("="*80)
-                return
-            
-            # Display results in formatted table
-            print(f"\nFoodimals in '{region_name}':")
-            print("-"*80)
-            print(f"{'Creature ID':<15}{'Species Name':<30}{'Species ID':<15}{'Pop. Species ID':<20}")
-            print("-"*80)
-            
-            for row in results:
-                creature_id = row['Creature_Id']
-                species_name = row['Species_Name'][:29]
-                species_id = row['Species_Id']
-                pop_species_id = row['Populatory_Species_Id'] if row['Populatory_Species_Id'] else 'N/A'
-                print(f"{creature_id:<15}{species_name:<30}{species_id:<15}{str(pop_species_id):<20}")
-            
-            print("-"*80)
-            print(f"\nTotal Foodimals in Region: {len(results)}")
-            
-            # Display species distribution
-            species_count = {}
-            for row in results:
-                species = row['Species_Name']
-                species_count[species] = species_count.get(species, 0) + 1
-            
-            print("\n" + "="*80)
-            print("SPECIES DISTRIBUTION IN REGION")
-            print("="*80)
-            print(f"\n{'Species Name':<40}{'Count':<10}")
-            print("-"*80)
-            
-            for species, count in sorted(species_count.items(), key=lambda x: x[1], reverse=True):
-                print(f"{species:<40}{count:<10}")
-            
-            print("\n" + "="*80)
-            
-        except Error as e:
-            print(f"\n✗ Error retrieving foodimals: {e}")
-            print("="*80)
+            while not stop.is_set():
+                name = rng.choice(by_category[rng.choices(categories, weights)[0]])
+                start = time.perf_counter()
+                errno = 0
+                try:
+                    operations[name][1](cursor, rng)
+                    if cursor.with_rows:
+                        cursor.fetchall()
+                    connection.commit()
+                except Error as e:
+                    errno = getattr(e, 'errno', None) or -1
+                    try:
+                        connection.rollback()
+                    except Error:
+                        pass
+                samples.append((time.monotonic(), name, time.perf_counter() - start, errno))
+        finally:
+            cursor.close()
+            connection.close()
 
-    def list_inventions_against_species(self):
-        """List all inventions effective against a specific foodimal species"""
+    def load_test(self, max_users: int, ramp: int, step_duration: float, mix: Dict[str, float]) -> bool:
+        """Run virtual users against the database in step-load ramps and report throughput, latency and lock errors"""
         print("\n" + "="*80)
-        print("LIST INVENTIONS EFFECTIVE AGAINST A SPECIES")
+        print("CONCURRENT LOAD TEST")
         print("="*80)
         
+        settings = self.connection_settings
         try:
-            # First, show available species
-            query_species = "SELECT Species_Id, Species_Name FROM FOODIMALS_SPECIES ORDER BY Species_Name"
-            self.cursor.execute(query_species)
-            species_list = self.cursor.fetchall()
-            
-            if not species_list:
-                print("\n✗ No species found in the database.")
-                print("="*80)
-                return
-            
-            print("\nAvailable Foodimal Species:")
-            print("-"*80)
-            for species in species_list:
-                print(f"  {species['Species_Id']}: {species['Species_Name']}")
-            print("-"*80)
-            
+            reference = self.load_test_reference_data(self.connection.cursor())
         except Error as e:
-            print(f"\n✗ Error fetching species: {e}")
-            print("="*80)
-            return
+            print(f"\n✗ Error reading reference data: {e}")
+            return False
         
-        species_name = input("\nEnter species name (e.g., 'Cheespider'): ").strip()
+        created: List[int] = []
+        created_lock = threading.Lock()
+        operations = self.load_test_operations(reference, created, created_lock)
+        categories = sorted({category for category, _ in operations.values()})
+        print(f"Operations: {len(operations)} across {', '.join(categories)}")
+        print(f"Mix: {', '.join(f'{category}={weight:g}' for category, weight in mix.items())}")
+        print(f"Ramp: +{ramp} users every {step_duration:g}s up to {max_users} users")
         
-        if not species_name:
-            print("✗ Species name cannot be empty.")
-            return
+        status = self.connection.cursor()
+        
+        def lock_counters():
+            status.execute("SHOW GLOBAL STATUS WHERE Variable_name = 'Innodb_row_lock_waits'")
+            return {name: int(value) for name, value in status.fetchall()}
+        
+        samples: List[tuple] = []
+        stop = threading.Event()
+        threads = []
+        steps = []
         
+        print(f"\n{'Users':<7}{'Ops/s':<10}{'p50 ms':<10}{'p95 ms':<10}{'p99 ms':<10}{'Errors':<8}{'Lock Waits':<12}{'1205':<7}{'1213':<7}")
+        print("-"*80)
         try:
-            # Query to find all inventions that are weaknesses for the species
-            query = "SELECT fs.Species_Name, fs.Species_Id, inv.Item_Name, inv.Item_Owner, i.Name AS Owner_Name FROM WEAKNESS w JOIN FOODIMALS_SPECIES fs ON w.Species_Id = fs.Species_Id JOIN INVENTIONS inv ON w.Item_Inventor_Id = inv.Item_Owner AND w.Item_Name = inv.Item_Name JOIN INTRUDERS i ON inv.Item_Owner = i.User_Id WHERE fs.Species_Name = %s ORDER BY inv.Item_Name"
-            
-            self.cursor.execute(query, (species_name,))
-            results = self.cursor.fetchall()
-            
-            if not results:
-                print(f"\n✗ No inventions found that are effective against '{species_name}'.")
-                print("="*80)
-                return
-            
-            # Display results in formatted table
-            print(f"\nInventions Effective Against '{species_name}':")
-            print("-"*80)
-            print(f"{'Item Name':<35}{'Owner Name':<25}{'Owner ID':<15}")
-            print("-"*80)
-            
-            for row in results:
-                item_name = row['Item_Name'][:34]
-                owner_name = row['Owner_Name'][:24]
-                owner_id = row['Item_Owner']
-                print(f"{item_name:<35}{owner_name:<25}{owner_id:<15}")
-            
-            print("-"*80)
-            print(f"\nTotal Effective Inventions: {len(results)}")
-            
-            # Display detailed breakdown
-            print("\n" + "="*80)
-            print("DETAILED INVENTORY")
-            print("="*80)
-            
-            for row in results:
-                print(f"\nInvention: {row['Item_Name']}")
-                print(f"  Owner: {row['Owner_Name']} (ID: {row['Item_Owner']})")
-                print(f"  Effective Against: {row['Species_Name']} (Species ID: {row['Species_Id']})")
-            
-            print("\n" + "="*80)
-            
-        except Error as e:
-            print(f"\n✗ Error retrieving inventions: {e}")
-            print("="*80)
+            users = 0
+            while users < max_users:
+                for _ in range(min(ramp, max_users - users)):
+                    thread = threading.Thread(target=self.load_test_user, name=f"vu-{users}",
+                                              args=(settings, operations, mix, stop, samples, users), daemon=True)
+                    thread.start()
+                    threads.append(thread)
+                    users += 1
+                
+                before = lock_counters()
+                step_start = time.monotonic()
+                first_sample = len(samples)
+                time.sleep(step_duration)
+                elapsed = time.monotonic() - step_start
+                after = lock_counters()
+                
+                step_samples = samples[first_sample:]
+                latencies = sorted(latency for _, _, latency, _ in step_samples)
+                errors = [errno for _, _, _, errno in step_samples if errno]
+                step = {
+                    'users': users,
+                    'throughput': len(step_samples) / elapsed,
+                    'p50': self.percentile(latencies, 0.50),
+                    'p95': self.percentile(latencies, 0.95),
+                    'p99': self.percentile(latencies, 0.99),
+                    'errors': len(errors),
+                    'lock_waits': after.get('Innodb_row_lock_waits', 0) - before.get('Innodb_row_lock_waits', 0),
+                    'lock_wait_timeouts': errors.count(1205),
+                    'deadlocks': errors.count(1213),
+                }
+                steps.append(step)
+                self.write_metrics(dict(step, operation='load_test_step'))
+                
+                def ms(value):
+                    return f"{value * 1000:.1f}" if value is not None else "-"
+                print(f"{users:<7}{step['throughput']:<10.1f}{ms(step['p50']):<10}{ms(step['p95']):<10}{ms(step['p99']):<10}"
+                      f"{step['errors']:<8}{step['lock_waits']:<12}{step['lock_wait_timeouts']:<7}{step['deadlocks']:<7}")
+        except KeyboardInterrupt:
+            print("\n⚠ Load test interrupted; reporting what was collected.")
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            status.close()
+        
+        # Per-operation summary over the whole run
+        print("-"*80)
+        print(f"\n{'Operation':<42}{'Count':<8}{'p50 ms':<9}{'p95 ms':<9}{'p99 ms':<9}{'Err':<6}{'1205':<6}{'1213':<6}")
+        print("-"*95)
+        per_operation = {}
+        for _, name, latency, errno in samples:
+            per_operation.setdefault(name, []).append((latency, errno))
+        for name in sorted(per_operation):
+            latencies = sorted(latency for latency, _ in per_operation[name])
+            errors = [errno for _, errno in per_operation[name] if errno]
+            print(f"{name[:41]:<42}{len(latencies):<8}{self.percentile(latencies, 0.50)*1000:<9.1f}"
+                  f"{self.percentile(latencies, 0.95)*1000:<9.1f}{self.percentile(latencies, 0.99)*1000:<9.1f}"
+                  f"{len(errors):<6}{errors.count(1205):<6}{errors.count(1213):<6}")
+        print("-"*95)
+        
+        # Saturation: the first step whose throughput no longer grows by at least 5%
+        for previous, step in zip(steps, steps[1:]):
+            if step['throughput'] < previous['throughput'] * 1.05:
+                print(f"\n⚠ Saturation at about {previous['users']} users ({previous['throughput']:.1f} ops/s); "
+                      f"p95 went from {previous['p95'] * 1000:.1f} to {step['p95'] * 1000:.1f} ms at {step['users']} users")
+                break
+        else:
+            if len(steps) > 1:
+                print(f"\n✓ Throughput still growing at {steps[-1]['users']} users; raise --users to find saturation")
+        
+        if created:
+            print(f"\n⚠ {len(created)} load-test creature(s) were left in INDIVIDUAL_FOODIMAL_CREATURES: {', '.join(map(str, created[:10]))}{'...' if len(created) > 10 else ''}")
+        print("="*80)
+        return True
 
-    def find_most_dangerous_region(self):
-        """Find the island region with the highest threat to intruders"""
+    # Reports that keep client-side or multi-step state and therefore run against a single database only
+    SCATTER_GATHER_UNSUPPORTED = ('Populatory Species Population Projection', 'What-If Threat Modeling', 'Region x Species Cross-Tab',
+                                  'Watch a Report', 'Region / Invention Activity by Time Window', 'Combat Cube', 'Counter-Strategy Graph Queries')
+
+    @plan_samples(threat='(Intelligence * Intelligence + Height - Weight / Height)')
+    def scatter_gather_specs(self) -> List[Dict]:
+        """Shard-mergeable versions of the retrieval and analysis reports"""
+        threat = "(Intelligence * Intelligence + Height - Weight / Height)"
+        return [
+            {
+                'title': 'Find Species by Food Item',
+                'prompt': ("Enter food item keyword to search (e.g., 'taco', 'pizza'): ", lambda value: (f"%{value}%",)),
+                'query': "SELECT DISTINCT fs.Species_Name, fi.Name AS Food_Item_Name FROM FOODIMALS_SPECIES fs JOIN FOOD_ITEM fi ON fs.Species_Id = fi.Species_Id WHERE fi.Name LIKE %s",
+                'merge': ('union', ['Species_Name', 'Food_Item_Name']),
+                'columns': [('Species_Name', 'Species Name', 30), ('Food_Item_Name', 'Food Item Name', 30), ('Shards', 'Shards', 20)]
+            },
+            {
+                'title': 'Search Invention Descriptions',
+                'prompt': ("Enter description keyword to search (e.g., 'party', 'celebration'): ", lambda value: (f"%{value}%",)),
+                'query': "SELECT inv.Item_Name, i.Name AS Owner_Name FROM INVENTIONS inv JOIN DESCRIPTIONS d ON inv.Item_Owner = d.Item_Owner_Id AND inv.Item_Name = d.Item_Name JOIN INTRUDERS i ON inv.Item_Owner = i.User_Id WHERE LOWER(d.Description) LIKE LOWER(%s)",
+                'merge': ('union', ['Item_Name', 'Owner_Name']),
+                'columns': [('Item_Name', 'Item Name', 30), ('Owner_Name', 'Owner', 25), ('Shards', 'Shards', 20)]
+            },
+            {
+                'title': 'Count Foodimals of a Specific Species',
+                'prompt': ("Enter species name to count (e.g., 'Tacodile'): ", lambda value: (value,)),
+                'query': "SELECT fs.Species_Name, COUNT(ifc.Creature_Id) AS Total_Count FROM FOODIMALS_SPECIES fs LEFT JOIN INDIVIDUAL_FOODIMAL_CREATURES ifc ON fs.Species_Id = ifc.Species_Id WHERE fs.Species_Name = %s GROUP BY fs.Species_Name",
+                'merge': ('sum', ['Species_Name'], ['Total_Count']),
+                'columns': [('Species_Name', 'Species Name', 30), ('Total_Count', 'Total Living Instances', 25)]
+            },
+            {
+                'title': 'Average Intruder Intelligence (All Colonies)',
+                'prompt': None,
+                'query': "SELECT 'All Colonies' AS Scope, SUM(i.Intelligence) AS Intelligence_Sum, COUNT(*) AS Intruder_Count FROM (SELECT DISTINCT Intruder_Id FROM SUSPIOUS_ACTIVITIES) sa JOIN INTRUDERS i ON sa.Intruder_Id = i.User_Id",
+                'merge': ('avg', ['Scope'], 'Intelligence_Sum', 'Intruder_Count', 'Average_Intelligence'),
+                'columns': [('Scope', 'Scope', 20), ('Intruder_Count', 'Total Intruders', 20), ('Average_Intelligence', 'Average Intelligence', 22)]
+            },
+            {
+                'title': 'Intruder Intelligence by Colony',
+                'prompt': None,
+                # Each shard returns a histogram of intelligence values per colony, which merges exactly into the percentiles
+                'query': "SELECT c.Colony_Id, r.Region_Name, i.Intelligence, COUNT(i.User_Id) AS Intruders FROM LIVECORP_COLONY c JOIN ISLAND_REGIONS r ON c.Region_Id = r.Region_Id LEFT JOIN (SELECT DISTINCT Colony_Id, Intruder_Id FROM SUSPIOUS_ACTIVITIES) sa ON c.Colony_Id = sa.Colony_Id LEFT JOIN INTRUDERS i ON sa.Intruder_Id = i.User_Id GROUP BY c.Colony_Id, r.Region_Name, i.Intelligence",
+                'merge': ('distribution', ['Colony_Id', 'Region_Name'], 'Intelligence', 'Intruders'),
+                'columns': [('Colony_Id', 'Colony', 8), ('Region_Name', 'Region', 20), ('Intruders', 'Intruders', 11), ('Average', 'Average', 10),
+                            ('Minimum', 'Min', 8), ('Median', 'Median', 9), ('P90', 'P90', 9), ('Maximum', 'Max', 8)]
+            },
+            {
+                'title': 'Find the Most Dangerous Region',
+                'prompt': None,
+                'query': "SELECT Region_Name, Threat_To_Intruders FROM ISLAND_REGIONS WHERE Threat_To_Intruders = (SELECT MAX(Threat_To_Intruders) FROM ISLAND_REGIONS)",
+                'merge': ('max', 'Threat_To_Intruders'),
+                'columns': [('Shard', 'Shard', 15), ('Region_Name', 'Region Name', 30), ('Threat_To_Intruders', 'Threat Level', 15)]
+            },
+            {
+                'title': 'Display Intruder Threat Profiles (Top N)',
+                'prompt': ("Show top N intruders (e.g., 10): ", lambda value: (int(value),)),
+                'query': f"SELECT Name, Intelligence, {threat} AS Threat_Status FROM INTRUDERS ORDER BY Threat_Status DESC LIMIT %s",
+                'merge': ('topn', 'Threat_Status'),
+                'columns': [('Shard', 'Shard', 15), ('Name', 'Name', 25), ('Intelligence', 'Intelligence', 15), ('Threat_Status', 'Threat Status', 15)]
+            },
+            {
+                'title': 'List Foodimal Species and Recipes',
+                'prompt': None,
+                'query': "SELECT fs.Species_Name, 'Animal' AS Component, a.Name AS Component_Name FROM FOODIMALS_SPECIES fs JOIN ANIMAL a ON fs.Species_Id = a.Species_Id UNION ALL SELECT fs.Species_Name, 'Food Item', fi.Name FROM FOODIMALS_SPECIES fs JOIN FOOD_ITEM fi ON fs.Species_Id = fi.Species_Id",
+                'merge': ('union', ['Species_Name', 'Component', 'Component_Name']),
+                'columns': [('Species_Name', 'Species Name', 30), ('Component', 'Component', 12), ('Component_Name', 'Name', 25), ('Shards', 'Shards', 13)]
+            },
+            {
+                'title': 'Identify High-Threat Intruders',
+                'prompt': ("Enter critical threat threshold (e.g., 10): ", lambda value: (float(value),)),
+                'query': f"SELECT User_Id, Name, Gender, Intelligence, {threat} AS Threat_Status FROM INTRUDERS WHERE {threat} > %s ORDER BY Threat_Status DESC",
+                'merge': ('topn', 'Threat_Status'),
+                'columns': [('Shard', 'Shard', 15), ('User_Id', 'User ID', 10), ('Name', 'Name', 20), ('Gender', 'Gender', 8), ('Threat_Status', 'Threat Status', 15)]
+            },
+            {
+                'title': 'Find Foodimals in a Specific Region',
+                'prompt': ("Enter region name (e.g., 'Salsa River'): ", lambda value: (value,)),
+                'query': "SELECT fs.Species_Name, COUNT(*) AS Count FROM INDIVIDUAL_FOODIMAL_CREATURES ifc JOIN FOODIMALS_SPECIES fs ON ifc.Species_Id = fs.Species_Id JOIN ISLAND_REGIONS r ON ifc.Location_Id = r.Region_Id WHERE r.Region_Name = %s GROUP BY fs.Species_Name",
+                'merge': ('sum', ['Species_Name'], ['Count']),
+                'columns': [('Species_Name', 'Species Name', 40), ('Count', 'Count', 10)]
+            },
+            {
+                'title': 'List Inventions Effective Against a Species',
+                'prompt': ("Enter species name (e.g., 'Cheespider'): ", lambda value: (value,)),
+                'query': "SELECT inv.Item_Name, i.Name AS Owner_Name FROM WEAKNESS w JOIN FOODIMALS_SPECIES fs ON w.Species_Id = fs.Species_Id JOIN INVENTIONS inv ON w.Item_Inventor_Id = inv.Item_Owner AND w.Item_Name = inv.Item_Name JOIN INTRUDERS i ON inv.Item_Owner = i.User_Id WHERE fs.Species_Name = %s",
+                'merge': ('union', ['Item_Name', 'Owner_Name']),
+                'columns': [('Item_Name', 'Invention Name', 30), ('Owner_Name', 'Owner', 25), ('Shards', 'Shards', 20)]
+            },
+            {
+                'title': 'Intruder Threat Assessment by Region',
+                'prompt': None,
+                'query': f"SELECT i.Name, r.Region_Name, i.Intelligence, {threat} AS Threat_Level FROM INTRUDERS i JOIN ISLAND_REGIONS r ON i.Location_Id = r.Region_Id ORDER BY Threat_Level DESC",
+                'merge': ('topn', 'Threat_Level'),
+                'columns': [('Shard', 'Shard', 15), ('Name', 'Name', 20), ('Region_Name', 'Region', 25), ('Intelligence', 'Intelligence', 14), ('Threat_Level', 'Threat Level', 15)]
+            },
+            {
+                'title': 'Foodimal Defensive Readiness Report',
+                'prompt': None,
+                'query': "SELECT r.Region_Name, fs.Species_Name, COUNT(ifc.Creature_Id) AS Number_of_Units FROM INDIVIDUAL_FOODIMAL_CREATURES ifc JOIN FOODIMALS_SPECIES fs ON ifc.Species_Id = fs.Species_Id JOIN ISLAND_REGIONS r ON ifc.Location_Id = r.Region_Id GROUP BY r.Region_Name, fs.Species_Name",
+                'merge': ('sum', ['Region_Name', 'Species_Name'], ['Number_of_Units']),
+                'columns': [('Region_Name', 'Region', 25), ('Species_Name', 'Species Name', 30), ('Number_of_Units', 'Unit Count', 15)]
+            },
+            {
+                'title': 'Combat Effectiveness Analysis (Invention Usage)',
+                'prompt': None,
+                'query': "SELECT Item_Name AS Invention_Used, COUNT(*) AS Frequency_of_Use FROM COMBAT_EVENT GROUP BY Item_Name",
+                'merge': ('sum', ['Invention_Used'], ['Frequency_of_Use']),
+                'columns': [('Invention_Used', 'Invention Name', 35), ('Frequency_of_Use', 'Total Uses', 15)]
+            }
+        ]
+
+    def merge_shard_results(self, merge: tuple, partials: Dict[str, List[Dict]]) -> List[Dict]:
+        """Combine per-shard partial results into one global result"""
+        kind = merge[0]
+        if kind == 'union':
+            merged = {}
+            for shard, rows in partials.items():
+                for row in rows:
+                    key = tuple(row[col] for col in merge[1])
+                    merged.setdefault(key, dict(row, Shards=[]))['Shards'].append(shard)
+            for row in merged.values():
+                row['Shards'] = ', '.join(row['Shards'])
+            return sorted(merged.values(), key=lambda row: tuple(str(row[col]) for col in merge[1]))
+        if kind == 'sum':
+            group_cols, sum_cols = merge[1], merge[2]
+            merged = {}
+            for rows in partials.values():
+                for row in rows:
+                    key = tuple(row[col] for col in group_cols)
+                    target = merged.setdefault(key, {**{col: row[col] for col in group_cols}, **{col: 0 for col in sum_cols}})
+                    for col in sum_cols:
+                        target[col] += row[col] or 0
+            return sorted(merged.values(), key=lambda row: -row[sum_cols[0]])
+        if kind == 'avg':
+            group_cols, sum_col, count_col, avg_col = merge[1:]
+            merged = {}
+            for rows in partials.values():
+                for row in rows:
+                    key = tuple(row[col] for col in group_cols)
+                    target = merged.setdefault(key, {**{col: row[col] for col in group_cols}, sum_col: 0, count_col: 0})
+                    target[sum_col] += row[sum_col] or 0
+                    target[count_col] += row[count_col] or 0
+            for row in merged.values():
+                row[avg_col] = f"{row[sum_col] / row[count_col]:.2f}" if row[count_col] else 'N/A'
+            return list(merged.values())
+        if kind == 'distribution':
+            # Per-shard (value, count) histograms add up exactly, so the percentiles match a single-database run
+            group_cols, value_col, count_col = merge[1:]
+            histograms = {}
+            for rows in partials.values():
+                for row in rows:
+                    histogram = histograms.setdefault(tuple(row[col] for col in group_cols), {})
+                    if row[value_col] is not None:
+                        histogram[row[value_col]] = histogram.get(row[value_col], 0) + row[count_col]
+            merged = []
+            for key, histogram in histograms.items():
+                values = [float(value) for value, count in sorted(histogram.items()) for _ in range(count)]
+                merged.append({**dict(zip(group_cols, key)), count_col: len(values),
+                               'Average': sum(values) / len(values) if values else None,
+                               'Minimum': values[0] if values else None, 'Maximum': values[-1] if values else None,
+                               'Median': self.percentile(values, 0.5), 'P90': self.percentile(values, 0.9)})
+            return sorted(merged, key=lambda row: (row['Average'] is None, -(row['Average'] or 0)))
+        if kind == 'max':
+            rows = [dict(row, Shard=shard) for shard, shard_rows in partials.items() for row in shard_rows]
+            if not rows:
+                return []
+            best = max(row[merge[1]] for row in rows)
+            return [row for row in rows if row[merge[1]] == best]
+        if kind == 'topn':
+            # Each shard's partial is already sorted, so a heap merge keeps the global order
+            streams = [[dict(row, Shard=shard) for row in shard_rows] for shard, shard_rows in partials.items()]
+            merged = list(heapq.merge(*streams, key=lambda row: -row[merge[1]]))
+            limit = self.scatter_gather_limit
+            return merged[:limit] if limit else merged
+        raise ValueError(f"unknown merge kind {kind}")
+
+    def query_shard(self, shard: str, settings: Dict[str, str], query: str, params: tuple) -> List[Dict]:
+        """Run one partial query on a shard, opening its connection on first use"""
+        entry = self.shard_connections.get(shard)
+        if entry is None or not entry[0].is_connected():
+            entry = self.open_connection(dict(settings, connection_timeout=10))
+            self.shard_connections[shard] = entry
+        connection, cursor = entry
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        connection.commit()
+        return rows
+
+    def scatter_gather_reports(self):
+        """Run a report on every configured shard in parallel and merge the partial results"""
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+        
         print("\n" + "="*80)
-        print("FIND THE MOST DANGEROUS REGION")
+        print("SCATTER-GATHER REPORTS (ALL SHARDS)")
         print("="*80)
         
+        shards = self.load_shard_configs()
+        if not shards:
+            print(f"\n✗ No shards configured. Add [shard <name>] sections to {self.config_path}.")
+            print("="*80)
+            return
+        print(f"\nShards: {', '.join(name for name, _ in shards)}")
+        
+        specs = self.scatter_gather_specs()
+        for idx, spec in enumerate(specs, 1):
+            print(f"{idx}. {spec['title']}")
+        print(f"{len(specs) + 1}. Back")
+        print(f"\nNot available across shards: {', '.join(self.SCATTER_GATHER_UNSUPPORTED)}")
+        
         try:
-            # Query to find the region with maximum threat value
-            query = "SELECT Region_Id, Region_Name, Threat_To_Intruders FROM ISLAND_REGIONS WHERE Threat_To_Intruders = (SELECT MAX(Threat_To_Intruders) FROM ISLAND_REGIONS)"
-            
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
-            
-            if not results:
-                print("\n✗ No regions found in the database.")
-                print("="*80)
+            choice = int(input(f"\nEnter your choice (1-{len(specs) + 1}): ").strip())
+        except ValueError:
+            print("✗ Please enter a valid number!")
+            return
+        if choice == len(specs) + 1:
+            return
+        if not 1 <= choice <= len(specs):
+            print("✗ Invalid choice!")
+            return
+        spec = specs[choice - 1]
+        
+        params = ()
+        self.scatter_gather_limit = None
+        if spec['prompt']:
+            prompt, to_params = spec['prompt']
+            value = input(f"\n{prompt}").strip()
+            if not value:
+                print("✗ Value cannot be empty.")
                 return
-            
-            # Display results
-            print("\nMost Dangerous Region(s):")
-            print("-"*80)
-            print(f"{'Region ID':<15}{'Region Name':<30}{'Threat Level':<15}")
-            print("-"*80)
-            
-            for row in results:
-                region_id = row['Region_Id']
-                region_name = row['Region_Name'][:29]
-                threat_level = row['Threat_To_Intruders']
-                print(f"{region_id:<15}{region_name:<30}{threat_level:<15}")
-            
-            print("-"*80)
-            
-            if len(results) > 1:
-                print(f"\nNote: {len(results)} regions share the highest threat level.")
-            
-            print("\nInterpretation: Higher threat values indicate greater danger to intruders.")
-            print("="*80)
-            
-        except Error as e:
-            print(f"\n✗ Error finding most dangerous region: {e}")
-            print("="*80)
-
-    def retrieval_operations(self):
-        """Handle retrieval operations submenu"""
-        while True:
-            self.display_retrieval_operations_menu()
-            
-            try:
-                choice = input("\nEnter your choice (1-11): ").strip()
-                
-                if choice == '1':
-                    self.find_species_by_food_item()
-                elif choice == '2':
-                    self.search_invention_descriptions()
-                elif choice == '3':
-                    self.count_foodimals_by_species()
-                elif choice == '4':
-                    self.calculate_average_intruder_intelligence()
-                elif choice == '5':
-                    self.find_most_dangerous_region()
-                elif choice == '6':
-                    self.display_intruder_threat_profiles()
-                elif choice == '7':
-                    self.list_foodimal_species_recipes()
-                elif choice == '8':
-                    self.identify_high_threat_intruders()
-                elif choice == '9':
-                    self.find_foodimals_in_region()
-                elif choice == '10':
-                    self.list_inventions_against_species()
-                elif choice == '11':
-                    break
-                else:
-                    print("✗ Invalid choice! Please enter a number between 1 and 11.")
-                    
-            except ValueError:
-                print("✗ Please enter a valid number!")
-
-    def analysis_reports(self):
-        """Handle analysis reports submenu"""
-        while True:
-            self.display_analysis_reports_menu()
-            
             try:
-                choice = input("\nEnter your choice (1-4): ").strip()
-                
-                if choice == '1':
-                    self.intruder_threat_assessment()
-                elif choice == '2':
-                    self.foodimal_defensive_readiness()
-                elif choice == '3':
-                    self.combat_effectiveness_analysis()
-                elif choice == '4':
-                    break
-                else:
-                    print("✗ Invalid choice! Please enter a number between 1 and 4.")
-                    
+                params = to_params(value)
             except ValueError:
-                print("✗ Please enter a valid number!")
+                print("✗ Invalid value. Please enter a number.")
+                return
+            if 'LIMIT' in spec['query']:
+                self.scatter_gather_limit = params[0]
+        timeout = self.prompt_number("Shard timeout in seconds", 10.0)
+        if timeout is None:
+            return
+        
+        # A shard still running a timed-out query keeps its connection busy until it finishes
+        available = [(name, settings) for name, settings in shards if name not in self.busy_shards]
+        for name in sorted(set(name for name, _ in shards) - set(name for name, _ in available)):
+            print(f"  ⚠ Shard {name} is still busy with a previous query and is skipped.")
+        
+        print(f"\n{'Shard':<20}{'Status':<12}{'Rows':<10}{'Latency':<12}")
+        print("-"*60)
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, len(available)))
+        start = time.perf_counter()
+        futures = {}
+        for name, settings in available:
+            self.busy_shards.add(name)
+            future = executor.submit(self.query_shard, name, settings, spec['query'], params)
+            future.add_done_callback(lambda _, shard=name: self.busy_shards.discard(shard))
+            futures[future] = name
+        
+        partials = {}
+        pending = set(futures)
+        deadline = start + timeout
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.perf_counter()), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                name = futures[future]
+                latency = (time.perf_counter() - start) * 1000
+                try:
+                    partials[name] = future.result()
+                    print(f"{name:<20}{'ok':<12}{len(partials[name]):<10}{latency:>8.1f} ms")
+                except Exception as e:
+                    print(f"{name:<20}{'error':<12}{'-':<10}{latency:>8.1f} ms  ({e})")
+        for future in pending:
+            print(f"{futures[future]:<20}{'timeout':<12}{'-':<10}{'> ' + format(timeout, 'g') + ' s':>11}")
+        executor.shutdown(wait=False)
+        print("-"*60)
+        
+        merged = self.merge_shard_results(spec['merge'], partials)
+        
+        print("\n" + "="*80)
+        print(f"{spec['title'].upper()} (MERGED FROM {len(partials)} OF {len(shards)} SHARDS)")
+        print("="*80)
+        if not merged:
+            print("\n✗ No results found on any responding shard.")
+            print("="*80)
+            return
+        
+        print("\n" + "-"*80)
+        print(''.join(f"{header:<{width}}" for _, header, width in spec['columns']))
+        print("-"*80)
+        for row in merged:
+            cells = []
+            for col, _, width in spec['columns']:
+                value = row.get(col)
+                text = f"{value:.2f}" if isinstance(value, (float, Decimal)) else str(value if value is not None else 'NULL')
+                cells.append(f"{text[:width - 1]:<{width}}")
+            print(''.join(cells))
+        print("-"*80)
+        print(f"\nTotal rows: {len(merged)} | Wall time: {(time.perf_counter() - start) * 1000:.1f} ms")
+        if pending:
+            print(f"⚠ Partial result: {len(pending)} shard(s) did not answer within {timeout:g} s.")
+        print("="*80)
 
-    def run(self):
+    def run(self, startup_profile: bool = False):
         """Main application loop"""
+        imports_done = time.perf_counter() - STARTUP_START
+        
         print("\n" + "="*60)
         print("WELCOME TO MINI WORLD DATABASE CLI")
         print("="*60)
         
-        if not self.connect_to_database():
+        config_start = time.perf_counter()
+        settings = None if self.service_url else self.load_connection_config()
+        if not self.service_url:
+            self.load_routing_config()
+        self.load_timeout_config()
+        config_time = time.perf_counter() - config_start
+        
+        if self.service_url:
+            self.connection = ServiceConnection(self.service_url)
+            self.cursor = self.connection.cursor()
+            print(f"\n✓ Thin client of the query service at {self.service_url} (View, Retrieval and Analysis only)")
+        elif settings:
+            # Connect in the background so the menu appears immediately
+            self.start_background_connect(settings)
+        elif not self.connect_to_database(use_config=False):
             return
         
+        first_menu = True
         while True:
             self.display_menu()
             
+            if first_menu:
+                first_menu = False
+                if startup_profile:
+                    self.startup_profile = {'imports': imports_done, 'config': config_time,
+                                            'first_menu': time.perf_counter() - STARTUP_START}
+                    self.report_startup_profile()
+            
             try:
-                choice = input("\nEnter your choice (1-7): ").strip()
+                choice = input("\nEnter your choice (1-9): ").strip()
+                
+                if choice in ('1', '2', '3', '4', '5', '6', '7') and not self.ensure_connected():
+                    continue
+                if self.service_url and choice in ('1', '2', '3', '7', '8'):
+                    print("✗ Writes and shard reports need a direct database connection (not available via --service-url).")
+                    continue
                 
                 if choice == '1':
-                    self.insert_data()
+                    self.run_operation(self.insert_data)
+                    self.note_session_write()
                 elif choice == '2':
-                    self.update_data()
+                    self.run_operation(self.update_data)
+                    self.note_session_write()
                 elif choice == '3':
-                    self.delete_data()
+                    self.run_operation(self.delete_data)
+                    self.note_session_write()
                 elif choice == '4':
                     table = self.select_table()
                     if table:
-                        self.display_table_data(table)
+                        with self.read_route():
+                            self.run_operation(self.display_table_data, table)
                 elif choice == '5':
                     self.retrieval_operations()
                 elif choice == '6':
                     self.analysis_reports()
                 elif choice == '7':
+                    self.run_operation(self.insert_session)
+                    self.note_session_write()
+                elif choice == '8':
+                    self.run_operation(self.scatter_gather_reports)
+                elif choice == '9':
+                    if self.connect_thread is not None:
+                        # Close a background connection that finished after the menu appeared
+                        self.connect_thread.join()
+                        self.connection = self.connect_result.get('connection')
+                        self.cursor = self.connect_result.get('cursor')
                     print("\n✓ Closing database connection...")
                     if self.cursor:
                         self.cursor.close()
                     if self.connection:
                         self.connection.close()
+                    for shard_connection, _ in self.shard_connections.values():
+                        shard_connection.close()
+                    for replica in self.replicas:
+                        if replica['connection'] is not None:
+                            replica['connection'].close()
+                    if self.memprofile or self.metrics_file or any(stats.get('retries') or stats.get('timeouts') or stats.get('cancellations')
+                                                                   for stats in self.op_stats.values()):
+                        self.report_operation_stats()
                     print("✓ Thank you for using Mini World Database CLI!")
                     break
                 else:
-                    print("✗ Invalid choice! Please enter a number between 1 and 7.")
+                    print("✗ Invalid choice! Please enter a number between 1 and 9.")
                     
             except KeyboardInterrupt:
                 print("\n\n✓ Interrupted by user. Closing connection...")
@@ -1350,8 +5888,193 @@ class DatabaseCLI:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Mini World Database CLI")
+    parser.add_argument('--bulk-load', metavar='DATA_DIR',
+                        help="rebuild the database from schema.sql and DATA_DIR/<TABLE>.csv files, then exit")
+    parser.add_argument('--export-data', metavar='DATA_DIR',
+                        help="dump every table to DATA_DIR/<TABLE>.csv for --bulk-load, then exit")
+    parser.add_argument('--schema', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schema.sql'),
+                        help="schema file used by --bulk-load (default: schema.sql next to this script)")
+    parser.add_argument('--yes', action='store_true', help="do not ask before --bulk-load drops the database")
+    parser.add_argument('--workers', type=int, default=4, help="concurrent table loads for --bulk-load (default: 4)")
+    parser.add_argument('--batch-size', type=int, default=5000,
+                        help="rows per multi-row INSERT when LOAD DATA is unavailable (default: 5000)")
+    parser.add_argument('--bulk-update', nargs=2, metavar=('TABLE', 'CSV'),
+                        help="update TABLE rows matched by primary key from CSV (key columns plus new values), then exit")
+    parser.add_argument('--rollback-file', metavar='PATH',
+                        help="where --bulk-update writes the previous values (default: CSV name with .rollback.csv)")
+    parser.add_argument('--config', metavar='PATH',
+                        help="connection settings file with a [client] section (default: ~/.mini_world_db.cnf)")
+    parser.add_argument('--startup-profile', action='store_true',
+                        help="report time from start-up to the first menu")
+    parser.add_argument('--memprofile', action='store_true',
+                        help="trace memory per operation with tracemalloc and print peak/retained usage and top allocation sites")
+    parser.add_argument('--metrics-file', metavar='PATH',
+                        help="append per-operation timing and memory results to PATH as JSON lines")
+    parser.add_argument('--precompute', action='store_true',
+                        help="recompute the analysis reports into the report store every --interval seconds")
+    parser.add_argument('--interval', type=float, default=300,
+                        help="seconds between --precompute runs (default: 300)")
+    parser.add_argument('--once', action='store_true', help="with --precompute, run a single pass and exit (for cron)")
+    parser.add_argument('--report-store', metavar='DIR',
+                        help="directory of precomputed reports (default: ~/.mini_world_db_reports)")
+    parser.add_argument('--fresh', action='store_true', help="ignore precomputed reports and query live data")
+    parser.add_argument('--since', metavar='DATE', help="only include combat events at or after DATE (YYYY-MM-DD[ HH:MM:SS])")
+    parser.add_argument('--until', metavar='DATE', help="only include combat events before DATE")
+    parser.add_argument('--archive-before', metavar='DATE',
+                        help="drop COMBAT_EVENT/SUSPIOUS_ACTIVITIES partitions entirely before DATE, then exit")
+    parser.add_argument('--archive-dir', metavar='DIR', help="export archived partitions to DIR/<TABLE>_<PARTITION>.csv first")
+    parser.add_argument('--change-log-retention', type=float, metavar='SECONDS', default=86400,
+                        help="keep ROW_CHANGES entries this long; watch refreshes and --precompute prune older ones (default: 86400)")
+    parser.add_argument('--maintain-partitions', action='store_true',
+                        help="add COMBAT_EVENT/SUSPIOUS_ACTIVITIES partitions for the next three months, then exit")
+    parser.add_argument('--serve', metavar='[HOST:]PORT',
+                        help="run the JSON query service for retrieval and analysis reports on HOST:PORT (default host 127.0.0.1)")
+    parser.add_argument('--pool-size', type=int, default=8, help="pooled connections for --serve (default: 8)")
+    parser.add_argument('--cache-ttl', type=float, default=30, help="seconds --serve keeps query results cached (default: 30)")
+    parser.add_argument('--service-url', metavar='URL',
+                        help="run the interactive CLI as a thin client of a --serve service, e.g. http://127.0.0.1:8765")
+    parser.add_argument('--load-test', action='store_true',
+                        help="run concurrent virtual users mixing the CLI's reads and writes (modifies the database)")
+    parser.add_argument('--users', type=int, default=16, help="virtual users for --load-test (default: 16)")
+    parser.add_argument('--ramp', type=int, help="users added per --load-test step (default: all at once)")
+    parser.add_argument('--step-duration', type=float, default=30, help="seconds per --load-test step (default: 30)")
+    parser.add_argument('--mix', default='retrieval=50,report=20,insert=20,update=5,delete=5',
+                        help="--load-test weights per category: retrieval, report, insert, update, delete")
+    parser.add_argument('--query-timeout', type=float, metavar='SECONDS',
+                        help="statement time limit for every operation, overriding [timeouts] (0 for none)")
+    parser.add_argument('--plan-snapshot', metavar='FILE',
+                        help="store normalized EXPLAIN plans of every CLI query in FILE, then exit")
+    parser.add_argument('--plan-check', metavar='FILE',
+                        help="compare current EXPLAIN plans against FILE; exit non-zero if any plan degraded")
+    parser.add_argument('--no-procedures', action='store_true',
+                        help="always send inline SQL, even when procedures.sql is installed")
+    parser.add_argument('--benchmark-procedures', action='store_true',
+                        help="compare installed stored procedures against their inline SQL, then exit")
+    parser.add_argument('--iterations', type=int, default=20, help="calls per path for --benchmark-procedures (default: 20)")
+    args = parser.parse_args()
+    
     cli = DatabaseCLI()
-    cli.run()
+    if args.config:
+        cli.config_path = args.config
+    cli.metrics_file = args.metrics_file
+    cli.fresh_reports = args.fresh
+    cli.query_timeout_override = args.query_timeout
+    cli.use_procedures = not args.no_procedures
+    if args.change_log_retention < cli.SEQUENCE_GAP_TTL:
+        parser.error(f"--change-log-retention must be at least {cli.SEQUENCE_GAP_TTL} seconds, how long uncommitted change ids are waited for")
+    cli.row_change_retention = args.change_log_retention
+    try:
+        cli.report_since = cli.parse_report_time(args.since or '')
+        cli.report_until = cli.parse_report_time(args.until or '')
+        archive_before = cli.parse_report_time(args.archive_before or '')
+    except ValueError as e:
+        parser.error(f"invalid date: {e}")
+    if args.report_store:
+        cli.report_store_dir = args.report_store
+    if args.memprofile:
+        import tracemalloc
+        # Keep enough frames to attribute allocations to the connector or the report code
+        tracemalloc.start(25)
+        cli.memprofile = True
+    
+    if args.bulk_load:
+        print("\n" + "="*60)
+        print("DATABASE CONNECTION")
+        print("="*60)
+        cli.connection_settings = cli.load_connection_config() or cli.prompt_connection_settings()
+        sys.exit(0 if cli.bulk_load(args.bulk_load, args.schema, args.workers, args.batch_size, args.yes) else 1)
+    
+    if args.bulk_update:
+        if not cli.connect_to_database():
+            sys.exit(1)
+        try:
+            ok = cli.bulk_update(args.bulk_update[0], args.bulk_update[1], args.batch_size, args.rollback_file)
+        finally:
+            cli.connection.close()
+        sys.exit(0 if ok else 1)
+    
+    if args.export_data:
+        if not cli.connect_to_database():
+            sys.exit(1)
+        try:
+            cli.export_data(args.export_data)
+        except (Error, OSError) as e:
+            print(f"\n✗ Error exporting data: {e}")
+            sys.exit(1)
+        finally:
+            cli.connection.close()
+        return
+    
+    if args.serve:
+        host, _, port = args.serve.rpartition(':')
+        if not port.isdigit():
+            parser.error(f"invalid --serve address '{args.serve}'")
+        sys.exit(0 if cli.serve(host or '127.0.0.1', int(port), args.pool_size, args.cache_ttl) else 1)
+    
+    if args.load_test:
+        try:
+            mix = {category.strip(): float(weight) for category, weight in (item.split('=') for item in args.mix.split(','))}
+        except ValueError:
+            parser.error(f"invalid --mix '{args.mix}' (expected e.g. retrieval=50,insert=20)")
+        print("\n⚠ The load test inserts, updates and deletes rows. Run it against a disposable local database.")
+        if input("Continue? (yes/no): ").strip().lower() != 'yes':
+            return
+        if not cli.connect_to_database():
+            sys.exit(1)
+        try:
+            ok = cli.load_test(args.users, args.ramp or args.users, args.step_duration, mix)
+        finally:
+            cli.connection.close()
+        sys.exit(0 if ok else 1)
+    
+    if archive_before:
+        if not cli.connect_to_database():
+            sys.exit(1)
+        try:
+            ok = cli.archive_partitions(archive_before, args.archive_dir)
+        finally:
+            cli.connection.close()
+        sys.exit(0 if ok else 1)
+    
+    if args.maintain_partitions:
+        if not cli.connect_to_database():
+            sys.exit(1)
+        try:
+            ok = cli.maintain_partitions()
+        finally:
+            cli.connection.close()
+        sys.exit(0 if ok else 1)
+    
+    if args.precompute:
+        if not cli.connect_to_database():
+            sys.exit(1)
+        try:
+            ok = cli.precompute_reports(args.interval, args.once)
+        finally:
+            cli.connection.close()
+        sys.exit(0 if ok else 1)
+    
+    if args.plan_snapshot or args.plan_check:
+        if not cli.connect_to_database():
+            sys.exit(1)
+        try:
+            ok = cli.plan_snapshot(args.plan_check or args.plan_snapshot, check=bool(args.plan_check))
+        finally:
+            cli.connection.close()
+        sys.exit(0 if ok else 1)
+    
+    if args.benchmark_procedures:
+        if not cli.connect_to_database():
+            sys.exit(1)
+        try:
+            ok = cli.benchmark_procedures(max(args.iterations, 1))
+        finally:
+            cli.connection.close()
+        sys.exit(0 if ok else 1)
+    
+    cli.service_url = args.service_url
+    cli.run(startup_profile=args.startup_profile)
 
 
 if __name__ == "__main__":
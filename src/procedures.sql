@@ -0,0 +1,149 @@
+USE mini_world_db;
+
+-- Optional stored-procedure backend for the retrieval operations and analysis reports.
+-- The CLI uses a procedure when it is installed and otherwise sends the equivalent inline SQL,
+-- so each procedure must return the same columns as the query it replaces.
+-- Install with: mysql -u <user> -p < src/procedures.sql
+
+DELIMITER //
+
+DROP PROCEDURE IF EXISTS mw_species_by_food_item //
+CREATE PROCEDURE mw_species_by_food_item(IN p_pattern VARCHAR(100))
+    READS SQL DATA
+BEGIN
+    SELECT DISTINCT fs.Species_Id, fs.Species_Name, fi.Name AS Food_Item_Name
+    FROM FOODIMALS_SPECIES fs JOIN FOOD_ITEM fi ON fs.Species_Id = fi.Species_Id
+    WHERE fi.Name LIKE p_pattern
+    ORDER BY fs.Species_Name;
+END //
+
+DROP PROCEDURE IF EXISTS mw_search_invention_descriptions //
+CREATE PROCEDURE mw_search_invention_descriptions(IN p_pattern VARCHAR(255))
+    READS SQL DATA
+BEGIN
+    SELECT inv.Item_Owner, inv.Item_Name, d.Description, i.Name AS Owner_Name
+    FROM INVENTIONS inv
+    JOIN DESCRIPTIONS d ON inv.Item_Owner = d.Item_Owner_Id AND inv.Item_Name = d.Item_Name
+    JOIN INTRUDERS i ON inv.Item_Owner = i.User_Id
+    WHERE LOWER(d.Description) LIKE LOWER(p_pattern)
+    ORDER BY inv.Item_Name;
+END //
+
+DROP PROCEDURE IF EXISTS mw_count_foodimals_by_species //
+CREATE PROCEDURE mw_count_foodimals_by_species(IN p_species_id INT)
+    READS SQL DATA
+BEGIN
+    SELECT COUNT(*) AS Total_Count FROM INDIVIDUAL_FOODIMAL_CREATURES WHERE Species_Id = p_species_id;
+END //
+
+DROP PROCEDURE IF EXISTS mw_colony_intelligence //
+CREATE PROCEDURE mw_colony_intelligence(IN p_colony_id INT)
+    READS SQL DATA
+BEGIN
+    SELECT AVG(i.Intelligence) AS Average_Intelligence, COUNT(DISTINCT i.User_Id) AS Total_Intruders
+    FROM SUSPIOUS_ACTIVITIES sa JOIN INTRUDERS i ON sa.Intruder_Id = i.User_Id
+    WHERE sa.Colony_Id = p_colony_id;
+END //
+
+DROP PROCEDURE IF EXISTS mw_most_dangerous_region //
+CREATE PROCEDURE mw_most_dangerous_region()
+    READS SQL DATA
+BEGIN
+    SELECT Region_Id, Region_Name, Threat_To_Intruders
+    FROM ISLAND_REGIONS
+    WHERE Threat_To_Intruders = (SELECT MAX(Threat_To_Intruders) FROM ISLAND_REGIONS);
+END //
+
+DROP PROCEDURE IF EXISTS mw_intruder_threat_profiles //
+CREATE PROCEDURE mw_intruder_threat_profiles()
+    READS SQL DATA
+BEGIN
+    SELECT Name, Intelligence, (Intelligence * Intelligence + Height - Weight / Height) AS Threat_Status
+    FROM INTRUDERS
+    ORDER BY Threat_Status DESC;
+END //
+
+DROP PROCEDURE IF EXISTS mw_high_threat_intruders //
+CREATE PROCEDURE mw_high_threat_intruders(IN p_threshold DOUBLE)
+    READS SQL DATA
+BEGIN
+    SELECT User_Id, Name, Gender, Height, Weight, Intelligence, Time_Of_Entry, Location_Id,
+           (Intelligence * Intelligence + Height - Weight / Height) AS Threat_Status
+    FROM INTRUDERS
+    HAVING Threat_Status > p_threshold
+    ORDER BY Threat_Status DESC;
+END //
+
+-- Creatures in a region, then the species distribution the inline path computes on the client
+DROP PROCEDURE IF EXISTS mw_region_foodimals //
+CREATE PROCEDURE mw_region_foodimals(IN p_region_id INT)
+    READS SQL DATA
+BEGIN
+    SELECT ifc.Creature_Id, ifc.Species_Id, fs.Species_Name, ifc.Populatory_Species_Id
+    FROM INDIVIDUAL_FOODIMAL_CREATURES ifc JOIN FOODIMALS_SPECIES fs ON ifc.Species_Id = fs.Species_Id
+    WHERE ifc.Location_Id = p_region_id
+    ORDER BY fs.Species_Name, ifc.Creature_Id;
+
+    SELECT fs.Species_Name, COUNT(*) AS Count
+    FROM INDIVIDUAL_FOODIMAL_CREATURES ifc JOIN FOODIMALS_SPECIES fs ON ifc.Species_Id = fs.Species_Id
+    WHERE ifc.Location_Id = p_region_id
+    GROUP BY fs.Species_Id, fs.Species_Name
+    ORDER BY Count DESC, fs.Species_Name;
+END //
+
+DROP PROCEDURE IF EXISTS mw_species_inventions //
+CREATE PROCEDURE mw_species_inventions(IN p_species_id INT)
+    READS SQL DATA
+BEGIN
+    SELECT inv.Item_Name, inv.Item_Owner, i.Name AS Owner_Name
+    FROM WEAKNESS w
+    JOIN INVENTIONS inv ON w.Item_Inventor_Id = inv.Item_Owner AND w.Item_Name = inv.Item_Name
+    JOIN INTRUDERS i ON inv.Item_Owner = i.User_Id
+    WHERE w.Species_Id = p_species_id
+    ORDER BY inv.Item_Name;
+END //
+
+DROP PROCEDURE IF EXISTS mw_intruder_threat_assessment //
+CREATE PROCEDURE mw_intruder_threat_assessment()
+    READS SQL DATA
+BEGIN
+    SELECT i.User_Id, i.Name, i.Gender, i.Height, i.Weight, i.Intelligence, i.Time_Of_Entry, r.Region_Name, r.Region_Id,
+           (i.Intelligence * i.Intelligence + i.Height - i.Weight / i.Height) AS Threat_Level
+    FROM INTRUDERS i JOIN ISLAND_REGIONS r ON i.Location_Id = r.Region_Id
+    ORDER BY Threat_Level DESC;
+END //
+
+DROP PROCEDURE IF EXISTS mw_foodimal_defensive_readiness //
+CREATE PROCEDURE mw_foodimal_defensive_readiness()
+    READS SQL DATA
+BEGIN
+    SELECT r.Region_Name, r.Region_Id, fs.Species_Name, fs.Species_Id, COUNT(ifc.Creature_Id) AS Number_of_Units
+    FROM INDIVIDUAL_FOODIMAL_CREATURES ifc
+    JOIN FOODIMALS_SPECIES fs ON ifc.Species_Id = fs.Species_Id
+    JOIN ISLAND_REGIONS r ON ifc.Location_Id = r.Region_Id
+    GROUP BY r.Region_Name, r.Region_Id, fs.Species_Name, fs.Species_Id
+    ORDER BY r.Region_Name, Number_of_Units DESC;
+END //
+
+-- Usage per intruder and invention, then the top 5 inventions the inline path totals on the client
+DROP PROCEDURE IF EXISTS mw_combat_effectiveness_analysis //
+CREATE PROCEDURE mw_combat_effectiveness_analysis()
+    READS SQL DATA
+BEGIN
+    SELECT i.Name AS Intruder_Name, i.User_Id, inv.Item_Name AS Invention_Used, inv.Item_Owner, COUNT(*) AS Frequency_of_Use
+    FROM COMBAT_EVENT ce
+    JOIN INTRUDERS i ON ce.Intruder_Id = i.User_Id
+    JOIN INVENTIONS inv ON ce.Item_Owner_Id = inv.Item_Owner AND ce.Item_Name = inv.Item_Name
+    GROUP BY i.Name, i.User_Id, inv.Item_Name, inv.Item_Owner
+    ORDER BY Frequency_of_Use DESC;
+
+    SELECT inv.Item_Name AS Invention_Used, inv.Item_Owner, COUNT(*) AS Total_Uses
+    FROM COMBAT_EVENT ce
+    JOIN INTRUDERS i ON ce.Intruder_Id = i.User_Id
+    JOIN INVENTIONS inv ON ce.Item_Owner_Id = inv.Item_Owner AND ce.Item_Name = inv.Item_Name
+    GROUP BY inv.Item_Name, inv.Item_Owner
+    ORDER BY Total_Uses DESC
+    LIMIT 5;
+END //
+
+DELIMITER ;
@@ -20,7 +20,8 @@ CREATE TABLE MODERATORS (
 
 CREATE TABLE FOODIMALS_SPECIES(
     Species_Id INT AUTO_INCREMENT PRIMARY KEY,
-    Species_Name VARCHAR(30) NOT NULL
+    Species_Name VARCHAR(30) NOT NULL,
+    INDEX (Species_Name)
 );
 
 CREATE TABLE INDIVIDUAL_FOODIMAL_CREATURES(
@@ -78,10 +79,19 @@ CREATE TABLE SUSPIOUS_ACTIVITIES (
     Creature_Id INT NOT NULL,
     Colony_Id INT NOT NULL,
     Cell_Id INT NOT NULL,
-    FOREIGN KEY (Intruder_Id) REFERENCES INTRUDERS(User_Id) ON UPDATE CASCADE ON DELETE CASCADE,
-    FOREIGN KEY (Creature_Id) REFERENCES INDIVIDUAL_FOODIMAL_CREATURES(Creature_Id) ON UPDATE CASCADE ON DELETE CASCADE,
-    FOREIGN KEY (Cell_Id, Colony_Id) REFERENCES LIVECORP_CELLS(Cell_Id, Colony_Id) ON UPDATE CASCADE ON DELETE CASCADE,
-    PRIMARY KEY (Intruder_Id, Creature_Id, Colony_Id, Cell_Id)
+    Event_Time DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    -- Partitioned tables cannot have foreign keys; triggers below enforce Intruder_Id -> INTRUDERS,
+    -- Creature_Id -> INDIVIDUAL_FOODIMAL_CREATURES and (Cell_Id, Colony_Id) -> LIVECORP_CELLS
+    -- One row per event: the same combination may recur at another time (unique keys must contain Event_Time anyway)
+    PRIMARY KEY (Intruder_Id, Creature_Id, Colony_Id, Cell_Id, Event_Time),
+    INDEX (Colony_Id, Intruder_Id),
+    -- Indexes the foreign keys would have created, used by the cascade triggers
+    INDEX (Creature_Id),
+    INDEX (Cell_Id, Colony_Id)
+)
+-- Monthly partitions are split off p_future by add_monthly_partitions below, relative to the current date
+PARTITION BY RANGE (TO_DAYS(Event_Time)) (
+    PARTITION p_future VALUES LESS THAN MAXVALUE
 );
 
 CREATE TABLE COMBAT_EVENT(
@@ -90,11 +100,24 @@ CREATE TABLE COMBAT_EVENT(
     Item_Owner_Id INT NOT NULL,
     Region_Id INT NOT NULL,
     Item_Name VARCHAR(30) NOT NULL,
-    FOREIGN KEY (Intruder_Id) REFERENCES INTRUDERS(User_Id) ON UPDATE CASCADE ON DELETE CASCADE,
-    FOREIGN KEY (Creature_Id) REFERENCES INDIVIDUAL_FOODIMAL_CREATURES(Creature_Id) ON UPDATE CASCADE ON DELETE CASCADE,
-    FOREIGN KEY (Item_Owner_Id, Item_Name) REFERENCES INVENTIONS(Item_Owner, Item_Name) ON UPDATE CASCADE ON DELETE CASCADE,
-    FOREIGN KEY (Region_Id) REFERENCES ISLAND_REGIONS(Region_Id) ON UPDATE CASCADE ON DELETE CASCADE,
-    PRIMARY KEY (Intruder_Id, Creature_Id, Item_Owner_Id, Item_Name)
+    Event_Time DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    -- Arrival order for the CLI's combat cube refreshes; Event_Time can be back-dated
+    Event_Seq BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+    -- Partitioned tables cannot have foreign keys; triggers below enforce Intruder_Id -> INTRUDERS,
+    -- Creature_Id -> INDIVIDUAL_FOODIMAL_CREATURES, (Item_Owner_Id, Item_Name) -> INVENTIONS
+    -- and Region_Id -> ISLAND_REGIONS
+    -- One row per event, as for SUSPIOUS_ACTIVITIES
+    PRIMARY KEY (Intruder_Id, Creature_Id, Item_Owner_Id, Item_Name, Event_Time),
+    -- Indexes the foreign keys would have created, used by the cascade triggers
+    INDEX (Creature_Id),
+    INDEX (Item_Owner_Id, Item_Name),
+    INDEX (Region_Id),
+    -- Not unique: every unique key of a partitioned table must contain Event_Time
+    INDEX (Event_Seq)
+)
+-- Monthly partitions are split off p_future by add_monthly_partitions below, relative to the current date
+PARTITION BY RANGE (TO_DAYS(Event_Time)) (
+    PARTITION p_future VALUES LESS THAN MAXVALUE
 );
 
 CREATE TABLE CREATES(
@@ -140,3 +163,270 @@ ALTER TABLE INTRUDERS ADD FOREIGN KEY (Location_Id) REFERENCES ISLAND_REGIONS(Re
 ALTER TABLE INDIVIDUAL_FOODIMAL_CREATURES ADD FOREIGN KEY (Populatory_Species_Id) REFERENCES POPULATORY_SPECIES(Species_Id) ON UPDATE CASCADE ON DELETE CASCADE;
 ALTER TABLE INDIVIDUAL_FOODIMAL_CREATURES ADD FOREIGN KEY (Location_Id) REFERENCES ISLAND_REGIONS(Region_Id) ON UPDATE CASCADE ON DELETE CASCADE;
 
+-- Referential integrity for the partitioned event tables, which cannot have foreign keys. Inserts and key
+-- updates are checked against the parent rows, and parent deletes and key updates are carried into the
+-- event rows. Cascaded FK actions do not fire triggers, so each parent trigger also covers the rows its
+-- own ON DELETE/UPDATE CASCADE children remove (for example the intruders of a deleted region).
+DELIMITER //
+
+CREATE PROCEDURE check_suspious_activity_parents(IN p_intruder INT, IN p_creature INT, IN p_colony INT, IN p_cell INT)
+    READS SQL DATA
+BEGIN
+    DECLARE v_found INT;
+    -- Shared locks keep the parents from being deleted before this transaction commits, as a foreign key would
+    SELECT COUNT(*) INTO v_found FROM INTRUDERS WHERE User_Id = p_intruder LOCK IN SHARE MODE;
+    IF v_found = 0 THEN
+        SIGNAL SQLSTATE '23000' SET MYSQL_ERRNO = 1452, MESSAGE_TEXT = 'Cannot add or update a child row: SUSPIOUS_ACTIVITIES.Intruder_Id has no INTRUDERS row';
+    END IF;
+    SELECT COUNT(*) INTO v_found FROM INDIVIDUAL_FOODIMAL_CREATURES WHERE Creature_Id = p_creature LOCK IN SHARE MODE;
+    IF v_found = 0 THEN
+        SIGNAL SQLSTATE '23000' SET MYSQL_ERRNO = 1452, MESSAGE_TEXT = 'Cannot add or update a child row: SUSPIOUS_ACTIVITIES.Creature_Id has no INDIVIDUAL_FOODIMAL_CREATURES row';
+    END IF;
+    SELECT COUNT(*) INTO v_found FROM LIVECORP_CELLS WHERE Cell_Id = p_cell AND Colony_Id = p_colony LOCK IN SHARE MODE;
+    IF v_found = 0 THEN
+        SIGNAL SQLSTATE '23000' SET MYSQL_ERRNO = 1452, MESSAGE_TEXT = 'Cannot add or update a child row: SUSPIOUS_ACTIVITIES.(Cell_Id, Colony_Id) has no LIVECORP_CELLS row';
+    END IF;
+END //
+
+CREATE PROCEDURE check_combat_event_parents(IN p_intruder INT, IN p_creature INT, IN p_owner INT, IN p_item VARCHAR(30), IN p_region INT)
+    READS SQL DATA
+BEGIN
+    DECLARE v_found INT;
+    SELECT COUNT(*) INTO v_found FROM INTRUDERS WHERE User_Id = p_intruder LOCK IN SHARE MODE;
+    IF v_found = 0 THEN
+        SIGNAL SQLSTATE '23000' SET MYSQL_ERRNO = 1452, MESSAGE_TEXT = 'Cannot add or update a child row: COMBAT_EVENT.Intruder_Id has no INTRUDERS row';
+    END IF;
+    SELECT COUNT(*) INTO v_found FROM INDIVIDUAL_FOODIMAL_CREATURES WHERE Creature_Id = p_creature LOCK IN SHARE MODE;
+    IF v_found = 0 THEN
+        SIGNAL SQLSTATE '23000' SET MYSQL_ERRNO = 1452, MESSAGE_TEXT = 'Cannot add or update a child row: COMBAT_EVENT.Creature_Id has no INDIVIDUAL_FOODIMAL_CREATURES row';
+    END IF;
+    SELECT COUNT(*) INTO v_found FROM INVENTIONS WHERE Item_Owner = p_owner AND Item_Name = p_item LOCK IN SHARE MODE;
+    IF v_found = 0 THEN
+        SIGNAL SQLSTATE '23000' SET MYSQL_ERRNO = 1452, MESSAGE_TEXT = 'Cannot add or update a child row: COMBAT_EVENT.(Item_Owner_Id, Item_Name) has no INVENTIONS row';
+    END IF;
+    SELECT COUNT(*) INTO v_found FROM ISLAND_REGIONS WHERE Region_Id = p_region LOCK IN SHARE MODE;
+    IF v_found = 0 THEN
+        SIGNAL SQLSTATE '23000' SET MYSQL_ERRNO = 1452, MESSAGE_TEXT = 'Cannot add or update a child row: COMBAT_EVENT.Region_Id has no ISLAND_REGIONS row';
+    END IF;
+END //
+
+CREATE TRIGGER SUSPIOUS_ACTIVITIES_CHECK_INSERT BEFORE INSERT ON SUSPIOUS_ACTIVITIES FOR EACH ROW
+    CALL check_suspious_activity_parents(NEW.Intruder_Id, NEW.Creature_Id, NEW.Colony_Id, NEW.Cell_Id) //
+
+CREATE TRIGGER SUSPIOUS_ACTIVITIES_CHECK_UPDATE BEFORE UPDATE ON SUSPIOUS_ACTIVITIES FOR EACH ROW
+BEGIN
+    IF NOT (NEW.Intruder_Id <=> OLD.Intruder_Id AND NEW.Creature_Id <=> OLD.Creature_Id
+            AND NEW.Colony_Id <=> OLD.Colony_Id AND NEW.Cell_Id <=> OLD.Cell_Id) THEN
+        CALL check_suspious_activity_parents(NEW.Intruder_Id, NEW.Creature_Id, NEW.Colony_Id, NEW.Cell_Id);
+    END IF;
+END //
+
+CREATE TRIGGER COMBAT_EVENT_CHECK_INSERT BEFORE INSERT ON COMBAT_EVENT FOR EACH ROW
+    CALL check_combat_event_parents(NEW.Intruder_Id, NEW.Creature_Id, NEW.Item_Owner_Id, NEW.Item_Name, NEW.Region_Id) //
+
+CREATE TRIGGER COMBAT_EVENT_CHECK_UPDATE BEFORE UPDATE ON COMBAT_EVENT FOR EACH ROW
+BEGIN
+    IF NOT (NEW.Intruder_Id <=> OLD.Intruder_Id AND NEW.Creature_Id <=> OLD.Creature_Id AND NEW.Item_Owner_Id <=> OLD.Item_Owner_Id
+            AND NEW.Item_Name <=> OLD.Item_Name AND NEW.Region_Id <=> OLD.Region_Id) THEN
+        CALL check_combat_event_parents(NEW.Intruder_Id, NEW.Creature_Id, NEW.Item_Owner_Id, NEW.Item_Name, NEW.Region_Id);
+    END IF;
+END //
+
+-- Deletes run BEFORE the parent row goes, while the rows its cascade will remove can still be joined
+CREATE TRIGGER INTRUDERS_EVENTS_DELETE BEFORE DELETE ON INTRUDERS FOR EACH ROW
+BEGIN
+    DELETE FROM SUSPIOUS_ACTIVITIES WHERE Intruder_Id = OLD.User_Id;
+    -- Item_Owner_Id: the intruder's inventions are removed by cascade
+    DELETE FROM COMBAT_EVENT WHERE Intruder_Id = OLD.User_Id;
+    DELETE FROM COMBAT_EVENT WHERE Item_Owner_Id = OLD.User_Id;
+END //
+
+CREATE TRIGGER CREATURES_EVENTS_DELETE BEFORE DELETE ON INDIVIDUAL_FOODIMAL_CREATURES FOR EACH ROW
+BEGIN
+    DELETE FROM SUSPIOUS_ACTIVITIES WHERE Creature_Id = OLD.Creature_Id;
+    DELETE FROM COMBAT_EVENT WHERE Creature_Id = OLD.Creature_Id;
+END //
+
+CREATE TRIGGER INVENTIONS_EVENTS_DELETE BEFORE DELETE ON INVENTIONS FOR EACH ROW
+    DELETE FROM COMBAT_EVENT WHERE Item_Owner_Id = OLD.Item_Owner AND Item_Name = OLD.Item_Name //
+
+CREATE TRIGGER CELLS_EVENTS_DELETE BEFORE DELETE ON LIVECORP_CELLS FOR EACH ROW
+    DELETE FROM SUSPIOUS_ACTIVITIES WHERE Cell_Id = OLD.Cell_Id AND Colony_Id = OLD.Colony_Id //
+
+CREATE TRIGGER COLONY_EVENTS_DELETE BEFORE DELETE ON LIVECORP_COLONY FOR EACH ROW
+    DELETE FROM SUSPIOUS_ACTIVITIES WHERE Colony_Id = OLD.Colony_Id //
+
+CREATE TRIGGER REGIONS_EVENTS_DELETE BEFORE DELETE ON ISLAND_REGIONS FOR EACH ROW
+BEGIN
+    -- The region's intruders (and their inventions), creatures and colonies are removed by cascade
+    DELETE FROM COMBAT_EVENT WHERE Region_Id = OLD.Region_Id;
+    DELETE ce FROM COMBAT_EVENT ce JOIN INTRUDERS i ON ce.Intruder_Id = i.User_Id WHERE i.Location_Id = OLD.Region_Id;
+    DELETE ce FROM COMBAT_EVENT ce JOIN INTRUDERS i ON ce.Item_Owner_Id = i.User_Id WHERE i.Location_Id = OLD.Region_Id;
+    DELETE ce FROM COMBAT_EVENT ce JOIN INDIVIDUAL_FOODIMAL_CREATURES c ON ce.Creature_Id = c.Creature_Id WHERE c.Location_Id = OLD.Region_Id;
+    DELETE sa FROM SUSPIOUS_ACTIVITIES sa JOIN INTRUDERS i ON sa.Intruder_Id = i.User_Id WHERE i.Location_Id = OLD.Region_Id;
+    DELETE sa FROM SUSPIOUS_ACTIVITIES sa JOIN INDIVIDUAL_FOODIMAL_CREATURES c ON sa.Creature_Id = c.Creature_Id WHERE c.Location_Id = OLD.Region_Id;
+    DELETE sa FROM SUSPIOUS_ACTIVITIES sa JOIN LIVECORP_COLONY lc ON sa.Colony_Id = lc.Colony_Id WHERE lc.Region_Id = OLD.Region_Id;
+END //
+
+CREATE TRIGGER FOODIMALS_SPECIES_EVENTS_DELETE BEFORE DELETE ON FOODIMALS_SPECIES FOR EACH ROW
+BEGIN
+    -- Creatures of the species, and of its populatory species row, are removed by cascade
+    DELETE ce FROM COMBAT_EVENT ce JOIN INDIVIDUAL_FOODIMAL_CREATURES c ON ce.Creature_Id = c.Creature_Id
+        WHERE c.Species_Id = OLD.Species_Id OR c.Populatory_Species_Id = OLD.Species_Id;
+    DELETE sa FROM SUSPIOUS_ACTIVITIES sa JOIN INDIVIDUAL_FOODIMAL_CREATURES c ON sa.Creature_Id = c.Creature_Id
+        WHERE c.Species_Id = OLD.Species_Id OR c.Populatory_Species_Id = OLD.Species_Id;
+END //
+
+CREATE TRIGGER POPULATORY_SPECIES_EVENTS_DELETE BEFORE DELETE ON POPULATORY_SPECIES FOR EACH ROW
+BEGIN
+    DELETE ce FROM COMBAT_EVENT ce JOIN INDIVIDUAL_FOODIMAL_CREATURES c ON ce.Creature_Id = c.Creature_Id WHERE c.Populatory_Species_Id = OLD.Species_Id;
+    DELETE sa FROM SUSPIOUS_ACTIVITIES sa JOIN INDIVIDUAL_FOODIMAL_CREATURES c ON sa.Creature_Id = c.Creature_Id WHERE c.Populatory_Species_Id = OLD.Species_Id;
+END //
+
+-- Key updates run AFTER the parent row (and its cascaded children) carry the new key, so the checks above pass
+CREATE TRIGGER INTRUDERS_EVENTS_UPDATE AFTER UPDATE ON INTRUDERS FOR EACH ROW
+BEGIN
+    IF NEW.User_Id <> OLD.User_Id THEN
+        UPDATE SUSPIOUS_ACTIVITIES SET Intruder_Id = NEW.User_Id WHERE Intruder_Id = OLD.User_Id;
+        -- One statement for both columns: the intruder's inventions already carry the new owner id
+        UPDATE COMBAT_EVENT SET Intruder_Id = IF(Intruder_Id = OLD.User_Id, NEW.User_Id, Intruder_Id),
+                                Item_Owner_Id = IF(Item_Owner_Id = OLD.User_Id, NEW.User_Id, Item_Owner_Id)
+            WHERE Intruder_Id = OLD.User_Id OR Item_Owner_Id = OLD.User_Id;
+    END IF;
+END //
+
+CREATE TRIGGER CREATURES_EVENTS_UPDATE AFTER UPDATE ON INDIVIDUAL_FOODIMAL_CREATURES FOR EACH ROW
+BEGIN
+    IF NEW.Creature_Id <> OLD.Creature_Id THEN
+        UPDATE SUSPIOUS_ACTIVITIES SET Creature_Id = NEW.Creature_Id WHERE Creature_Id = OLD.Creature_Id;
+        UPDATE COMBAT_EVENT SET Creature_Id = NEW.Creature_Id WHERE Creature_Id = OLD.Creature_Id;
+    END IF;
+END //
+
+CREATE TRIGGER INVENTIONS_EVENTS_UPDATE AFTER UPDATE ON INVENTIONS FOR EACH ROW
+BEGIN
+    IF NOT (NEW.Item_Owner <=> OLD.Item_Owner AND NEW.Item_Name <=> OLD.Item_Name) THEN
+        UPDATE COMBAT_EVENT SET Item_Owner_Id = NEW.Item_Owner, Item_Name = NEW.Item_Name
+            WHERE Item_Owner_Id = OLD.Item_Owner AND Item_Name = OLD.Item_Name;
+    END IF;
+END //
+
+CREATE TRIGGER REGIONS_EVENTS_UPDATE AFTER UPDATE ON ISLAND_REGIONS FOR EACH ROW
+BEGIN
+    IF NEW.Region_Id <> OLD.Region_Id THEN
+        UPDATE COMBAT_EVENT SET Region_Id = NEW.Region_Id WHERE Region_Id = OLD.Region_Id;
+    END IF;
+END //
+
+CREATE TRIGGER COLONY_EVENTS_UPDATE AFTER UPDATE ON LIVECORP_COLONY FOR EACH ROW
+BEGIN
+    IF NEW.Colony_Id <> OLD.Colony_Id THEN
+        UPDATE SUSPIOUS_ACTIVITIES SET Colony_Id = NEW.Colony_Id WHERE Colony_Id = OLD.Colony_Id;
+    END IF;
+END //
+
+CREATE TRIGGER CELLS_EVENTS_UPDATE AFTER UPDATE ON LIVECORP_CELLS FOR EACH ROW
+BEGIN
+    IF NOT (NEW.Cell_Id <=> OLD.Cell_Id AND NEW.Colony_Id <=> OLD.Colony_Id) THEN
+        UPDATE SUSPIOUS_ACTIVITIES SET Cell_Id = NEW.Cell_Id, Colony_Id = NEW.Colony_Id
+            WHERE Cell_Id = OLD.Cell_Id AND Colony_Id = OLD.Colony_Id;
+    END IF;
+END //
+
+DELIMITER ;
+
+-- Monthly event partitions relative to the current date. The first call adds p_history for everything before
+-- the current month; later calls (the CLI's --maintain-partitions, --precompute, --archive-before and
+-- --bulk-load) continue from the last bound, so running it monthly keeps p_future empty.
+DELIMITER //
+
+CREATE PROCEDURE add_monthly_partitions(IN p_table VARCHAR(64), IN p_months_ahead INT)
+    MODIFIES SQL DATA
+BEGIN
+    DECLARE v_month DATE;
+    DECLARE v_horizon DATE;
+    DECLARE v_partitions TEXT DEFAULT '';
+    SET v_horizon = DATE_ADD(DATE_FORMAT(CURDATE(), '%Y-%m-01'), INTERVAL p_months_ahead MONTH);
+    SELECT FROM_DAYS(MAX(CAST(PARTITION_DESCRIPTION AS UNSIGNED))) INTO v_month
+        FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = p_table AND PARTITION_DESCRIPTION <> 'MAXVALUE';
+    IF v_month IS NULL THEN
+        SET v_month = DATE_FORMAT(CURDATE(), '%Y-%m-01');
+        SET v_partitions = CONCAT('PARTITION p_history VALUES LESS THAN (TO_DAYS(''', v_month, ''')), ');
+    END IF;
+    WHILE v_month <= v_horizon DO
+        SET v_partitions = CONCAT(v_partitions, 'PARTITION p', DATE_FORMAT(v_month, '%Y%m'),
+                                  ' VALUES LESS THAN (TO_DAYS(''', DATE_ADD(v_month, INTERVAL 1 MONTH), ''')), ');
+        SET v_month = DATE_ADD(v_month, INTERVAL 1 MONTH);
+    END WHILE;
+    IF v_partitions <> '' THEN
+        SET @add_partitions = CONCAT('ALTER TABLE ', p_table, ' REORGANIZE PARTITION p_future INTO (',
+                                     v_partitions, 'PARTITION p_future VALUES LESS THAN MAXVALUE)');
+        PREPARE add_partitions FROM @add_partitions;
+        EXECUTE add_partitions;
+        DEALLOCATE PREPARE add_partitions;
+    END IF;
+END //
+
+DELIMITER ;
+
+CALL add_monthly_partitions('SUSPIOUS_ACTIVITIES', 3);
+CALL add_monthly_partitions('COMBAT_EVENT', 3);
+
+
+-- Change log for watch mode and the relationship graph: one row per changed intruder or creature, and per
+-- changed region, species, invention, weakness or combat event (cascaded FK updates/deletes do not fire
+-- triggers, so readers treat a change as a change to every dependent table). Tables without a single integer
+-- key log a NULL Row_Id. New combat events are not logged; readers follow COMBAT_EVENT.Event_Seq instead.
+CREATE TABLE ROW_CHANGES (
+    Change_Id BIGINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+    Table_Name VARCHAR(64) NOT NULL,
+    Row_Id INT,
+    Changed_At DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX (Changed_At)
+);
+
+CREATE TRIGGER INTRUDERS_LOG_INSERT AFTER INSERT ON INTRUDERS FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('INTRUDERS', NEW.User_Id);
+CREATE TRIGGER INTRUDERS_LOG_UPDATE AFTER UPDATE ON INTRUDERS FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('INTRUDERS', OLD.User_Id), ('INTRUDERS', NEW.User_Id);
+CREATE TRIGGER INTRUDERS_LOG_DELETE AFTER DELETE ON INTRUDERS FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('INTRUDERS', OLD.User_Id);
+CREATE TRIGGER CREATURES_LOG_INSERT AFTER INSERT ON INDIVIDUAL_FOODIMAL_CREATURES FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('INDIVIDUAL_FOODIMAL_CREATURES', NEW.Creature_Id);
+CREATE TRIGGER CREATURES_LOG_UPDATE AFTER UPDATE ON INDIVIDUAL_FOODIMAL_CREATURES FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('INDIVIDUAL_FOODIMAL_CREATURES', OLD.Creature_Id), ('INDIVIDUAL_FOODIMAL_CREATURES', NEW.Creature_Id);
+CREATE TRIGGER CREATURES_LOG_DELETE AFTER DELETE ON INDIVIDUAL_FOODIMAL_CREATURES FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('INDIVIDUAL_FOODIMAL_CREATURES', OLD.Creature_Id);
+CREATE TRIGGER REGIONS_LOG_INSERT AFTER INSERT ON ISLAND_REGIONS FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('ISLAND_REGIONS', NEW.Region_Id);
+CREATE TRIGGER REGIONS_LOG_UPDATE AFTER UPDATE ON ISLAND_REGIONS FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('ISLAND_REGIONS', NEW.Region_Id);
+CREATE TRIGGER REGIONS_LOG_DELETE AFTER DELETE ON ISLAND_REGIONS FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('ISLAND_REGIONS', OLD.Region_Id);
+CREATE TRIGGER FOODIMALS_SPECIES_LOG_INSERT AFTER INSERT ON FOODIMALS_SPECIES FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('FOODIMALS_SPECIES', NEW.Species_Id);
+CREATE TRIGGER FOODIMALS_SPECIES_LOG_UPDATE AFTER UPDATE ON FOODIMALS_SPECIES FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('FOODIMALS_SPECIES', NEW.Species_Id);
+CREATE TRIGGER FOODIMALS_SPECIES_LOG_DELETE AFTER DELETE ON FOODIMALS_SPECIES FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('FOODIMALS_SPECIES', OLD.Species_Id);
+CREATE TRIGGER POPULATORY_SPECIES_LOG_UPDATE AFTER UPDATE ON POPULATORY_SPECIES FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('POPULATORY_SPECIES', NEW.Species_Id);
+CREATE TRIGGER POPULATORY_SPECIES_LOG_DELETE AFTER DELETE ON POPULATORY_SPECIES FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name, Row_Id) VALUES ('POPULATORY_SPECIES', OLD.Species_Id);
+CREATE TRIGGER INVENTIONS_LOG_INSERT AFTER INSERT ON INVENTIONS FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name) VALUES ('INVENTIONS');
+CREATE TRIGGER INVENTIONS_LOG_UPDATE AFTER UPDATE ON INVENTIONS FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name) VALUES ('INVENTIONS');
+CREATE TRIGGER INVENTIONS_LOG_DELETE AFTER DELETE ON INVENTIONS FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name) VALUES ('INVENTIONS');
+CREATE TRIGGER WEAKNESS_LOG_INSERT AFTER INSERT ON WEAKNESS FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name) VALUES ('WEAKNESS');
+CREATE TRIGGER WEAKNESS_LOG_UPDATE AFTER UPDATE ON WEAKNESS FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name) VALUES ('WEAKNESS');
+CREATE TRIGGER WEAKNESS_LOG_DELETE AFTER DELETE ON WEAKNESS FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name) VALUES ('WEAKNESS');
+CREATE TRIGGER COMBAT_EVENT_LOG_UPDATE AFTER UPDATE ON COMBAT_EVENT FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name) VALUES ('COMBAT_EVENT');
+CREATE TRIGGER COMBAT_EVENT_LOG_DELETE AFTER DELETE ON COMBAT_EVENT FOR EACH ROW
+    INSERT INTO ROW_CHANGES (Table_Name) VALUES ('COMBAT_EVENT');
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# main_app.py is run as a script from src/, so make it importable for the tests
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'src'))
@@ -0,0 +1,118 @@
+"""Scatter-gather merges of per-shard partial results, checked against a single-database computation"""
+import random
+
+import pytest
+
+from main_app import DatabaseCLI
+
+
+@pytest.fixture
+def cli():
+    return DatabaseCLI()
+
+
+def test_union_deduplicates_rows_and_lists_their_shards(cli):
+    partials = {
+        'east': [{'Item_Name': 'Net', 'Owner_Name': 'Ada'}, {'Item_Name': 'Trap', 'Owner_Name': 'Bo'}],
+        'west': [{'Item_Name': 'Net', 'Owner_Name': 'Ada'}],
+    }
+    merged = cli.merge_shard_results(('union', ['Item_Name', 'Owner_Name']), partials)
+    assert merged == [{'Item_Name': 'Net', 'Owner_Name': 'Ada', 'Shards': 'east, west'},
+                      {'Item_Name': 'Trap', 'Owner_Name': 'Bo', 'Shards': 'east'}]
+
+
+def test_sum_adds_groups_across_shards_and_orders_by_total(cli):
+    partials = {
+        'east': [{'Species_Name': 'Boar', 'Count': 3}, {'Species_Name': 'Hare', 'Count': None}],
+        'west': [{'Species_Name': 'Hare', 'Count': 5}, {'Species_Name': 'Boar', 'Count': 1}],
+    }
+    merged = cli.merge_shard_results(('sum', ['Species_Name'], ['Count']), partials)
+    assert merged == [{'Species_Name': 'Hare', 'Count': 5}, {'Species_Name': 'Boar', 'Count': 4}]
+
+
+def test_avg_divides_the_summed_totals_not_the_shard_averages(cli):
+    partials = {
+        'east': [{'Scope': 'All', 'Intelligence_Sum': 10, 'Intruder_Count': 1}],
+        'west': [{'Scope': 'All', 'Intelligence_Sum': 30, 'Intruder_Count': 3}],
+        'north': [{'Scope': 'All', 'Intelligence_Sum': None, 'Intruder_Count': 0}],
+    }
+    merge = ('avg', ['Scope'], 'Intelligence_Sum', 'Intruder_Count', 'Average_Intelligence')
+    [row] = cli.merge_shard_results(merge, partials)
+    assert row['Average_Intelligence'] == '10.00'
+    assert (row['Intelligence_Sum'], row['Intruder_Count']) == (40, 4)
+
+
+def test_avg_of_an_empty_group_is_not_available(cli):
+    merge = ('avg', ['Scope'], 'Intelligence_Sum', 'Intruder_Count', 'Average_Intelligence')
+    [row] = cli.merge_shard_results(merge, {'east': [{'Scope': 'All', 'Intelligence_Sum': None, 'Intruder_Count': 0}]})
+    assert row['Average_Intelligence'] == 'N/A'
+
+
+def test_max_keeps_every_shard_row_tied_for_the_maximum(cli):
+    partials = {
+        'east': [{'Region_Name': 'Marsh', 'Threat_To_Intruders': 9}],
+        'west': [{'Region_Name': 'Cliffs', 'Threat_To_Intruders': 9}, {'Region_Name': 'Beach', 'Threat_To_Intruders': 2}],
+    }
+    merged = cli.merge_shard_results(('max', 'Threat_To_Intruders'), partials)
+    assert [(row['Region_Name'], row['Shard']) for row in merged] == [('Marsh', 'east'), ('Cliffs', 'west')]
+    assert cli.merge_shard_results(('max', 'Threat_To_Intruders'), {'east': []}) == []
+
+
+def test_topn_merges_sorted_shards_and_applies_the_limit(cli):
+    partials = {
+        'east': [{'Name': 'a', 'Threat_Status': 9.0}, {'Name': 'c', 'Threat_Status': 4.0}],
+        'west': [{'Name': 'b', 'Threat_Status': 7.5}, {'Name': 'd', 'Threat_Status': 1.0}],
+    }
+    merged = cli.merge_shard_results(('topn', 'Threat_Status'), partials)
+    assert [row['Name'] for row in merged] == ['a', 'b', 'c', 'd']
+    cli.scatter_gather_limit = 3
+    merged = cli.merge_shard_results(('topn', 'Threat_Status'), partials)
+    assert [(row['Name'], row['Shard']) for row in merged] == [('a', 'east'), ('b', 'west'), ('c', 'east')]
+
+
+def test_unknown_merge_kind_is_rejected(cli):
+    with pytest.raises(ValueError):
+        cli.merge_shard_results(('median',), {})
+
+
+def test_distribution_matches_a_single_database_run(cli):
+    rng = random.Random(35)
+    colonies = {colony: [rng.randint(50, 200) for _ in range(rng.randint(1, 40))] for colony in range(1, 6)}
+    
+    # Spread each colony's intruders over three shards as (value, count) histograms, as the shard queries return them
+    histograms = {'east': {}, 'west': {}, 'north': {}}
+    for colony, values in colonies.items():
+        for value in values:
+            histogram = histograms[rng.choice(list(histograms))]
+            histogram[(colony, value)] = histogram.get((colony, value), 0) + 1
+    partials = {shard: [{'Colony_Id': colony, 'Intelligence': value, 'Intruders': count} for (colony, value), count in histogram.items()]
+                for shard, histogram in histograms.items()}
+    merged = {row['Colony_Id']: row for row in cli.merge_shard_results(('distribution', ['Colony_Id'], 'Intelligence', 'Intruders'), partials)}
+    
+    for colony, values in colonies.items():
+        seen = sorted(float(value) for value in values)
+        row = merged[colony]
+        assert row['Intruders'] == len(seen)
+        assert row['Average'] == pytest.approx(sum(seen) / len(seen))
+        assert (row['Minimum'], row['Maximum']) == (seen[0], seen[-1])
+        assert row['Median'] == cli.percentile(seen, 0.5)
+        assert row['P90'] == cli.percentile(seen, 0.9)
+
+
+def test_distribution_ignores_null_values(cli):
+    partials = {'east': [{'Colony_Id': 1, 'Intelligence': None, 'Intruders': 2}]}
+    [row] = cli.merge_shard_results(('distribution', ['Colony_Id'], 'Intelligence', 'Intruders'), partials)
+    assert row['Intruders'] == 0
+    assert row['Average'] is None and row['Median'] is None
+
+
+def test_percentile_interpolates_between_neighbours(cli):
+    assert cli.percentile([], 0.5) is None
+    assert cli.percentile([7.0], 0.9) == 7.0
+    assert cli.percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.5
+    assert cli.percentile([10.0, 20.0, 30.0, 40.0, 50.0], 0.9) == pytest.approx(46.0)
+
+
+def test_build_adjacency_groups_targets_by_source(cli):
+    adjacency = cli.build_adjacency(3, [(2, 0), (0, 5), (0, 1), (2, 4)])
+    assert [list(cli.graph_neighbors(adjacency, idx)) for idx in range(3)] == [[1, 5], [], [0, 4]]